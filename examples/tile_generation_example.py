@@ -6,10 +6,15 @@ This example shows how to use the enhanced TileGenerator with comprehensive
 error handling, caching, progress tracking, and validation.
 """
 
+import hashlib
+import os
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
+
 # Add src to path for example
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -26,6 +31,71 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+# Sample river data
+_RIVERS_DATA = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "LineString",
+                "coordinates": [[-105.015, 39.742], [-105.012, 39.748]]
+            },
+            "properties": {
+                "waterway": "river",
+                "name": "Boulder Creek"
+            }
+        }
+    ]
+}
+
+# Sample road data
+_ROADS_DATA = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "LineString",
+                "coordinates": [[-105.018, 39.740], [-105.014, 39.745], [-105.010, 39.750]]
+            },
+            "properties": {
+                "highway": "primary",
+                "name": "Broadway"
+            }
+        }
+    ]
+}
+
+# Sample building data
+_BUILDINGS_DATA = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[-105.016, 39.744], [-105.015, 39.744], [-105.015, 39.745], [-105.016, 39.745], [-105.016, 39.744]]]
+            },
+            "properties": {
+                "building": "yes",
+                "name": "Sample Building"
+            }
+        }
+    ]
+}
+
+# Buffers per os.writev call; matches IOV_MAX on Linux and macOS
+_WRITEV_BATCH = 1024
+
+# Layer name -> FeatureCollection written by create_sample_geojson_files
+_SAMPLE_LAYERS = (
+    ("rivers", _RIVERS_DATA),
+    ("roads", _ROADS_DATA),
+    ("buildings", _BUILDINGS_DATA),
+)
+
+
 def main():
     """Demonstrate tile generation capabilities."""
     
@@ -57,7 +127,15 @@ def main():
     cache_manager = CacheManager(config.output.cache_dir, enabled=config.cache_enabled)
     tile_generator = TileGenerator(config, cache_manager)
     
-    # 3. Check tippecanoe availability
+    # 3. Reuse tiles from an earlier run with the same settings, skipping all IO
+    tiles_cache_key = example_tiles_cache_key(config)
+    cached_tiles = cache_manager.get_cached_tiles(tiles_cache_key)
+    if cached_tiles:
+        print(f"\n♻️  Using cached tiles: {cached_tiles}")
+        print_tile_info(tile_generator.get_tile_info(cached_tiles))
+        return 0
+    
+    # 4. Check tippecanoe availability
     print("\n🔧 System Check:")
     if tile_generator.validate_tippecanoe():
         print("✅ tippecanoe is available and ready")
@@ -66,14 +144,16 @@ def main():
         print("   brew install tippecanoe")
         return 1
     
-    # 4. Get processing information
+    # 5. Get processing information
     info = tile_generator.get_processing_info()
     print(f"💾 Available memory: {info['system']['available_memory_gb']} GB")
     print(f"🖥️  CPU cores: {info['system']['cpu_count']}")
     
-    # 5. Create sample GeoJSON files for demonstration
-    print("\n📁 Creating sample GeoJSON files...")
-    sample_files = create_sample_geojson_files(config.output.data_dir)
+    # 6. Create sample feature files for demonstration (FlatGeobuf unless --geojsonl)
+    print("\n📁 Creating sample feature files...")
+    sample_files = create_sample_geojson_files(
+        config.output.data_dir, fgb="--geojsonl" not in sys.argv
+    )
     
     if not sample_files:
         print("❌ No sample files created. In a real scenario, you would:")
@@ -82,7 +162,7 @@ def main():
         print("   3. Pass the extracted GeoJSON files to TileGenerator")
         return 1
     
-    # 6. Generate tiles with comprehensive error handling
+    # 7. Generate tiles with comprehensive error handling
     print(f"\n🏗️  Generating vector tiles from {len(sample_files)} feature files...")
     
     try:
@@ -90,28 +170,10 @@ def main():
         output_path = tile_generator.generate(sample_files)
         
         print(f"✅ Tiles generated successfully: {output_path}")
+        cache_manager.cache_tiles(tiles_cache_key, output_path)
         
-        # 7. Get detailed information about generated tiles
-        tile_info = tile_generator.get_tile_info(output_path)
-        
-        print("\n📊 Tile Generation Results:")
-        print(f"   📦 Total tiles: {tile_info['tile_count']:,}")
-        print(f"   🔍 Zoom range: {tile_info['zoom_range']['min']}-{tile_info['zoom_range']['max']}")
-        print(f"   📏 File size: {tile_info['file_info']['size_bytes']:,} bytes")
-        print(f"   📈 Average tile size: {tile_info['tile_sizes']['average_bytes']} bytes")
-        
-        # Show tiles per zoom level
-        print("   📋 Tiles per zoom level:")
-        for zoom, count in tile_info['tiles_per_zoom'].items():
-            print(f"      Zoom {zoom}: {count:,} tiles")
-        
-        # Processing statistics
-        if 'processing_stats' in tile_info:
-            stats = tile_info['processing_stats']
-            print(f"   ⏱️  Processing time: {stats.get('duration', 'N/A')}")
-            print(f"   💾 Peak memory: {stats.get('memory_peak_mb', 0):.1f}%")
-            if stats.get('retries', 0) > 0:
-                print(f"   🔄 Retries: {stats['retries']}")
+        # 8. Get detailed information about generated tiles
+        print_tile_info(tile_generator.get_tile_info(output_path))
         
         print(f"\n🎉 Success! Vector tiles are ready at: {output_path}")
         print("You can now use these tiles with MapLibre GL JS or other vector tile renderers.")
@@ -132,85 +194,116 @@ def main():
         tile_generator.cleanup_temp_files()
 
 
-def create_sample_geojson_files(data_dir: Path) -> dict:
-    """Create sample GeoJSON files for demonstration."""
-    import json
+def example_tiles_cache_key(config: TilecraftConfig) -> str:
+    """Build a tiles cache key from the settings that determine the output."""
+    bbox = config.bbox
+    key_parts = (
+        (bbox.west, bbox.south, bbox.east, bbox.north),
+        tuple(sorted(f.value for f in config.features.types)),
+        config.tiles.min_zoom,
+        config.tiles.max_zoom,
+        config.tiles.quality_profile,
+    )
+    return hashlib.md5(f"example_tiles_{key_parts}".encode()).hexdigest()
+
+
+def print_tile_info(tile_info: dict) -> None:
+    """Print a summary of an MBTiles file as returned by get_tile_info."""
+    print("\n📊 Tile Generation Results:")
+    print(f"   📦 Total tiles: {tile_info['tile_count']:,}")
+    print(f"   🔍 Zoom range: {tile_info['zoom_range']['min']}-{tile_info['zoom_range']['max']}")
+    print(f"   📏 File size: {tile_info['file_info']['size_bytes']:,} bytes")
+    print(f"   📈 Average tile size: {tile_info['tile_sizes']['average_bytes']} bytes")
+    
+    # Show tiles per zoom level
+    print("   📋 Tiles per zoom level:")
+    for zoom, count in tile_info['tiles_per_zoom'].items():
+        print(f"      Zoom {zoom}: {count:,} tiles")
     
+    # Processing statistics
+    if 'processing_stats' in tile_info:
+        stats = tile_info['processing_stats']
+        print(f"   ⏱️  Processing time: {stats.get('duration', 'N/A')}")
+        print(f"   💾 Peak memory: {stats.get('memory_peak_mb', 0):.1f}%")
+        if stats.get('retries', 0) > 0:
+            print(f"   🔄 Retries: {stats['retries']}")
+
+
+def create_sample_geojson_files(data_dir: Path, fgb: bool = True) -> dict:
+    """
+    Create sample feature files for demonstration.
+
+    FlatGeobuf is written by default because tippecanoe reads it natively
+    without parsing JSON text; pass ``fgb=False`` to write GeoJSONSeq
+    (one feature per line), which tippecanoe can stream and read in parallel.
+    """
     data_dir.mkdir(parents=True, exist_ok=True)
     files = {}
-    
-    # Sample river data
-    rivers_data = {
-        "type": "FeatureCollection",
-        "features": [
-            {
-                "type": "Feature",
-                "geometry": {
-                    "type": "LineString",
-                    "coordinates": [[-105.015, 39.742], [-105.012, 39.748]]
-                },
-                "properties": {
-                    "waterway": "river",
-                    "name": "Boulder Creek"
-                }
-            }
-        ]
-    }
-    
-    rivers_path = data_dir / "rivers.geojson"
-    with open(rivers_path, 'w') as f:
-        json.dump(rivers_data, f)
-    files["rivers"] = rivers_path
-    
-    # Sample road data
-    roads_data = {
-        "type": "FeatureCollection",
-        "features": [
-            {
-                "type": "Feature",
-                "geometry": {
-                    "type": "LineString",
-                    "coordinates": [[-105.018, 39.740], [-105.014, 39.745], [-105.010, 39.750]]
-                },
-                "properties": {
-                    "highway": "primary",
-                    "name": "Broadway"
-                }
-            }
-        ]
-    }
-    
-    roads_path = data_dir / "roads.geojson"
-    with open(roads_path, 'w') as f:
-        json.dump(roads_data, f)
-    files["roads"] = roads_path
-    
-    # Sample building data
-    buildings_data = {
-        "type": "FeatureCollection",
-        "features": [
-            {
-                "type": "Feature",
-                "geometry": {
-                    "type": "Polygon",
-                    "coordinates": [[[-105.016, 39.744], [-105.015, 39.744], [-105.015, 39.745], [-105.016, 39.745], [-105.016, 39.744]]]
-                },
-                "properties": {
-                    "building": "yes",
-                    "name": "Sample Building"
-                }
-            }
-        ]
-    }
-    
-    buildings_path = data_dir / "buildings.geojson"
-    with open(buildings_path, 'w') as f:
-        json.dump(buildings_data, f)
-    files["buildings"] = buildings_path
-    
-    print(f"✅ Created {len(files)} sample GeoJSON files")
+
+    suffix = ".fgb" if fgb else ".geojsonl"
+    writer = write_flatgeobuf if fgb else write_geojsonseq
+    jobs = [(name, data, data_dir / f"{name}{suffix}") for name, data in _SAMPLE_LAYERS]
+
+    # Files are independent, so overlap their writes
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda job: writer(job[2], job[1]), jobs))
+
+    for name, _, path in jobs:
+        files[name] = path
+
+    print(f"✅ Created {len(files)} sample {'FlatGeobuf' if fgb else 'GeoJSONSeq'} files")
     return files
 
 
+def write_geojsonseq(path: Path, data: dict) -> None:
+    """
+    Write a FeatureCollection's features as GeoJSONSeq, one per line.
+
+    Features are serialized up front and handed to the kernel in gathered
+    ``os.writev`` calls, one per ``_WRITEV_BATCH`` features.
+    """
+    chunks = [orjson.dumps(feature) + b"\n" for feature in data["features"]]
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for start in range(0, len(chunks), _WRITEV_BATCH):
+            _write_all(fd, chunks[start : start + _WRITEV_BATCH])
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, chunks: list) -> None:
+    """Write every chunk to fd, finishing any short gathered write."""
+    if hasattr(os, "writev"):
+        written = os.writev(fd, chunks)
+        if written == sum(len(chunk) for chunk in chunks):
+            return
+        remaining = memoryview(b"".join(chunks))[written:]
+    else:  # Windows has no writev
+        remaining = memoryview(b"".join(chunks))
+
+    while remaining:
+        remaining = remaining[os.write(fd, remaining) :]
+
+
+def write_flatgeobuf(path: Path, data: dict) -> None:
+    """Write a GeoJSON-like FeatureCollection to a FlatGeobuf file."""
+    import fiona
+
+    features = data["features"]
+    schema = {
+        "geometry": features[0]["geometry"]["type"],
+        "properties": {key: "str" for key in features[0]["properties"]},
+    }
+
+    with fiona.open(
+        path, "w", driver="FlatGeobuf", crs="EPSG:4326", schema=schema
+    ) as dst:
+        dst.writerecords(
+            {"geometry": feature["geometry"], "properties": feature["properties"]}
+            for feature in features
+        )
+
+
 if __name__ == "__main__":
     exit(main()) 
\ No newline at end of file
@@ -10,7 +10,11 @@ __version__ = "0.1.0"
 __author__ = "Richard"
 __email__ = "richard@example.com"
 
-from .models.config import BoundingBox, FeatureConfig, OutputConfig, PaletteConfig
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .models.config import BoundingBox, FeatureConfig, OutputConfig, PaletteConfig
 
 __all__ = [
     "__version__",
@@ -19,3 +23,22 @@ __all__ = [
     "OutputConfig",
     "PaletteConfig",
 ]
+
+# Public name -> submodule that defines it, imported on first access so that
+# `tilecraft --help` does not pay for loading the Pydantic models
+_LAZY_IMPORTS = {
+    "BoundingBox": ".models.config",
+    "FeatureConfig": ".models.config",
+    "OutputConfig": ".models.config",
+    "PaletteConfig": ".models.config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import config models on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
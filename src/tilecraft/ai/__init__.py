@@ -2,10 +2,14 @@
 AI integration modules for schema generation, style creation, and tag disambiguation.
 """
 
-from .prompts import PromptTemplates
-from .schema_generator import SchemaGenerator
-from .style_generator import StyleGenerator
-from .tag_disambiguator import TagDisambiguator
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .prompts import PromptTemplates
+    from .schema_generator import SchemaGenerator
+    from .style_generator import StyleGenerator
+    from .tag_disambiguator import TagDisambiguator
 
 __all__ = [
     "SchemaGenerator",
@@ -13,3 +17,21 @@ __all__ = [
     "TagDisambiguator",
     "PromptTemplates",
 ]
+
+# Public name -> submodule that defines it, imported on first access
+_LAZY_IMPORTS = {
+    "PromptTemplates": ".prompts",
+    "SchemaGenerator": ".schema_generator",
+    "StyleGenerator": ".style_generator",
+    "TagDisambiguator": ".tag_disambiguator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import AI components on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
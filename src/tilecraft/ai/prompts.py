@@ -2,30 +2,53 @@
 Prompt templates for AI integration.
 """
 
+from functools import lru_cache
 
 from tilecraft.models.config import FeatureType, PaletteConfig
 
-
-class PromptTemplates:
-    """Templates for AI prompts used in Tilecraft."""
-
-    @staticmethod
-    def schema_generation_prompt(
-        feature_types: list[FeatureType], bbox_info: str
-    ) -> str:
-        """
-        Generate prompt for tile schema generation.
-
-        Args:
-            feature_types: List of feature types
-            bbox_info: Bounding box description
-
-        Returns:
-            Schema generation prompt
-        """
-        feature_list = ", ".join([f.value for f in feature_types])
-
-        return f"""Generate a vector tile schema for the following OpenStreetMap feature types: {feature_list}.
+# Feature-specific styling guidelines used in style prompts
+FEATURE_GUIDELINES = {
+    FeatureType.RIVERS: "Rivers should have flowing, organic appearance with subtle glow effects",
+    FeatureType.FOREST: "Forests should use natural green tones with texture variations",
+    FeatureType.WATER: "Water bodies should appear calm and reflective",
+    FeatureType.LAKES: "Lakes should be distinguished from other water with deeper tones",
+    FeatureType.PARKS: "Parks should feel inviting with lighter, more vibrant greens",
+    FeatureType.ROADS: "Roads should be subtle but clearly defined hierarchy",
+    FeatureType.BUILDINGS: "Buildings should have consistent styling with appropriate shadows",
+}
+
+# Mood guidance for known palettes, keyed by lowercase palette name
+PALETTE_GUIDANCE = {
+    "subalpine dusk": "Cool mountain colors with muted blues, greens, and purples. Evening atmosphere with subtle gradients.",
+    "desert sunset": "Warm earth tones with oranges, reds, and sandy colors. High contrast with dramatic lighting.",
+    "pacific northwest": "Deep forest greens, ocean blues, and misty grays. Emphasize natural, organic feel.",
+    "urban midnight": "High contrast dark theme with bright accent colors. Modern, tech-forward aesthetic.",
+    "arctic": "Cool blues and whites with ice-like clarity. Minimal, clean design.",
+    "tropical": "Vibrant greens and blues with high saturation. Lush, energetic feel.",
+}
+
+DEFAULT_PALETTE_GUIDANCE = (
+    "Interpret the palette name to create an appropriate mood and color scheme."
+)
+
+
+@lru_cache(maxsize=128)
+def schema_generation_prompt(
+    feature_types: tuple[FeatureType, ...], bbox_info: str
+) -> str:
+    """
+    Generate prompt for tile schema generation.
+
+    Args:
+        feature_types: Tuple of feature types
+        bbox_info: Bounding box description
+
+    Returns:
+        Schema generation prompt
+    """
+    feature_list = ", ".join(f.value for f in feature_types)
+
+    return f"""Generate a vector tile schema for the following OpenStreetMap feature types: {feature_list}.
 
 This schema will be used to generate vector tiles for a geographic region: {bbox_info}.
 
@@ -46,74 +69,47 @@ Format the response as a structured JSON schema compatible with tippecanoe vecto
 
 Focus on cartographic clarity and performance optimization for web mapping applications."""
 
-    @staticmethod
-    def style_generation_prompt(
-        feature_types: list[FeatureType], palette: PaletteConfig, region_context: str
-    ) -> str:
-        """
-        Generate prompt for MapLibre style generation.
 
-        Args:
-            feature_types: List of feature types
-            palette: Palette configuration
-            region_context: Geographic context
+@lru_cache(maxsize=128)
+def style_generation_prompt(
+    feature_types: tuple[FeatureType, ...], palette_name: str, region_context: str
+) -> str:
+    """
+    Generate prompt for MapLibre style generation.
 
-        Returns:
-            Style generation prompt
-        """
-        feature_list = ", ".join([f.value for f in feature_types])
+    Args:
+        feature_types: Tuple of feature types
+        palette_name: Palette name
+        region_context: Geographic context
+
+    Returns:
+        Style generation prompt
+    """
+    feature_list = ", ".join(f.value for f in feature_types)
+
+    guidelines = "".join(
+        f"\n- {feature_type.value.title()}: {FEATURE_GUIDELINES[feature_type]}"
+        for feature_type in feature_types
+        if feature_type in FEATURE_GUIDELINES
+    )
+    palette_guidance = PALETTE_GUIDANCE.get(
+        palette_name.lower(), DEFAULT_PALETTE_GUIDANCE
+    )
 
-        base_prompt = f"""Generate a MapLibre GL JS style JSON for vector tiles representing {feature_list} in {region_context} using a '{palette.name}' palette.
+    return f"""Generate a MapLibre GL JS style JSON for vector tiles representing {feature_list} in {region_context} using a '{palette_name}' palette.
 
 Style Requirements:
-1. Create a cohesive color scheme that reflects the '{palette.name}' mood
+1. Create a cohesive color scheme that reflects the '{palette_name}' mood
 2. Ensure proper contrast ratios for accessibility (WCAG AA compliance)
 3. Use zoom-dependent styling for optimal performance
 4. Include appropriate typography with minimalist sans-serif fonts
 5. Reduce label clutter while maintaining readability
 6. Consider cartographic best practices for the feature types
 
-Feature-specific styling guidelines:"""
-
-        # Add feature-specific guidelines
-        guidelines = {
-            FeatureType.RIVERS: "Rivers should have flowing, organic appearance with subtle glow effects",
-            FeatureType.FOREST: "Forests should use natural green tones with texture variations",
-            FeatureType.WATER: "Water bodies should appear calm and reflective",
-            FeatureType.LAKES: "Lakes should be distinguished from other water with deeper tones",
-            FeatureType.PARKS: "Parks should feel inviting with lighter, more vibrant greens",
-            FeatureType.ROADS: "Roads should be subtle but clearly defined hierarchy",
-            FeatureType.BUILDINGS: "Buildings should have consistent styling with appropriate shadows",
-        }
-
-        for feature_type in feature_types:
-            if feature_type in guidelines:
-                base_prompt += (
-                    f"\n- {feature_type.value.title()}: {guidelines[feature_type]}"
-                )
-
-        base_prompt += f"""
+Feature-specific styling guidelines:{guidelines}
 
-Palette mood interpretation for '{palette.name}':
-"""
-
-        # Add palette-specific guidance
-        palette_guidance = {
-            "subalpine dusk": "Cool mountain colors with muted blues, greens, and purples. Evening atmosphere with subtle gradients.",
-            "desert sunset": "Warm earth tones with oranges, reds, and sandy colors. High contrast with dramatic lighting.",
-            "pacific northwest": "Deep forest greens, ocean blues, and misty grays. Emphasize natural, organic feel.",
-            "urban midnight": "High contrast dark theme with bright accent colors. Modern, tech-forward aesthetic.",
-            "arctic": "Cool blues and whites with ice-like clarity. Minimal, clean design.",
-            "tropical": "Vibrant greens and blues with high saturation. Lush, energetic feel.",
-        }
-
-        guidance = palette_guidance.get(
-            palette.name.lower(),
-            "Interpret the palette name to create an appropriate mood and color scheme.",
-        )
-        base_prompt += guidance
-
-        base_prompt += """
+Palette mood interpretation for '{palette_name}':
+{palette_guidance}
 
 Output a complete MapLibre GL JS style JSON that includes:
 1. Appropriate source configuration for vector tiles
@@ -125,20 +121,19 @@ Output a complete MapLibre GL JS style JSON that includes:
 
 Ensure the style is production-ready and follows MapLibre GL JS best practices."""
 
-        return base_prompt
 
-    @staticmethod
-    def tag_disambiguation_prompt(feature_type: FeatureType) -> str:
-        """
-        Generate prompt for OSM tag disambiguation.
+@lru_cache(maxsize=128)
+def tag_disambiguation_prompt(feature_type: FeatureType) -> str:
+    """
+    Generate prompt for OSM tag disambiguation.
 
-        Args:
-            feature_type: Feature type to disambiguate
+    Args:
+        feature_type: Feature type to disambiguate
 
-        Returns:
-            Tag disambiguation prompt
-        """
-        return f"""Given the feature type '{feature_type.value}', identify all relevant OpenStreetMap tags including:
+    Returns:
+        Tag disambiguation prompt
+    """
+    return f"""Given the feature type '{feature_type.value}', identify all relevant OpenStreetMap tags including:
 
 1. Primary tags (most common and standard)
 2. Synonyms and variations
@@ -162,6 +157,58 @@ Format the response as a structured list that can be used for automated tag matc
 
 Focus on maximizing feature capture while minimizing false positives."""
 
+
+class PromptTemplates:
+    """Templates for AI prompts used in Tilecraft."""
+
+    @staticmethod
+    def schema_generation_prompt(
+        feature_types: list[FeatureType], bbox_info: str
+    ) -> str:
+        """
+        Generate prompt for tile schema generation.
+
+        Args:
+            feature_types: List of feature types
+            bbox_info: Bounding box description
+
+        Returns:
+            Schema generation prompt
+        """
+        return schema_generation_prompt(tuple(feature_types), bbox_info)
+
+    @staticmethod
+    def style_generation_prompt(
+        feature_types: list[FeatureType], palette: PaletteConfig, region_context: str
+    ) -> str:
+        """
+        Generate prompt for MapLibre style generation.
+
+        Args:
+            feature_types: List of feature types
+            palette: Palette configuration
+            region_context: Geographic context
+
+        Returns:
+            Style generation prompt
+        """
+        return style_generation_prompt(
+            tuple(feature_types), palette.name, region_context
+        )
+
+    @staticmethod
+    def tag_disambiguation_prompt(feature_type: FeatureType) -> str:
+        """
+        Generate prompt for OSM tag disambiguation.
+
+        Args:
+            feature_type: Feature type to disambiguate
+
+        Returns:
+            Tag disambiguation prompt
+        """
+        return tag_disambiguation_prompt(feature_type)
+
     @staticmethod
     def validation_prompt(generated_content: str, content_type: str) -> str:
         """
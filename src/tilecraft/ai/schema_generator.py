@@ -16,6 +16,75 @@ from tilecraft.models.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Attribute spec: (name, type, description). Kept as plain tuples so no
+# Pydantic validation runs at import; models are built without validation.
+_AttributeSpec = tuple[str, AttributeType, str]
+
+# Geometry type and attribute specs for each feature
+_SCHEMA_MAP: dict[FeatureType, tuple[GeometryType, tuple[_AttributeSpec, ...]]] = {
+    FeatureType.RIVERS: (
+        GeometryType.LINESTRING,
+        (
+            ("name", AttributeType.STRING, "River name"),
+            ("waterway", AttributeType.STRING, "Waterway type"),
+        ),
+    ),
+    FeatureType.FOREST: (
+        GeometryType.POLYGON,
+        (
+            ("name", AttributeType.STRING, "Forest name"),
+            ("natural", AttributeType.STRING, "Natural feature type"),
+            ("landuse", AttributeType.STRING, "Land use type"),
+        ),
+    ),
+    FeatureType.WATER: (
+        GeometryType.POLYGON,
+        (
+            ("name", AttributeType.STRING, "Water body name"),
+            ("natural", AttributeType.STRING, "Natural feature type"),
+        ),
+    ),
+    FeatureType.LAKES: (
+        GeometryType.POLYGON,
+        (
+            ("name", AttributeType.STRING, "Lake name"),
+            ("water", AttributeType.STRING, "Water type"),
+        ),
+    ),
+    FeatureType.PARKS: (
+        GeometryType.POLYGON,
+        (
+            ("name", AttributeType.STRING, "Park name"),
+            ("leisure", AttributeType.STRING, "Leisure type"),
+        ),
+    ),
+    FeatureType.ROADS: (
+        GeometryType.LINESTRING,
+        (
+            ("name", AttributeType.STRING, "Road name"),
+            ("highway", AttributeType.STRING, "Highway type"),
+        ),
+    ),
+    FeatureType.BUILDINGS: (
+        GeometryType.POLYGON,
+        (
+            ("building", AttributeType.STRING, "Building type"),
+            ("height", AttributeType.NUMBER, "Building height"),
+        ),
+    ),
+}
+
+# Default (min_zoom, max_zoom) for each feature type
+_ZOOM_MAP: dict[FeatureType, tuple[int, int]] = {
+    FeatureType.RIVERS: (6, 14),
+    FeatureType.FOREST: (4, 12),
+    FeatureType.WATER: (4, 14),
+    FeatureType.LAKES: (4, 14),
+    FeatureType.PARKS: (8, 16),
+    FeatureType.ROADS: (8, 18),
+    FeatureType.BUILDINGS: (12, 18),
+}
+
 
 class SchemaGenerator:
     """Generates optimized vector tile schemas for OSM features."""
@@ -28,6 +97,7 @@ class SchemaGenerator:
             config: Tilecraft configuration
         """
         self.config = config
+        self._schema_cache: dict[tuple, dict[str, Any]] = {}
 
     def generate(self, feature_types: list[FeatureType]) -> dict[str, Any]:
         """
@@ -37,23 +107,52 @@ class SchemaGenerator:
             feature_types: List of feature types to include
 
         Returns:
-            Generated schema as dictionary
+            Generated schema as dictionary. Results are cached per feature
+            list and zoom/bbox settings; callers must not mutate them.
         """
-        logger.info(
-            f"Generating schema for features: {[f.value for f in feature_types]}"
-        )
+        cache_key = self._schema_cache_key(feature_types)
+        cached = self._schema_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Generating schema for features: %s", [f.value for f in feature_types]
+            )
 
         try:
             schema = self._generate_optimized_schema(feature_types)
 
             logger.info("Schema generated successfully")
-            return schema.dict()
+            result = schema._to_dict()
+            self._schema_cache[cache_key] = result
+            return result
 
         except Exception as e:
-            logger.error(f"Schema generation failed: {e}")
+            logger.error("Schema generation failed: %s", e)
             # Return fallback schema
             return self._get_fallback_schema(feature_types)
 
+    def _schema_cache_key(self, feature_types: list[FeatureType]) -> tuple:
+        """
+        Build the cache key for a schema request.
+
+        Feature order is kept because it determines layer order.
+
+        Args:
+            feature_types: Feature types to include
+
+        Returns:
+            Hashable key covering every input the schema depends on
+        """
+        bbox = self.config.bbox
+        return (
+            tuple(f.value for f in feature_types),
+            self.config.tiles.min_zoom,
+            self.config.tiles.max_zoom,
+            (bbox.west, bbox.south, bbox.east, bbox.north),
+        )
+
     def _generate_optimized_schema(
         self, feature_types: list[FeatureType]
     ) -> TileSchema:
@@ -66,17 +165,37 @@ class SchemaGenerator:
         Returns:
             Optimized tile schema
         """
+        tiles = self.config.tiles
         layers = []
-
         for feature_type in feature_types:
-            layer = self._create_layer_schema(feature_type)
-            layers.append(layer)
+            geometry_type, attribute_specs = _SCHEMA_MAP.get(
+                feature_type, (GeometryType.POINT, ())
+            )
+            feature_min, feature_max = _ZOOM_MAP.get(feature_type, (0, 14))
+
+            # Table values are trusted, so skip validation. Zooms are
+            # constrained to the global zoom levels.
+            layers.append(
+                LayerSchema.model_construct(
+                    name=feature_type.value,
+                    geometry_type=geometry_type,
+                    min_zoom=max(tiles.min_zoom, feature_min),
+                    max_zoom=min(tiles.max_zoom, feature_max),
+                    attributes=[
+                        FeatureAttributes.model_construct(
+                            name=name, type=attribute_type, description=description
+                        )
+                        for name, attribute_type, description in attribute_specs
+                    ],
+                    description=f"Layer containing {feature_type.value} features",
+                )
+            )
 
         schema = TileSchema(
             name="tilecraft_tiles",
             description=f"Vector tiles for {', '.join([f.value for f in feature_types])}",
-            min_zoom=self.config.tiles.min_zoom,
-            max_zoom=self.config.tiles.max_zoom,
+            min_zoom=tiles.min_zoom,
+            max_zoom=tiles.max_zoom,
             layers=layers,
             bounds=[
                 self.config.bbox.west,
@@ -88,166 +207,6 @@ class SchemaGenerator:
 
         return schema
 
-    def _create_layer_schema(self, feature_type: FeatureType) -> LayerSchema:
-        """
-        Create layer schema for feature type.
-
-        Args:
-            feature_type: Feature type
-
-        Returns:
-            Layer schema
-        """
-        # Define geometry types and attributes for each feature
-        schema_map = {
-            FeatureType.RIVERS: {
-                "geometry": GeometryType.LINESTRING,
-                "attributes": [
-                    FeatureAttributes(
-                        name="name", type=AttributeType.STRING, description="River name"
-                    ),
-                    FeatureAttributes(
-                        name="waterway",
-                        type=AttributeType.STRING,
-                        description="Waterway type",
-                    ),
-                ],
-            },
-            FeatureType.FOREST: {
-                "geometry": GeometryType.POLYGON,
-                "attributes": [
-                    FeatureAttributes(
-                        name="name",
-                        type=AttributeType.STRING,
-                        description="Forest name",
-                    ),
-                    FeatureAttributes(
-                        name="natural",
-                        type=AttributeType.STRING,
-                        description="Natural feature type",
-                    ),
-                    FeatureAttributes(
-                        name="landuse",
-                        type=AttributeType.STRING,
-                        description="Land use type",
-                    ),
-                ],
-            },
-            FeatureType.WATER: {
-                "geometry": GeometryType.POLYGON,
-                "attributes": [
-                    FeatureAttributes(
-                        name="name",
-                        type=AttributeType.STRING,
-                        description="Water body name",
-                    ),
-                    FeatureAttributes(
-                        name="natural",
-                        type=AttributeType.STRING,
-                        description="Natural feature type",
-                    ),
-                ],
-            },
-            FeatureType.LAKES: {
-                "geometry": GeometryType.POLYGON,
-                "attributes": [
-                    FeatureAttributes(
-                        name="name", type=AttributeType.STRING, description="Lake name"
-                    ),
-                    FeatureAttributes(
-                        name="water",
-                        type=AttributeType.STRING,
-                        description="Water type",
-                    ),
-                ],
-            },
-            FeatureType.PARKS: {
-                "geometry": GeometryType.POLYGON,
-                "attributes": [
-                    FeatureAttributes(
-                        name="name", type=AttributeType.STRING, description="Park name"
-                    ),
-                    FeatureAttributes(
-                        name="leisure",
-                        type=AttributeType.STRING,
-                        description="Leisure type",
-                    ),
-                ],
-            },
-            FeatureType.ROADS: {
-                "geometry": GeometryType.LINESTRING,
-                "attributes": [
-                    FeatureAttributes(
-                        name="name", type=AttributeType.STRING, description="Road name"
-                    ),
-                    FeatureAttributes(
-                        name="highway",
-                        type=AttributeType.STRING,
-                        description="Highway type",
-                    ),
-                ],
-            },
-            FeatureType.BUILDINGS: {
-                "geometry": GeometryType.POLYGON,
-                "attributes": [
-                    FeatureAttributes(
-                        name="building",
-                        type=AttributeType.STRING,
-                        description="Building type",
-                    ),
-                    FeatureAttributes(
-                        name="height",
-                        type=AttributeType.NUMBER,
-                        description="Building height",
-                    ),
-                ],
-            },
-        }
-
-        config = schema_map.get(
-            feature_type, {"geometry": GeometryType.POINT, "attributes": []}
-        )
-
-        # Determine appropriate zoom levels
-        min_zoom, max_zoom = self._get_feature_zoom_levels(feature_type)
-
-        return LayerSchema(
-            name=feature_type.value,
-            geometry_type=config["geometry"],
-            min_zoom=min_zoom,
-            max_zoom=max_zoom,
-            attributes=config["attributes"],
-            description=f"Layer containing {feature_type.value} features",
-        )
-
-    def _get_feature_zoom_levels(self, feature_type: FeatureType) -> tuple[int, int]:
-        """
-        Get appropriate zoom levels for feature type.
-
-        Args:
-            feature_type: Feature type
-
-        Returns:
-            Tuple of (min_zoom, max_zoom)
-        """
-        zoom_map = {
-            FeatureType.RIVERS: (6, 14),
-            FeatureType.FOREST: (4, 12),
-            FeatureType.WATER: (4, 14),
-            FeatureType.LAKES: (4, 14),
-            FeatureType.PARKS: (8, 16),
-            FeatureType.ROADS: (8, 18),
-            FeatureType.BUILDINGS: (12, 18),
-        }
-
-        feature_min, feature_max = zoom_map.get(feature_type, (0, 14))
-
-        # Constrain to global zoom levels
-        min_zoom = max(self.config.tiles.min_zoom, feature_min)
-        max_zoom = min(self.config.tiles.max_zoom, feature_max)
-
-        return min_zoom, max_zoom
-
     def _get_fallback_schema(self, feature_types: list[FeatureType]) -> dict[str, Any]:
         """
         Get fallback schema when AI generation fails.
@@ -2,15 +2,162 @@
 MapLibre GL JS style generation.
 """
 
-import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Optional
+
+import orjson
 
 from tilecraft.models.config import PaletteConfig, TilecraftConfig
 
 logger = logging.getLogger(__name__)
 
+# Schemas with more layers than this are streamed to disk layer by layer
+_STREAMING_LAYER_THRESHOLD = 1000
+
+# Output buffer size for streamed style writes
+_STREAM_BUFFER_SIZE = 1 << 20
+
+# Zoom-dependent line width expressions, keyed by layer name
+_LINE_WIDTHS: dict[str, list[Any]] = {
+    "rivers": ["interpolate", ["linear"], ["zoom"], 6, 1, 10, 2, 14, 4],
+    "roads": ["interpolate", ["linear"], ["zoom"], 8, 0.5, 12, 1, 16, 3],
+    "default": ["interpolate", ["linear"], ["zoom"], 6, 1, 14, 2],
+}
+
+# Colors for built-in palettes, keyed by lowercase palette name
+_PALETTES: dict[str, dict[str, str]] = {
+    "subalpine dusk": {
+        "background": "#2C3E50",
+        "rivers": "#00D4FF",
+        "forest": "#2E8B57",
+        "water": "#4A90E2",
+        "lakes": "#1E88E5",
+        "parks": "#8BC34A",
+        "roads": "#95A5A6",
+        "buildings": "#7F8C8D",
+        "outline": "#34495E",
+        "default_line": "#3498DB",
+        "default_fill": "#27AE60",
+        "default_point": "#E74C3C",
+    },
+    "desert sunset": {
+        "background": "#FFA726",
+        "rivers": "#42A5F5",
+        "forest": "#8BC34A",
+        "water": "#1E88E5",
+        "lakes": "#1976D2",
+        "parks": "#4CAF50",
+        "roads": "#8D6E63",
+        "buildings": "#6D4C41",
+        "outline": "#5D4037",
+        "default_line": "#FF7043",
+        "default_fill": "#FF8A65",
+        "default_point": "#F44336",
+    },
+    "urban midnight": {
+        "background": "#0D1117",
+        "rivers": "#58A6FF",
+        "forest": "#238636",
+        "water": "#1F6FEB",
+        "lakes": "#0969DA",
+        "parks": "#2DA44E",
+        "roads": "#F0F6FC",
+        "buildings": "#8B949E",
+        "outline": "#30363D",
+        "default_line": "#58A6FF",
+        "default_fill": "#21262D",
+        "default_point": "#F85149",
+    },
+}
+
+# Background layer for each built-in palette, shared between styles
+_BACKGROUND_LAYERS: dict[str, dict[str, Any]] = {
+    palette_key: {
+        "id": "background",
+        "type": "background",
+        "paint": {"background-color": colors["background"]},
+    }
+    for palette_key, colors in _PALETTES.items()
+}
+
+
+# Static paint properties per layer type; templates add only the colors
+_LINE_PAINT = {"line-opacity": 0.8}
+_FILL_PAINT = {"fill-opacity": 0.6}
+_CIRCLE_PAINT = {"circle-radius": 4, "circle-opacity": 0.8}
+
+
+def _line_template(layer_name: str, colors: dict[str, str]) -> dict[str, Any]:
+    """Line styling with zoom-dependent width."""
+    return {
+        "type": "line",
+        "paint": {
+            "line-color": colors.get(layer_name, colors["default_line"]),
+            "line-width": _LINE_WIDTHS.get(layer_name, _LINE_WIDTHS["default"]),
+            **_LINE_PAINT,
+        },
+    }
+
+
+def _polygon_template(layer_name: str, colors: dict[str, str]) -> dict[str, Any]:
+    """Polygon styling with outline."""
+    return {
+        "type": "fill",
+        "paint": {
+            "fill-color": colors.get(layer_name, colors["default_fill"]),
+            **_FILL_PAINT,
+            "fill-outline-color": colors.get(f"{layer_name}_outline", colors["outline"]),
+        },
+    }
+
+
+def _point_template(layer_name: str, colors: dict[str, str]) -> dict[str, Any]:
+    """Point styling as circles."""
+    return {
+        "type": "circle",
+        "paint": {
+            "circle-color": colors.get(layer_name, colors["default_point"]),
+            **_CIRCLE_PAINT,
+        },
+    }
+
+
+# Style-layer type and paint builders, keyed by schema geometry type
+_GEOMETRY_TEMPLATES = {
+    "linestring": _line_template,
+    "polygon": _polygon_template,
+    "point": _point_template,
+}
+
+
+@lru_cache(maxsize=512)
+def _palette_layer_body(
+    palette_key: str, layer_name: str, geometry_type: str
+) -> Optional[dict[str, Any]]:
+    """
+    Resolve a layer's type and paint for one palette, once per combination.
+
+    The returned dict is shared between styles and must not be mutated.
+    """
+    layer_template = _GEOMETRY_TEMPLATES.get(geometry_type)
+    if layer_template is None:
+        return None
+    colors = _PALETTES.get(palette_key, _PALETTES["subalpine dusk"])
+    return layer_template(layer_name, colors)
+
+
+# Lowercases ASCII letters and replaces path-unsafe characters in one pass
+_SAFE_NAME_TABLE = str.maketrans(
+    {
+        **{c: c.lower() for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"},
+        " ": "_",
+        "/": "_",
+        "\\": "_",
+    }
+)
+
 
 class StyleGenerator:
     """Generates optimized MapLibre GL JS styles with palette-based theming."""
@@ -23,6 +170,13 @@ class StyleGenerator:
             config: Tilecraft configuration
         """
         self.config = config
+        self._style_cache: dict[tuple, dict[str, Any]] = {}
+
+        # Fixed for the lifetime of the generator; resolved once
+        self._tileset_name = config.output.name or "tileset"
+        self._mbtiles_url = f"mbtiles://{self._tileset_name}.mbtiles"
+        self._styles_dir = config.output.styles_dir
+        self._styles_dir.mkdir(parents=True, exist_ok=True)
 
     def generate(self, schema: dict[str, Any], palette: PaletteConfig) -> Path:
         """
@@ -38,11 +192,18 @@ class StyleGenerator:
         logger.info(f"Generating MapLibre style with palette: {palette.name}")
 
         try:
-            # Generate style
-            style = self._generate_default_style(schema, palette)
-
-            # Save to file
-            output_path = self._save_style(style, palette.name)
+            if (
+                not self.config.verbose
+                and len(schema.get("layers", [])) > _STREAMING_LAYER_THRESHOLD
+            ):
+                # Very large schemas never materialize the full style
+                output_path = self._save_style_streaming(schema, palette)
+            else:
+                # Generate style
+                style = self._generate_default_style(schema, palette)
+
+                # Save to file
+                output_path = self._save_style(style, palette.name)
 
             logger.info(f"Style generated: {output_path}")
             return output_path
@@ -62,13 +223,43 @@ class StyleGenerator:
             palette: Palette configuration
 
         Returns:
-            MapLibre style as dictionary
+            MapLibre style as dictionary. Results are cached per palette and
+            layer definitions; callers must not mutate them.
         """
-        # Get base colors for palette
-        colors = self._get_palette_colors(palette.name)
+        # Only these layer fields affect the style
+        cache_key = (
+            palette.name,
+            tuple(
+                (
+                    layer_info["name"],
+                    layer_info.get("geometry_type", "polygon"),
+                    layer_info.get("min_zoom", 0),
+                    layer_info.get("max_zoom", 14),
+                )
+                for layer_info in schema.get("layers", [])
+            ),
+        )
+        cached = self._style_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        # Base style structure
-        style = {
+        style = self._style_header(palette)
+        style["layers"] = list(self._iter_style_layers(schema, palette))
+
+        self._style_cache[cache_key] = style
+        return style
+
+    def _style_header(self, palette: PaletteConfig) -> dict[str, Any]:
+        """
+        Build the style structure that precedes the layers.
+
+        Args:
+            palette: Palette configuration
+
+        Returns:
+            MapLibre style dictionary without layers
+        """
+        return {
             "version": 8,
             "name": f"Tilecraft - {palette.name}",
             "metadata": {
@@ -78,40 +269,43 @@ class StyleGenerator:
             "sources": {
                 "tilecraft": {
                     "type": "vector",
-                    "url": f"mbtiles://{self.config.output.name or 'tileset'}.mbtiles",
+                    "url": self._mbtiles_url,
                 }
             },
-            "layers": [],
         }
 
-        # Add background layer
-        style["layers"].append(
-            {
-                "id": "background",
-                "type": "background",
-                "paint": {"background-color": colors["background"]},
-            }
-        )
+    def _iter_style_layers(
+        self, schema: dict[str, Any], palette: PaletteConfig
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield style layers in draw order.
 
-        # Add layers for each feature type
-        for layer_info in schema.get("layers", []):
-            layer_name = layer_info["name"]
-            geometry_type = layer_info.get("geometry_type", "polygon")
+        Args:
+            schema: Tile schema
+            palette: Palette configuration
 
-            style_layer = self._create_style_layer(
-                layer_name, geometry_type, colors, layer_info
-            )
+        Yields:
+            Background layer first, then one layer per feature type
+        """
+        palette_key = palette.name.lower()
+        yield _BACKGROUND_LAYERS.get(palette_key, _BACKGROUND_LAYERS["subalpine dusk"])
 
+        create_style_layer = self._create_style_layer
+        for layer_info in schema.get("layers", []):
+            style_layer = create_style_layer(
+                layer_info["name"],
+                layer_info.get("geometry_type", "polygon"),
+                palette_key,
+                layer_info,
+            )
             if style_layer:
-                style["layers"].append(style_layer)
-
-        return style
+                yield style_layer
 
     def _create_style_layer(
         self,
         layer_name: str,
         geometry_type: str,
-        colors: dict[str, str],
+        palette_key: str,
         layer_info: dict,
     ) -> dict[str, Any]:
         """
@@ -120,162 +314,95 @@ class StyleGenerator:
         Args:
             layer_name: Layer name
             geometry_type: Geometry type
-            colors: Color palette
+            palette_key: Lowercase palette name
             layer_info: Layer information from schema
 
         Returns:
             MapLibre style layer
         """
-        base_layer = {
+        layer_body = _palette_layer_body(palette_key, layer_name, geometry_type)
+
+        # Per-layer header merged with the prebuilt type/paint body in one literal
+        return {
             "id": layer_name,
             "source": "tilecraft",
             "source-layer": layer_name,
             "minzoom": layer_info.get("min_zoom", 0),
             "maxzoom": layer_info.get("max_zoom", 14),
+            **(layer_body or {}),
         }
 
-        if geometry_type == "linestring":
-            # Line styling
-            base_layer.update(
-                {
-                    "type": "line",
-                    "paint": {
-                        "line-color": colors.get(layer_name, colors["default_line"]),
-                        "line-width": self._get_line_width(layer_name),
-                        "line-opacity": 0.8,
-                    },
-                }
-            )
-
-        elif geometry_type == "polygon":
-            # Polygon styling
-            base_layer.update(
-                {
-                    "type": "fill",
-                    "paint": {
-                        "fill-color": colors.get(layer_name, colors["default_fill"]),
-                        "fill-opacity": 0.6,
-                        "fill-outline-color": colors.get(
-                            f"{layer_name}_outline", colors["outline"]
-                        ),
-                    },
-                }
-            )
-
-        elif geometry_type == "point":
-            # Point styling
-            base_layer.update(
-                {
-                    "type": "circle",
-                    "paint": {
-                        "circle-color": colors.get(layer_name, colors["default_point"]),
-                        "circle-radius": 4,
-                        "circle-opacity": 0.8,
-                    },
-                }
-            )
-
-        return base_layer
-
-    def _get_line_width(self, layer_name: str) -> dict[str, Any]:
+    def _save_style(self, style: dict[str, Any], palette_name: str) -> Path:
         """
-        Get zoom-dependent line width.
+        Save style to JSON file.
 
         Args:
-            layer_name: Layer name
+            style: Style dictionary
+            palette_name: Palette name for filename
 
         Returns:
-            MapLibre expression for line width
+            Path to saved file
         """
-        width_map = {
-            "rivers": ["interpolate", ["linear"], ["zoom"], 6, 1, 10, 2, 14, 4],
-            "roads": ["interpolate", ["linear"], ["zoom"], 8, 0.5, 12, 1, 16, 3],
-            "default": ["interpolate", ["linear"], ["zoom"], 6, 1, 14, 2],
-        }
+        output_path = self._style_path(palette_name)
+
+        # Save JSON (orjson emits UTF-8 without escaping non-ASCII). MapLibre
+        # does not need pretty-printing, so indent only for verbose runs.
+        option = orjson.OPT_INDENT_2 if self.config.verbose else None
+        output_path.write_bytes(orjson.dumps(style, option=option))
 
-        return width_map.get(layer_name, width_map["default"])
+        return output_path
 
-    def _get_palette_colors(self, palette_name: str) -> dict[str, str]:
+    def _save_style_streaming(
+        self, schema: dict[str, Any], palette: PaletteConfig
+    ) -> Path:
         """
-        Get color palette for style.
+        Write compact style JSON one layer at a time.
+
+        Produces the same bytes as ``_save_style`` without holding the full
+        layers list in memory.
 
         Args:
-            palette_name: Palette name
+            schema: Tile schema
+            palette: Palette configuration
 
         Returns:
-            Dictionary of colors
+            Path to saved file
         """
-        palettes = {
-            "subalpine dusk": {
-                "background": "#2C3E50",
-                "rivers": "#00D4FF",
-                "forest": "#2E8B57",
-                "water": "#4A90E2",
-                "lakes": "#1E88E5",
-                "parks": "#8BC34A",
-                "roads": "#95A5A6",
-                "buildings": "#7F8C8D",
-                "outline": "#34495E",
-                "default_line": "#3498DB",
-                "default_fill": "#27AE60",
-                "default_point": "#E74C3C",
-            },
-            "desert sunset": {
-                "background": "#FFA726",
-                "rivers": "#42A5F5",
-                "forest": "#8BC34A",
-                "water": "#1E88E5",
-                "lakes": "#1976D2",
-                "parks": "#4CAF50",
-                "roads": "#8D6E63",
-                "buildings": "#6D4C41",
-                "outline": "#5D4037",
-                "default_line": "#FF7043",
-                "default_fill": "#FF8A65",
-                "default_point": "#F44336",
-            },
-            "urban midnight": {
-                "background": "#0D1117",
-                "rivers": "#58A6FF",
-                "forest": "#238636",
-                "water": "#1F6FEB",
-                "lakes": "#0969DA",
-                "parks": "#2DA44E",
-                "roads": "#F0F6FC",
-                "buildings": "#8B949E",
-                "outline": "#30363D",
-                "default_line": "#58A6FF",
-                "default_fill": "#21262D",
-                "default_point": "#F85149",
-            },
-        }
+        output_path = self._style_path(palette.name)
+
+        # Header is serialized as an object; drop its closing brace so the
+        # layers array can follow as the last key
+        header = orjson.dumps(self._style_header(palette))[:-1]
+
+        with open(output_path, "wb", buffering=_STREAM_BUFFER_SIZE) as f:
+            f.write(header)
+            f.write(b',"layers":[')
+            separator = b""
+            for style_layer in self._iter_style_layers(schema, palette):
+                f.write(separator)
+                f.write(orjson.dumps(style_layer))
+                separator = b","
+            f.write(b"]}")
 
-        return palettes.get(palette_name.lower(), palettes["subalpine dusk"])
+        return output_path
 
-    def _save_style(self, style: dict[str, Any], palette_name: str) -> Path:
+    def _style_path(self, palette_name: str) -> Path:
         """
-        Save style to JSON file.
+        Get output path for a palette's style file.
 
         Args:
-            style: Style dictionary
             palette_name: Palette name for filename
 
         Returns:
-            Path to saved file
+            Path to style JSON file
         """
-        # Create filename
-        safe_name = palette_name.lower().replace(" ", "_")
-        project_name = self.config.output.name or "tileset"
-        filename = f"{project_name}_{safe_name}_style.json"
-
-        output_path = self.config.output.styles_dir / filename
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        safe_name = palette_name.translate(_SAFE_NAME_TABLE)
+        if not safe_name.isascii():
+            # The table only lowercases ASCII letters
+            safe_name = safe_name.lower()
+        filename = f"{self._tileset_name}_{safe_name}_style.json"
 
-        # Save JSON
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(style, f, indent=2, ensure_ascii=False)
-
-        return output_path
+        return self._styles_dir / filename
 
     def _call_ai_api(self, prompt: str) -> str:
         """
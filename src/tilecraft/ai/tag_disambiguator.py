@@ -3,6 +3,8 @@ AI-powered OSM tag disambiguation.
 """
 
 import logging
+import sys
+from collections import defaultdict
 
 from tilecraft.models.config import FeatureType, TilecraftConfig
 
@@ -50,6 +52,45 @@ class TagDisambiguator:
             },
         }
 
+        # Intern keys and values so lookups against interned candidate tags
+        # resolve on the identity check before any string comparison
+        self.tag_mappings = {
+            feature_type: {
+                sys.intern(key): [sys.intern(value) for value in values]
+                for key, values in tags.items()
+            }
+            for feature_type, tags in self.tag_mappings.items()
+        }
+
+        # Lookup tables covering every FeatureType, so hot paths subscript
+        # directly instead of calling .get() with a freshly built default
+        self._tags_by_feature: dict[FeatureType, dict[str, list[str]]] = {}
+        self._known_keys: dict[FeatureType, frozenset[str]] = {}
+        # (key, accepted values, accepts any value) per known tag key
+        self._tag_rules: dict[
+            FeatureType, tuple[tuple[str, frozenset[str], bool], ...]
+        ] = {}
+        for feature_type in FeatureType:
+            tags = self.tag_mappings.get(feature_type, {})
+            self._tags_by_feature[feature_type] = tags
+            self._known_keys[feature_type] = frozenset(tags)
+            self._tag_rules[feature_type] = tuple(
+                (key, frozenset(values), "*" in values) for key, values in tags.items()
+            )
+
+        # Inverse index for get_conflicting_tags: "key=value" (or bare key for
+        # wildcards) -> feature types using it
+        tag_to_features = defaultdict(list)
+        for feature_type, tags in self.tag_mappings.items():
+            for key, values in tags.items():
+                for value in values:
+                    tag_str = f"{key}={value}" if value != "*" else key
+                    tag_to_features[tag_str].append(feature_type)
+        self._tag_to_features: dict[str, list[FeatureType]] = dict(tag_to_features)
+        self._conflict_cache: dict[
+            frozenset[FeatureType], dict[str, list[FeatureType]]
+        ] = {}
+
     def get_tags_for_feature(self, feature_type: FeatureType) -> dict[str, list[str]]:
         """
         Get OSM tags for feature type.
@@ -60,7 +101,7 @@ class TagDisambiguator:
         Returns:
             Dictionary of tag filters
         """
-        return self.tag_mappings.get(feature_type, {})
+        return self._tags_by_feature[feature_type]
 
     def disambiguate_tags(
         self, feature_type: FeatureType, candidate_tags: list[dict[str, str]]
@@ -70,46 +111,53 @@ class TagDisambiguator:
 
         Args:
             feature_type: Target feature type
-            candidate_tags: List of tag dictionaries to evaluate
+            candidate_tags: List of tag dictionaries to evaluate. Matching
+                is fastest when callers intern keys and values with
+                ``sys.intern`` as they parse OSM tags.
 
         Returns:
             Filtered list of relevant tags
         """
-        logger.info(f"Disambiguating tags for {feature_type.value}")
-
-        relevant_tags = []
-        known_tags = self.get_tags_for_feature(feature_type)
-
-        for tag_dict in candidate_tags:
-            if self._is_relevant_tag(tag_dict, known_tags):
-                relevant_tags.append(tag_dict)
+        logger.debug("Disambiguating tags for %s", feature_type.value)
+
+        known_keys = self._known_keys[feature_type]
+        tag_rules = self._tag_rules[feature_type]
+
+        if not known_keys:
+            relevant_tags = []
+        elif len(tag_rules) == 1:
+            # Single-key features (rivers, roads, buildings) reduce to one
+            # membership test per candidate with no generator overhead
+            key, values, wildcard = tag_rules[0]
+            if wildcard:
+                relevant_tags = [
+                    tag_dict for tag_dict in candidate_tags if key in tag_dict
+                ]
+            else:
+                relevant_tags = [
+                    tag_dict
+                    for tag_dict in candidate_tags
+                    if key in tag_dict and tag_dict[key] in values
+                ]
+        else:
+            # A plain loop beats an any() generator per candidate
+            relevant_tags = []
+            append = relevant_tags.append
+            for tag_dict in candidate_tags:
+                # Most OSM tag sets share no key with the feature; reject
+                # those at once
+                if known_keys.isdisjoint(tag_dict):
+                    continue
+                for key, values, wildcard in tag_rules:
+                    if key in tag_dict and (wildcard or tag_dict[key] in values):
+                        append(tag_dict)
+                        break
 
         logger.info(
-            f"Found {len(relevant_tags)} relevant tags for {feature_type.value}"
+            "Found %d relevant tags for %s", len(relevant_tags), feature_type.value
         )
         return relevant_tags
 
-    def _is_relevant_tag(
-        self, tag_dict: dict[str, str], known_tags: dict[str, list[str]]
-    ) -> bool:
-        """
-        Check if tag dictionary is relevant for feature type.
-
-        Args:
-            tag_dict: Tag dictionary to check
-            known_tags: Known tags for feature type
-
-        Returns:
-            True if tag is relevant
-        """
-        for key, values in known_tags.items():
-            if key in tag_dict:
-                tag_value = tag_dict[key]
-                if "*" in values or tag_value in values:
-                    return True
-
-        return False
-
     def enhance_with_ai(self, feature_type: FeatureType) -> dict[str, list[str]]:
         """
         Enhance tag mappings using AI.
@@ -134,18 +182,21 @@ class TagDisambiguator:
             feature_types: List of feature types to check
 
         Returns:
-            Dictionary mapping tags to conflicting feature types
+            Dictionary mapping tags to conflicting feature types. Results are
+            cached per set of feature types; callers must not mutate them.
         """
+        requested = frozenset(feature_types)
+        cached = self._conflict_cache.get(requested)
+        if cached is not None:
+            return cached
+
         conflicts = {}
 
-        for feature_type in feature_types:
-            tags = self.get_tags_for_feature(feature_type)
-            for key, values in tags.items():
-                for value in values:
-                    tag_str = f"{key}={value}" if value != "*" else key
-                    if tag_str not in conflicts:
-                        conflicts[tag_str] = []
-                    conflicts[tag_str].append(feature_type)
+        for tag_str, tag_features in self._tag_to_features.items():
+            types = [f for f in tag_features if f in requested]
+            # Keep only actual conflicts (multiple feature types)
+            if len(types) > 1:
+                conflicts[tag_str] = types
 
-        # Keep only actual conflicts (multiple feature types)
-        return {tag: types for tag, types in conflicts.items() if len(types) > 1}
+        self._conflict_cache[requested] = conflicts
+        return conflicts
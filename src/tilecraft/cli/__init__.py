@@ -0,0 +1,157 @@
+"""
+Command-line interface for Tilecraft.
+"""
+
+import importlib
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Optional
+
+import click
+
+from tilecraft import __version__
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_console: Optional["Console"] = None
+
+
+def console() -> "Console":
+    """Get the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+_BANNER = f"""
+╔══════════════════════════════════════════════════════════════╗
+║                         TILECRAFT                            ║
+║               OSM Vector Tile Generation                     ║
+║                         Version {__version__}                          ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
+# Pre-encoded banner, bold blue when writing to a color terminal
+_BANNER_BYTES = f"{_BANNER}\n".encode()
+_BANNER_COLOR_BYTES = f"\x1b[1;34m{_BANNER}\x1b[0m\n".encode()
+
+
+def print_banner():
+    """Print the Tilecraft banner."""
+    # Static text, so skip Rich's markup parsing and rendering entirely
+    color = sys.stdout.isatty() and "NO_COLOR" not in os.environ
+    banner = _BANNER_COLOR_BYTES if color else _BANNER_BYTES
+
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(banner.decode())
+        sys.stdout.flush()
+    else:
+        buffer.write(banner)
+        buffer.flush()
+
+
+def _install_traceback(show_locals: bool = False):
+    """
+    Install the Rich traceback handler for commands that do real work.
+
+    Args:
+        show_locals: Render each frame's locals, which can be slow and huge
+            when a pipeline step fails holding large datasets; use for -v only
+    """
+    from rich.traceback import install
+
+    install(show_locals=show_locals)
+
+
+def _dumps_json(data: Any) -> str:
+    """Serialize CLI output, writing paths as strings."""
+    import orjson
+
+    def default(value):
+        if isinstance(value, os.PathLike):
+            return os.fspath(value)
+        raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+    return orjson.dumps(data, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class LazyGroup(click.Group):
+    """Click group that imports each subcommand's module only when it is used."""
+
+    def __init__(self, *args, lazy_subcommands: Optional[dict] = None, **kwargs):
+        """
+        Initialize the group.
+
+        Args:
+            lazy_subcommands: Map of command name to "module.attribute" path
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+            return getattr(importlib.import_module(module_name), attr)
+        return super().get_command(ctx, cmd_name)
+
+
+# Each command lives in its own module so running one never imports the others
+@click.group(
+    cls=LazyGroup,
+    invoke_without_command=True,
+    lazy_subcommands={
+        "generate": "tilecraft.cli._cmd_generate.generate",
+        "batch": "tilecraft.cli._cmd_batch.batch",
+        "preview": "tilecraft.cli._cmd_preview.preview_tiles",
+        "features": "tilecraft.cli._cmd_features.list_features",
+        "check": "tilecraft.cli._cmd_check.check_system",
+    },
+)
+@click.pass_context
+@click.version_option(version=__version__)
+def cli(ctx):
+    """Tilecraft: Streamlined CLI for OSM Vector Tile Generation"""
+    if ctx.invoked_subcommand is None:
+        # Default behavior - show help
+        click.echo(ctx.get_help())
+
+
+def main():
+    """Main entry point for CLI."""
+    # Answer a bare --version without Click parsing or the exit cleanup below
+    if sys.argv[1:] == ["--version"]:
+        print(f"tilecraft, version {__version__}")
+        return
+
+    exit_code = 0
+    try:
+        cli()
+    except SystemExit as e:
+        # Click always ends with SystemExit; keep its status for os._exit
+        if isinstance(e.code, int):
+            exit_code = e.code
+        elif e.code is not None:
+            exit_code = 1
+    finally:
+        # Ensure clean exit - force process termination if needed
+        # Give any remaining threads a brief moment to finish
+        import time
+        time.sleep(0.1)
+        # Force exit if we're still running after cleanup
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except Exception:
+            pass
+        # Use os._exit as last resort to bypass any hanging resources
+        # For large datasets, this prevents indefinite hanging
+        os._exit(exit_code)  # Force exit to prevent ThreadPoolExecutor hanging
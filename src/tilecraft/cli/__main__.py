@@ -0,0 +1,7 @@
+"""
+Allow running the CLI with ``python -m tilecraft.cli``.
+"""
+
+from tilecraft.cli import main
+
+main()
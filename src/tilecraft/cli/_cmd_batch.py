@@ -0,0 +1,229 @@
+"""
+The batch command: run several tile jobs from one YAML file.
+"""
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import click
+
+from tilecraft.cli import console
+
+if TYPE_CHECKING:
+    from tilecraft.models.config import TilecraftConfig
+
+
+@click.command("batch")
+@click.argument(
+    "batch_config", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    "--output",
+    default="output",
+    type=click.Path(path_type=Path),
+    help="Output directory; each job writes to a subdirectory (default: 'output')",
+)
+@click.option(
+    "--pipeline-workers",
+    "-j",
+    default=None,
+    type=click.IntRange(1),
+    help="Number of jobs to run in parallel (default: CPU count)",
+)
+@click.option("--no-cache", is_flag=True, help="Disable caching (re-download OSM data)")
+@click.option("--verbose", "-v", is_flag=True, help="Verbose output")
+def batch(
+    batch_config: Path,
+    output: Path,
+    pipeline_workers: Optional[int],
+    no_cache: bool,
+    verbose: bool,
+):
+    """
+    Run several tile generation jobs from a YAML file in parallel.
+
+    The file holds a list of jobs, each with the same settings as the generate
+    command, plus optional defaults shared by every job. All jobs share one
+    OSM data cache; a bbox used by several jobs is downloaded once before the
+    jobs start. Each job keeps its own temporary files.
+
+    \b
+    Example file:
+        defaults:
+          features: rivers,forest,water
+          palette: subalpine dusk
+        jobs:
+          - name: moab
+            bbox: "-109.6,38.5,-109.4,38.7"
+          - name: boulder
+            bbox: "-105.3,40.0,-105.2,40.1"
+            palette: desert sunset
+            min_zoom: 2
+
+    \b
+    Example:
+        tilecraft batch regions.yaml --pipeline-workers 4
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    configs = _load_batch_configs(batch_config, output, not no_cache, verbose)
+    max_workers = min(pipeline_workers or os.cpu_count() or 1, len(configs))
+
+    if not no_cache:
+        _prefetch_shared_downloads(configs)
+
+    console().print(
+        f"[bold blue]Running {len(configs)} jobs with {max_workers} workers[/bold blue]\n"
+    )
+
+    failures = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_run_batch_job, config): config.output.name
+            for config in configs
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                failures[name] = e
+                console().print(f"[red]✗ {name}: {e}[/red]")
+            else:
+                console().print(f"[green]✓ {name}: {result['tiles']}[/green]")
+
+    if failures:
+        raise click.ClickException(
+            f"{len(failures)} of {len(configs)} jobs failed: {', '.join(failures)}"
+        )
+
+    console().print(f"\n[bold green]✓ All {len(configs)} jobs completed[/bold green]")
+
+
+def _load_batch_configs(
+    batch_config: Path, output: Path, cache_enabled: bool, verbose: bool
+) -> list["TilecraftConfig"]:
+    """
+    Build validated configurations for every job in a batch file.
+
+    Args:
+        batch_config: YAML file with ``jobs`` and optional ``defaults``
+        output: Base output directory for the batch
+        cache_enabled: Whether jobs use the shared cache
+        verbose: Verbose output for every job
+
+    Returns:
+        One configuration per job, in file order
+
+    Raises:
+        click.ClickException: If the file or any job is invalid
+    """
+    import yaml
+
+    from tilecraft.models.config import (
+        BoundingBox,
+        FeatureConfig,
+        OutputConfig,
+        PaletteConfig,
+        TilecraftConfig,
+    )
+
+    try:
+        data = yaml.safe_load(batch_config.read_text()) or {}
+    except yaml.YAMLError as e:
+        raise click.ClickException(f"Invalid batch file: {e}") from e
+
+    jobs = data.get("jobs") if isinstance(data, dict) else None
+    if not jobs or not isinstance(jobs, list):
+        raise click.ClickException("Batch file must contain a non-empty 'jobs' list")
+    defaults = data.get("defaults") or {}
+
+    configs = []
+    names = set()
+    for index, job in enumerate(jobs, start=1):
+        settings = {**defaults, **job}
+        name = str(settings.get("name") or f"job_{index}")
+        if name in names:
+            raise click.ClickException(f"Duplicate job name in batch file: {name}")
+        names.add(name)
+
+        try:
+            configs.append(
+                TilecraftConfig(
+                    bbox=BoundingBox.from_string(str(settings["bbox"])),
+                    features=FeatureConfig(types=settings["features"]),
+                    palette=PaletteConfig(name=settings["palette"]),
+                    output=OutputConfig(
+                        base_dir=output / name,
+                        name=name,
+                        # Shared so overlapping jobs reuse downloads
+                        cache_dir=output / "cache",
+                    ),
+                    tiles={
+                        "min_zoom": settings.get("min_zoom", 0),
+                        "max_zoom": settings.get("max_zoom", 14),
+                        # Per job, since each job cleans its temp dir when done
+                        "temp_dir": output / name / "tmp",
+                    },
+                    cache_enabled=cache_enabled,
+                    verbose=verbose,
+                )
+            )
+        except KeyError as e:
+            raise click.ClickException(f"Job '{name}' is missing {e}") from e
+        except Exception as e:
+            raise click.ClickException(f"Job '{name}' is invalid: {e}") from e
+
+    return configs
+
+
+def _prefetch_shared_downloads(configs: list["TilecraftConfig"]) -> None:
+    """
+    Download each bbox used by several jobs into the shared cache once.
+
+    Jobs running in parallel would otherwise download the same bbox at the
+    same time; with the data cached up front they all reuse it.
+
+    Args:
+        configs: Job configurations sharing one cache directory
+    """
+    from collections import Counter
+
+    from tilecraft.core.osm_downloader import OSMDownloader
+    from tilecraft.utils.cache import CacheManager
+
+    bbox_counts = Counter(config.bbox.to_string() for config in configs)
+    prefetched = set()
+    for config in configs:
+        bbox_str = config.bbox.to_string()
+        if bbox_counts[bbox_str] < 2 or bbox_str in prefetched:
+            continue
+        prefetched.add(bbox_str)
+
+        console().print(f"[blue]Downloading shared bbox {bbox_str}[/blue]")
+        cache_manager = CacheManager(config.output.cache_dir, enabled=True)
+        try:
+            OSMDownloader(config, cache_manager).download(config.bbox)
+        except Exception as e:
+            # The jobs retry the download themselves
+            console().print(f"[yellow]⚠ Shared download failed for {bbox_str}: {e}[/yellow]")
+
+
+def _run_batch_job(config: "TilecraftConfig") -> dict:
+    """
+    Run one batch job in a worker process.
+
+    Args:
+        config: Job configuration
+
+    Returns:
+        Pipeline results
+    """
+    from tilecraft.core.pipeline import TilecraftPipeline
+
+    pipeline = TilecraftPipeline(config)
+    try:
+        return pipeline.run()
+    finally:
+        pipeline.cleanup()
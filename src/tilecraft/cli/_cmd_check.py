@@ -0,0 +1,118 @@
+"""
+The check command: report on Tilecraft's system dependencies.
+"""
+
+import click
+
+from tilecraft.cli import _dumps_json, _install_traceback, console
+
+
+@click.command("check")
+@click.option("--verbose", "-v", is_flag=True, help="Show detailed dependency information")
+@click.option("--fix", is_flag=True, help="Show installation commands for missing dependencies")
+@click.option(
+    "--force-refresh",
+    is_flag=True,
+    help="Re-probe every dependency instead of reusing results from the last minute",
+)
+@click.option(
+    "--json",
+    "json_output",
+    is_flag=True,
+    help="Write the results as a JSON document instead of a table",
+)
+def check_system(verbose: bool, fix: bool, force_refresh: bool, json_output: bool):
+    """Check system dependencies and installation."""
+    from dataclasses import asdict
+
+    from tilecraft.utils.system_check import SystemVerifier
+
+    _install_traceback(show_locals=verbose)
+    
+    if not json_output:
+        console().print("🔍 [bold blue]Checking Tilecraft Dependencies[/bold blue]\n")
+    
+    verifier = SystemVerifier()
+    if force_refresh:
+        verifier.verify_all_dependencies()
+    else:
+        verifier.verify_all_dependencies_cached()
+
+    if json_output:
+        summary = verifier.get_summary()
+        click.echo(
+            _dumps_json(
+                {
+                    "dependencies": {
+                        name: asdict(result) for name, result in verifier.results.items()
+                    },
+                    "all_available": summary["all_available"],
+                    "critical_missing": summary["critical_missing"],
+                }
+            )
+        )
+        if summary["critical_missing"]:
+            raise click.exceptions.Exit(1)
+        return
+
+    from rich.table import Table
+    
+    # Create results table
+    table = Table(title="System Dependencies")
+    table.add_column("Dependency", style="bold")
+    table.add_column("Status", justify="center")
+    table.add_column("Version")
+    if verbose:
+        table.add_column("Path")
+    
+    # Single pass over the results collects the help and error sections too
+    install_help = []
+    errors = []
+    for name, result in verifier.results.items():
+        if result.available:
+            status = "[green]✅ Available[/green]"
+        else:
+            status = "[red]❌ Missing[/red]"
+            if result.installation_help:
+                install_help.append((name, result.installation_help))
+            if result.error:
+                errors.append((name, result.error))
+
+        row = [name, status, result.version or "unknown"]
+        if verbose:
+            row.append(result.path or "N/A")
+
+        table.add_row(*row)
+    
+    console().print(table)
+    
+    # Show summary
+    summary = verifier.get_summary()
+    
+    if summary["all_available"]:
+        console().print("\n🎉 [bold green]All dependencies are available![/bold green]")
+        console().print("✅ Tilecraft is ready to use.")
+    else:
+        console().print(f"\n⚠️  [yellow]{summary['missing_dependencies']} dependencies missing[/yellow]")
+        
+        if summary["critical_missing"]:
+            console().print(f"🚨 [red]Critical missing: {', '.join(summary['critical_missing'])}[/red]")
+            console().print("❌ Tilecraft will not function without these dependencies.")
+        
+        # Show installation help
+        if fix:
+            console().print("\n📋 [bold]Installation Instructions:[/bold]")
+            for name, help_text in install_help:
+                console().print(f"\n[bold]{name}:[/bold]")
+                console().print(help_text)
+    
+    # Show errors if verbose
+    if verbose and errors:
+        console().print("\n🐛 [bold red]Error Details:[/bold red]")
+        for name, error in errors:
+            console().print(f"• [red]{name}[/red]: {error}")
+    
+    # Exit with error code if critical dependencies missing
+    if summary["critical_missing"]:
+        console().print("\n💡 [yellow]Run 'tilecraft check --fix' for installation instructions[/yellow]")
+        raise click.exceptions.Exit(1)
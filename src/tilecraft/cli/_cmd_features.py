@@ -0,0 +1,111 @@
+"""
+The features command: list the OSM feature types Tilecraft can extract.
+"""
+
+from typing import Optional
+
+import click
+
+from tilecraft.cli import console
+
+# Feature type values grouped for display. Plain strings rather than
+# FeatureType members, so `tilecraft --help` (which loads every command
+# module) does not import the pydantic models
+_FEATURE_CATEGORIES = (
+    ("Water Features", (
+        "rivers", "water", "lakes", "wetlands", "waterways", "coastline",
+    )),
+    ("Natural Features", (
+        "forest", "woods", "mountains", "peaks", "cliffs", "beaches",
+        "glaciers", "volcanoes",
+    )),
+    ("Land Use", (
+        "parks", "farmland", "residential", "commercial", "industrial",
+        "military", "cemeteries",
+    )),
+    ("Transportation", (
+        "roads", "highways", "railways", "airports", "bridges", "tunnels",
+        "paths", "cycleways",
+    )),
+    ("Built Environment", (
+        "buildings", "churches", "schools", "hospitals", "universities",
+    )),
+    ("Amenities", (
+        "restaurants", "shops", "hotels", "banks", "fuel_stations", "post_offices",
+    )),
+    ("Recreation", (
+        "playgrounds", "sports_fields", "golf_courses", "stadiums", "swimming_pools",
+    )),
+    ("Infrastructure", (
+        "power_lines", "wind_turbines", "solar_farms", "dams", "barriers",
+    )),
+    ("Administrative", (
+        "boundaries", "protected_areas",
+    )),
+)
+
+# (category, value, description) rows in display order
+_FLAT = tuple(
+    (name, value, value.replace("_", " ").title())
+    for name, values in _FEATURE_CATEGORIES
+    for value in values
+)
+
+# (lowercase name, name, feature count) for matching --category
+_LOWER_CATEGORIES = tuple(
+    (name.lower(), name, len(values)) for name, values in _FEATURE_CATEGORIES
+)
+
+
+@click.command("features")
+@click.option("--category", help="Filter by category (water, natural, landuse, transportation, etc.)")
+@click.option("--search", help="Search feature names and descriptions")
+@click.option("--count", type=int, default=100, help="Number of features to show (default: 100)")
+def list_features(category: Optional[str], search: Optional[str], count: int):
+    """List all available OSM feature types that can be extracted."""
+    console().print("\n[bold blue]🗺️  Available OSM Features in Tilecraft[/bold blue]\n")
+    
+    # Filter by category if specified: the first category whose name matches
+    category_key = None
+    total = len(_FLAT)
+    if category:
+        category_lower = category.lower()
+        for lower_name, name, size in _LOWER_CATEGORIES:
+            if category_lower in lower_name:
+                category_key = name
+                total = size
+                break
+        else:
+            console().print(f"[red]Category '{category}' not found. Available categories:[/red]")
+            for lower_name, _, _ in _LOWER_CATEGORIES:
+                console().print(f"  • {lower_name}")
+            return
+    
+    # Display features in one pass, printing each category heading on first use
+    search = search.lower() if search else None
+    total_shown = 0
+    current = None
+    for cat_name, value, description in _FLAT:
+        if total_shown >= count:
+            break
+        if category_key and cat_name != category_key:
+            continue
+        if search and search not in value:
+            continue
+        
+        if cat_name != current:
+            if current is not None:
+                console().print()
+            console().print(f"[bold cyan]{cat_name}[/bold cyan]")
+            current = cat_name
+        
+        console().print(f"  • [green]{value}[/green] - {description}")
+        total_shown += 1
+    
+    if current is not None:
+        console().print()
+    
+    console().print(f"[bold]Total features available: {total}[/bold]")
+    console().print("\n[blue]Usage:[/blue]")
+    console().print("  tilecraft generate --features \"rivers,buildings,parks\" --bbox \"...\" --palette \"...\"")
+    console().print("\n[yellow]💡 Tip:[/yellow] Use --search to find specific features, --category to filter by type")
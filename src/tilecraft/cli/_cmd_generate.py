@@ -0,0 +1,582 @@
+"""
+The generate command: run the tile pipeline for one area.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import click
+
+from tilecraft.cli import _dumps_json, _install_traceback, console, print_banner
+
+if TYPE_CHECKING:
+    # Pipeline and config models pull in the geospatial and pydantic stacks;
+    # the command imports them on demand so --help stays fast
+    from tilecraft.core.pipeline import TilecraftPipeline
+    from tilecraft.models.config import BoundingBox, FeatureConfig, TilecraftConfig
+
+
+def validate_bbox(ctx, param, value):
+    """Validate bounding box syntax; generate builds the model itself."""
+    if value is None:
+        return None
+
+    # Malformed input fails here without importing the config models
+    try:
+        coords = tuple(float(part) for part in value.split(","))
+    except ValueError:
+        coords = ()
+    if len(coords) != 4:
+        raise click.BadParameter(
+            f"Invalid bounding box format: {value}. Expected 'west,south,east,north'"
+        )
+    return coords
+
+
+def validate_features(ctx, param, value):
+    """Split the features parameter; generate checks the names itself."""
+    if value is None:
+        return None
+    # Same normalization as FeatureConfig.parse_feature_types
+    return tuple(name.strip().lower() for name in value.split(","))
+
+
+def _build_bbox(ctx: click.Context, coords: tuple) -> "BoundingBox":
+    """Build the bounding box model from --bbox coordinates."""
+    from pydantic import ValidationError
+
+    from tilecraft.models.config import BoundingBox
+
+    west, south, east, north = coords
+    try:
+        return BoundingBox(west=west, south=south, east=east, north=north)
+    except ValidationError as e:
+        message = "; ".join(
+            error["msg"].removeprefix("Value error, ") for error in e.errors()
+        )
+        raise click.BadParameter(
+            f"Invalid bounding box: {message}", ctx=ctx, param_hint="'--bbox'"
+        ) from e
+
+
+@lru_cache(maxsize=None)
+def _feature_types_by_value() -> dict:
+    """Map feature type values to FeatureType members."""
+    from tilecraft.models.config import FeatureType
+
+    return {feature_type.value: feature_type for feature_type in FeatureType}
+
+
+def _build_features(ctx: click.Context, names: tuple) -> "FeatureConfig":
+    """Build the feature configuration from --features names."""
+    from tilecraft.models.config import FeatureConfig
+
+    # Checked against the known values directly so the model can be built
+    # without revalidation
+    feature_types = _feature_types_by_value()
+    invalid = [name for name in names if name not in feature_types]
+    if invalid:
+        from difflib import get_close_matches
+
+        message = f"Invalid feature types: {', '.join(map(repr, invalid))}"
+        suggestions = [
+            match
+            for name in invalid
+            for match in get_close_matches(name, feature_types, n=1)
+        ]
+        if suggestions:
+            message += f" (did you mean: {', '.join(suggestions)}?)"
+        raise click.BadParameter(message, ctx=ctx, param_hint="'--features'")
+
+    return FeatureConfig.model_construct(types=[feature_types[name] for name in names])
+
+
+@click.command("generate")
+@click.pass_context
+@click.option(
+    "--bbox",
+    required=True,
+    callback=validate_bbox,
+    help="Bounding box as 'west,south,east,north' (e.g., '-109.2,36.8,-106.8,38.5')",
+)
+@click.option(
+    "--features",
+    required=True,
+    callback=validate_features,
+    help="Comma-separated feature types (e.g., 'rivers,forest,water')",
+)
+@click.option(
+    "--palette",
+    required=True,
+    help="Style palette mood (e.g., 'subalpine dusk', 'desert sunset')",
+)
+@click.option(
+    "--output",
+    default="output",
+    type=click.Path(path_type=Path),
+    help="Output directory path (default: 'output')",
+)
+@click.option(
+    "--name",
+    default=None,
+    help="Project name for file naming (auto-generated if not provided)",
+)
+@click.option(
+    "--min-zoom",
+    default=0,
+    type=click.IntRange(0, 24),
+    help="Minimum zoom level (default: 0)",
+)
+@click.option(
+    "--max-zoom",
+    default=14,
+    type=click.IntRange(0, 24),
+    help="Maximum zoom level (default: 14)",
+)
+@click.option("--no-cache", is_flag=True, help="Disable caching (re-download OSM data)")
+@click.option("--preview", is_flag=True, help="Generate preview after tile creation")
+@click.option("--verbose", "-v", is_flag=True, help="Verbose output")
+@click.option("--quiet", "-q", is_flag=True, help="Quiet mode (minimal output)")
+@click.option(
+    "--json",
+    "json_output",
+    is_flag=True,
+    help="Write a single JSON document to stdout instead of formatted output",
+)
+def generate(
+    ctx,
+    bbox: tuple,
+    features: tuple,
+    palette: str,
+    output: Path,
+    name: Optional[str],
+    min_zoom: int,
+    max_zoom: int,
+    no_cache: bool,
+    preview: bool,
+    verbose: bool,
+    quiet: bool,
+    json_output: bool,
+):
+    """
+    Tilecraft: Streamlined CLI for OSM Vector Tile Generation
+
+    Generate beautiful vector tiles and MapLibre styles from OpenStreetMap data
+    with smart caching and optimized feature extraction.
+
+    Example:
+        tilecraft --bbox "-109.2,36.8,-106.8,38.5" --features "rivers,forest,water" --palette "subalpine dusk"
+    """
+    _install_traceback(show_locals=verbose)
+
+    bbox = _build_bbox(ctx, bbox)
+    features = _build_features(ctx, features)
+
+    # JSON mode keeps stdout for the final document only
+    quiet = quiet or json_output
+
+    if not quiet:
+        print_banner()
+
+    # Quick dependency check before starting
+    from tilecraft.utils.system_check import verify_system_dependencies_cached
+    if not verify_system_dependencies_cached():
+        if json_output:
+            # No interactive prompt when the output is meant for a program
+            raise click.ClickException(
+                "Critical dependencies missing; run 'tilecraft check --fix'"
+            )
+        console().print("[red]❌ Critical dependencies missing![/red]")
+        console().print("Run '[cyan]tilecraft check --fix[/cyan]' for installation instructions")
+        console().print("Or continue anyway with missing dependencies...")
+        
+        if not click.confirm("Continue despite missing dependencies?", default=False):
+            raise click.ClickException("Aborted. Install dependencies and try again.")
+
+    # Validate zoom levels
+    if max_zoom < min_zoom:
+        raise click.ClickException("Maximum zoom must be >= minimum zoom")
+
+    # Create configuration
+    from tilecraft.models.config import OutputConfig, PaletteConfig, TilecraftConfig
+
+    try:
+        config = TilecraftConfig(
+            bbox=bbox,
+            features=features,
+            palette=PaletteConfig(name=palette),
+            output=OutputConfig(base_dir=output, name=name),
+            tiles={"min_zoom": min_zoom, "max_zoom": max_zoom},
+            cache_enabled=not no_cache,
+            verbose=verbose,
+        )
+    except Exception as e:
+        raise click.ClickException(f"Configuration error: {e}") from e
+
+    # Display configuration summary
+    if not quiet:
+        display_config_summary(config)
+
+    # Run the pipeline
+    from tilecraft.core.pipeline import TilecraftPipeline
+
+    try:
+        pipeline = TilecraftPipeline(config)
+
+        if json_output:
+            _run_for_json(pipeline, config, preview)
+            return
+
+        if quiet:
+            # Simple progress for quiet mode
+            with console().status("[bold green]Processing..."):
+                result = pipeline.run()
+        else:
+            # Detailed progress with steps
+            result = run_with_progress(pipeline)
+
+        # Build the preview in the background while results are displayed
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            preview_future = (
+                executor.submit(_generate_preview, config, result) if preview else None
+            )
+
+            # Display results
+            if not quiet:
+                display_results(result, config)
+
+            if preview_future is not None:
+                console().print("\n[bold blue]Generating preview...[/bold blue]")
+                try:
+                    preview_path = preview_future.result()
+
+                    console().print(
+                        f"[green]✓ Preview generated: {preview_path}[/green]\n"
+                        "[blue]To view preview:\n"
+                        f"1. cd {preview_path.parent}\n"
+                        "2. python start_tile_server.py\n"
+                        "3. Open http://localhost:8080[/blue]"
+                    )
+
+                except Exception as e:
+                    console().print(f"[red]Preview generation failed: {e}[/red]")
+                    if verbose:
+                        console().print_exception()
+
+    except Exception as e:
+        # Click reports the error and exits 1; Ctrl-C is left to Click as well
+        if verbose:
+            console().print_exception()
+        raise click.ClickException(str(e)) from e
+    finally:
+        # Critical: Clean up resources to prevent hanging
+        try:
+            if 'pipeline' in locals():
+                pipeline.cleanup()
+        except Exception as cleanup_error:
+            if verbose:
+                console().print(f"[yellow]Warning: Cleanup error: {cleanup_error}[/yellow]")
+        
+        # Additional cleanup to ensure clean exit
+        try:
+            # Clean up any remaining threads
+            import threading
+            
+            # Wait a short time for any background threads to finish
+            active_threads = [t for t in threading.enumerate() if t != threading.current_thread()]
+            if active_threads:
+                if verbose:
+                    console().print(f"[yellow]Waiting for {len(active_threads)} background threads to finish...[/yellow]")
+                    for thread in active_threads:
+                        console().print(f"[yellow]  - {thread.name}: {type(thread).__name__}[/yellow]")
+            
+            # Give threads a chance to finish gracefully with timeout
+            for thread in active_threads:
+                if hasattr(thread, '_stop_event'):
+                    thread._stop_event.set()
+            
+            # Wait up to 2 seconds for threads to finish
+            import time
+            max_wait = 2.0
+            wait_step = 0.1
+            elapsed = 0
+            while elapsed < max_wait:
+                remaining_threads = [t for t in threading.enumerate() if t != threading.current_thread() and t.is_alive()]
+                if not remaining_threads:
+                    break
+                time.sleep(wait_step)
+                elapsed += wait_step
+            
+            # Log remaining threads if any
+            if remaining_threads and verbose:
+                console().print(f"[yellow]Warning: {len(remaining_threads)} threads still running after cleanup[/yellow]")
+            
+            # Force cleanup of stubborn threads (last resort)
+            if remaining_threads:
+                for thread in remaining_threads:
+                    if hasattr(thread, '_stop'):
+                        thread._stop()
+                    # Set daemon flag to prevent hanging
+                    thread.daemon = True
+            
+            # pipeline.cleanup() releases resources deterministically; a full
+            # collection is only worth its heap walk when hunting a leak
+            if verbose and os.environ.get("TILECRAFT_DEBUG_GC"):
+                import gc
+                console().print(f"[yellow]gc.collect() freed {gc.collect()} objects[/yellow]")
+            
+            # Final asyncio cleanup
+            try:
+                import asyncio
+                loop_policy = asyncio.get_event_loop_policy()
+                if hasattr(loop_policy, '_local'):
+                    loop_policy._local = None
+                if verbose:
+                    console().print("[green]Asyncio cleanup completed[/green]")
+            except Exception:
+                pass  # Ignore asyncio cleanup errors
+                
+        except Exception as final_cleanup_error:
+            if verbose:
+                console().print(f"[yellow]Warning: Final cleanup error: {final_cleanup_error}[/yellow]")
+        
+        # Ensure all output is flushed before exit
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except Exception:
+            pass
+
+
+def _run_for_json(
+    pipeline: "TilecraftPipeline", config: "TilecraftConfig", preview: bool
+) -> None:
+    """
+    Run the pipeline and write its results as one JSON document to stdout.
+
+    Anything the pipeline components draw (download and extraction progress,
+    log output) is redirected to stderr so stdout stays parseable.
+
+    Args:
+        pipeline: Pipeline to run
+        config: Run configuration
+        preview: Whether to generate the HTML preview
+    """
+    import contextlib
+
+    stdout = sys.stdout
+    preview_path = None
+    with contextlib.redirect_stdout(sys.stderr):
+        result = pipeline.run()
+        if preview:
+            try:
+                preview_path = _generate_preview(config, result)
+            except Exception as e:
+                click.echo(f"Preview generation failed: {e}", err=True)
+
+    click.echo(
+        _dumps_json(
+            {
+                "config": config.model_dump(mode="json"),
+                "result": result,
+                "preview": preview_path,
+            }
+        ),
+        file=stdout,
+    )
+
+
+def _generate_preview(config: "TilecraftConfig", result: dict) -> Path:
+    """
+    Generate the HTML preview for a finished pipeline run.
+
+    Args:
+        config: Run configuration
+        result: Pipeline results with tiles and style paths
+
+    Returns:
+        Path to the preview HTML file
+    """
+    from tilecraft.utils.preview import PreviewGenerator
+
+    preview_generator = PreviewGenerator(config.output.base_dir / "preview")
+    return preview_generator.generate_html_preview(
+        result["tiles"], result["style"], config.bbox
+    )
+
+
+def display_config_summary(config: "TilecraftConfig"):
+    """Display configuration summary table."""
+    if not config.verbose:
+        # One plain line; the full table is only worth rendering for -v
+        console().print(
+            f"Config: bbox={config.bbox.to_string()}"
+            f" features={','.join(f.value for f in config.features.types)}"
+            f" palette={config.palette.name}"
+            f" zoom={config.tiles.min_zoom}-{config.tiles.max_zoom}"
+            f" output={config.output.base_dir}"
+            f" cache={'on' if config.cache_enabled else 'off'}",
+            markup=False,
+            highlight=False,
+            soft_wrap=True,
+        )
+        return
+
+    from rich.table import Table
+
+    table = Table(title="Configuration", style="cyan")
+    table.add_column("Setting", style="bold")
+    table.add_column("Value")
+
+    table.add_row("Bounding Box", config.bbox.to_string())
+    table.add_row("Features", config.features.display_string)
+    table.add_row("Palette", config.palette.name)
+    table.add_row("Output Directory", str(config.output.base_dir))
+    table.add_row("Zoom Levels", f"{config.tiles.min_zoom} - {config.tiles.max_zoom}")
+    table.add_row("Cache Enabled", "Yes" if config.cache_enabled else "No")
+
+    console().print("\n")
+    console().print(table)
+    console().print()
+
+
+# Pipeline steps in display order: name -> (description, result key,
+# pipeline method, result keys of the method's arguments)
+_PIPELINE_STEPS = {
+    "download": ("Downloading OSM data", "osm_data", "download_osm_data", ()),
+    "extract": ("Extracting features", "features", "extract_features", ("osm_data",)),
+    "schema": ("Generating AI schema", "schema", "generate_schema", ()),
+    "tiles": ("Creating vector tiles", "tiles", "generate_tiles", ("features",)),
+    "style": ("Generating style", "style", "generate_style", ("schema",)),
+}
+
+
+def run_with_progress(pipeline: "TilecraftPipeline"):
+    """Run pipeline with detailed progress display."""
+    if not sys.stdout.isatty():
+        # Redirected output (CI, log files): one plain line per finished step
+        # instead of a live display refreshed from a background thread
+        import time
+
+        def run_step(step_name, func, *args):
+            description = _PIPELINE_STEPS[step_name][0]
+            start = time.perf_counter()
+            try:
+                value = func(*args)
+            except Exception:
+                elapsed = time.perf_counter() - start
+                print(f"[{elapsed:.1f}s] {description} - Failed", file=sys.stderr)
+                raise
+            elapsed = time.perf_counter() - start
+            print(f"[{elapsed:.1f}s] {description}", file=sys.stderr)
+            return value
+
+        return _run_pipeline_steps(pipeline, run_step)
+
+    # One status line naming the running steps (schema and style overlap the
+    # data steps) and a check mark per finished step, instead of a Progress
+    # table of five spinner tasks
+    import threading
+
+    running = {}
+    lock = threading.Lock()
+
+    with console().status("[bold green]Processing...") as status:
+
+        def set_running(step_name, description=None):
+            with lock:
+                if description is None:
+                    del running[step_name]
+                else:
+                    running[step_name] = description
+                status.update(f"[bold green]{', '.join(running.values()) or 'Processing'}...")
+
+        def run_step(step_name, func, *args):
+            description = _PIPELINE_STEPS[step_name][0]
+            set_running(step_name, description)
+            try:
+                value = func(*args)
+            except Exception:
+                console().print(f"[red]✗ {description} - Failed[/red]")
+                raise
+            finally:
+                set_running(step_name)
+            console().print(f"[green]✓[/green] {description}")
+            return value
+
+        return _run_pipeline_steps(pipeline, run_step)
+
+
+def _run_pipeline_steps(pipeline: "TilecraftPipeline", run_step) -> dict:
+    """
+    Run the pipeline steps, reporting each through run_step.
+
+    Args:
+        pipeline: Pipeline to run
+        run_step: Callable taking a step name, a function and its arguments
+
+    Returns:
+        Pipeline results keyed like TilecraftPipeline.run
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    result = {}
+
+    def run(*step_names):
+        for step_name in step_names:
+            _, result_key, method, input_keys = _PIPELINE_STEPS[step_name]
+            args = [result[key] for key in input_keys]
+            result[result_key] = run_step(step_name, getattr(pipeline, method), *args)
+
+    # Schema and style depend only on the configuration, so they run in
+    # the background while OSM data is downloaded, extracted and tiled
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        schema_and_style = executor.submit(run, "schema", "style")
+        for step_name in ("download", "extract", "tiles"):
+            # A schema or style failure aborts before the next data step
+            if schema_and_style.done():
+                schema_and_style.result()
+            run(step_name)
+        schema_and_style.result()
+
+    # Same key order as TilecraftPipeline.run regardless of completion order
+    return {
+        result_key: result[result_key]
+        for _, result_key, *_ in _PIPELINE_STEPS.values()
+    }
+
+
+# Static part of the results panel; only the paths around it vary per run
+_RESULTS_TREE = """├── tiles/        Vector tiles (.mbtiles)
+├── styles/       MapLibre style JSON
+├── data/         Extracted GeoJSON files
+└── cache/        Cached OSM data"""
+
+
+def display_results(result, config: "TilecraftConfig"):
+    """Display processing results."""
+    from rich.panel import Panel
+
+    console().print("\n[bold green]✓ Processing completed successfully![/bold green]")
+
+    # Create results panel
+    output = config.output
+    results_text = (
+        f"Output Directory: {output.base_dir}\n{_RESULTS_TREE}\n\n"
+        f"Files generated:\n"
+        f"• Vector tiles: {output.tiles_dir}\n"
+        f"• Style JSON: {output.styles_dir}\n"
+        f"• Feature data: {output.data_dir}"
+    )
+
+    panel = Panel(
+        results_text,
+        title="[bold green]Results[/bold green]",
+        border_style="green",
+    )
+    console().print(panel)
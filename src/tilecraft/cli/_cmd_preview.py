@@ -0,0 +1,87 @@
+"""
+The preview command: build an HTML preview for existing tiles.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from tilecraft.cli import console
+
+
+@click.command("preview")
+@click.argument("mbtiles_path", type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--output",
+    default="preview",
+    type=click.Path(path_type=Path),
+    help="Output directory for preview files (default: 'preview')",
+)
+@click.option(
+    "--name", 
+    help="Custom name for the preview (default: derived from mbtiles filename)"
+)
+@click.option("--verbose", "-v", is_flag=True, help="Verbose output")
+def preview_tiles(mbtiles_path: Path, output: Path, name: Optional[str], verbose: bool):
+    """
+    Generate an interactive preview for existing MBTiles.
+    
+    Creates a complete preview package with tileserver-gl-light configuration,
+    HTML viewer, and setup instructions for any existing .mbtiles file.
+    
+    MBTILES_PATH: Path to the .mbtiles file to preview
+    
+    Example:
+        tilecraft preview output/cache/co_power_lines.mbtiles
+        tilecraft preview output/cache/co_power_lines.mbtiles --output my-preview
+    """
+    if not mbtiles_path.suffix.lower() == '.mbtiles':
+        raise click.ClickException(f"File must be a .mbtiles file, got: {mbtiles_path}")
+    
+    console().print(f"[bold blue]🗺️  Generating preview for {mbtiles_path.name}[/bold blue]\n")
+    
+    try:
+        from tilecraft.utils.preview import PreviewGenerator
+        
+        # Create output directory
+        output.mkdir(parents=True, exist_ok=True)
+        
+        # Initialize preview generator
+        preview_generator = PreviewGenerator(output)
+        
+        # Generate preview (no style path needed for standalone preview)
+        with console().status("[bold green]Generating preview files..."):
+            preview_path = preview_generator.generate_html_preview(
+                mbtiles_path, None, None  # bbox will be extracted from mbtiles
+            )
+        
+        # Display results
+        console().print(f"[green]✓ Preview generated successfully![/green]\n")
+        
+        # Show file structure and viewing instructions in one render
+        lines = ["[bold]Files created:[/bold]"]
+        for file_path in sorted(output.iterdir()):
+            if file_path.is_file():
+                lines.append(f"  📄 {file_path.name}")
+            elif file_path.is_dir():
+                lines.append(f"  📁 {file_path.name}/")
+        lines += [
+            "\n[bold blue]To view your tiles:[/bold blue]",
+            "[cyan]1. Install tileserver-gl-light:[/cyan]",
+            "   npm install -g tileserver-gl-light",
+            "\n[cyan]2. Start the tile server:[/cyan]",
+            f"   tileserver-gl-light {mbtiles_path.absolute()}",
+            "\n[cyan]3. Open the preview:[/cyan]",
+            f"   open {preview_path}",
+            f"   (or open {preview_path} in your browser)",
+            f"\n[green]🎉 Preview ready at: {output.absolute()}[/green]",
+        ]
+        console().print("\n".join(lines))
+        
+    except ImportError as e:
+        raise click.ClickException("Preview functionality not available") from e
+    except Exception as e:
+        if verbose:
+            console().print_exception()
+        raise click.ClickException(f"Error generating preview: {e}") from e
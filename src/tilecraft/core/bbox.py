@@ -2,10 +2,303 @@
 Bounding box utilities for OSM data processing.
 """
 
+import logging
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 from tilecraft.models.config import BoundingBox
 
+logger = logging.getLogger(__name__)
+
+# Comprehensive mapping of feature types to Overpass tag filters:
+# (element, key, values[, extra filters]); empty values match any value
+_FEATURE_QUERIES: dict[str, tuple[tuple, ...]] = {
+    # Water Features
+    "rivers": (
+        ("way", "waterway", (
+            "river", "stream", "canal", "drain", "ditch", "waterfall",
+        )),
+    ),
+    "water": (
+        ("way", "natural", ("water",)),
+        ("way", "landuse", ("reservoir", "basin")),
+    ),
+    "lakes": (
+        ("way", "natural", ("water",), '["water"~"^(lake|pond|lagoon)$"]'),
+        ("way", "natural", ("water",), '[!waterway]'),
+    ),
+    "wetlands": (
+        ("way", "natural", ("wetland", "marsh", "swamp")),
+    ),
+    "waterways": (
+        ("way", "waterway", (
+            "river", "stream", "canal", "drain", "ditch", "rapids", "waterfall",
+        )),
+    ),
+    "coastline": (
+        ("way", "natural", ("coastline", "beach", "bay")),
+    ),
+
+    # Natural Features
+    "forest": (
+        ("way", "natural", ("wood", "forest", "scrub")),
+        ("way", "landuse", ("forest", "forestry")),
+    ),
+    "woods": (
+        ("way", "natural", ("wood", "forest")),
+    ),
+    "mountains": (
+        ("node", "natural", ("peak", "ridge", "saddle", "volcano")),
+        ("way", "natural", ("peak", "ridge", "saddle", "volcano")),
+    ),
+    "peaks": (
+        ("node", "natural", ("peak", "volcano")),
+        ("way", "natural", ("peak", "volcano")),
+    ),
+    "cliffs": (
+        ("way", "natural", ("cliff", "rock", "scree", "stone")),
+    ),
+    "beaches": (
+        ("way", "natural", ("beach", "sand", "shingle")),
+    ),
+    "glaciers": (
+        ("way", "natural", ("glacier",)),
+    ),
+    "volcanoes": (
+        ("node", "natural", ("volcano",)),
+        ("way", "natural", ("volcano",)),
+    ),
+
+    # Land Use
+    "parks": (
+        ("way", "leisure", (
+            "park", "nature_reserve", "recreation_ground", "garden",
+        )),
+        ("way", "boundary", ("national_park", "protected_area")),
+    ),
+    "farmland": (
+        ("way", "landuse", (
+            "farmland", "orchard", "vineyard", "plant_nursery",
+            "greenhouse_horticulture",
+        )),
+    ),
+    "residential": (
+        ("way", "landuse", ("residential",)),
+    ),
+    "commercial": (
+        ("way", "landuse", ("commercial", "retail")),
+    ),
+    "industrial": (
+        ("way", "landuse", ("industrial", "port", "quarry")),
+    ),
+    "military": (
+        ("way", "landuse", ("military",)),
+        ("way", "military", ()),
+    ),
+    "cemeteries": (
+        ("way", "landuse", ("cemetery",)),
+        ("way", "amenity", ("grave_yard",)),
+    ),
+
+    # Transportation
+    "roads": (
+        ("way", "highway", (
+            "motorway", "trunk", "primary", "secondary", "tertiary", "unclassified",
+            "residential", "service", "track",
+        )),
+    ),
+    "highways": (
+        ("way", "highway", ("motorway", "motorway_link", "trunk", "trunk_link")),
+    ),
+    "railways": (
+        ("way", "railway", (
+            "rail", "tram", "light_rail", "subway", "monorail", "narrow_gauge",
+            "abandoned",
+        )),
+    ),
+    "airports": (
+        ("way", "aeroway", (
+            "aerodrome", "runway", "taxiway", "terminal", "gate", "apron",
+        )),
+        ("node", "aeroway", ("aerodrome", "gate")),
+    ),
+    "bridges": (
+        ("way", "bridge", ("yes",)),
+        ("way", "man_made", ("bridge",)),
+    ),
+    "tunnels": (
+        ("way", "tunnel", ("yes",)),
+        ("way", "man_made", ("tunnel",)),
+    ),
+    "paths": (
+        ("way", "highway", ("path", "footway", "cycleway", "bridleway", "steps")),
+    ),
+    "cycleways": (
+        ("way", "highway", ("cycleway",)),
+        ("way", "cycleway", ()),
+    ),
+
+    # Built Environment
+    "buildings": (
+        ("way", "building", ()),
+    ),
+    "churches": (
+        ("way", "building", ("church", "cathedral", "chapel")),
+        ("way", "amenity", ("place_of_worship",)),
+        ("node", "amenity", ("place_of_worship",)),
+    ),
+    "schools": (
+        ("way", "building", ("school",)),
+        ("way", "amenity", ("school", "kindergarten", "university", "college")),
+        ("node", "amenity", ("school", "kindergarten", "university", "college")),
+    ),
+    "hospitals": (
+        ("way", "building", ("hospital",)),
+        ("way", "amenity", ("hospital", "clinic", "doctors")),
+        ("node", "amenity", ("hospital", "clinic", "doctors")),
+    ),
+    "universities": (
+        ("way", "building", ("university", "college")),
+        ("way", "amenity", ("university", "college")),
+        ("node", "amenity", ("university", "college")),
+    ),
+
+    # Amenities
+    "restaurants": (
+        ("way", "amenity", (
+            "restaurant", "fast_food", "cafe", "bar", "pub", "food_court",
+        )),
+        ("node", "amenity", (
+            "restaurant", "fast_food", "cafe", "bar", "pub", "food_court",
+        )),
+    ),
+    "shops": (
+        ("way", "shop", ()),
+        ("way", "building", ("retail", "shop")),
+        ("way", "amenity", ("marketplace",)),
+        ("node", "shop", ()),
+        ("node", "amenity", ("marketplace",)),
+    ),
+    "hotels": (
+        ("way", "tourism", ("hotel", "motel", "hostel", "guest_house")),
+        ("way", "building", ("hotel",)),
+        ("node", "tourism", ("hotel", "motel", "hostel", "guest_house")),
+    ),
+    "banks": (
+        ("way", "amenity", ("bank", "atm")),
+        ("way", "building", ("bank",)),
+        ("node", "amenity", ("bank", "atm")),
+    ),
+    "fuel_stations": (
+        ("way", "amenity", ("fuel",)),
+        ("way", "building", ("fuel",)),
+        ("node", "amenity", ("fuel",)),
+    ),
+    "post_offices": (
+        ("way", "amenity", ("post_office",)),
+        ("way", "building", ("post_office",)),
+        ("node", "amenity", ("post_office",)),
+    ),
+
+    # Recreation
+    "playgrounds": (
+        ("way", "leisure", ("playground",)),
+        ("node", "leisure", ("playground",)),
+    ),
+    "sports_fields": (
+        ("way", "leisure", ("sports_centre", "stadium", "pitch")),
+        ("way", "sport", ()),
+        ("node", "leisure", ("sports_centre", "stadium")),
+    ),
+    "golf_courses": (
+        ("way", "leisure", ("golf_course",)),
+        ("way", "sport", ("golf",)),
+    ),
+    "stadiums": (
+        ("way", "leisure", ("stadium",)),
+        ("way", "building", ("stadium",)),
+        ("node", "leisure", ("stadium",)),
+    ),
+    "swimming_pools": (
+        ("way", "leisure", ("swimming_pool",)),
+        ("way", "amenity", ("swimming_pool",)),
+        ("node", "amenity", ("swimming_pool",)),
+    ),
+
+    # Infrastructure
+    "power_lines": (
+        ("way", "power", ("line", "cable", "transmission", "substation")),
+        ("way", "man_made", ("transmission_line",)),
+        ("node", "power", ("substation", "tower")),
+    ),
+    "wind_turbines": (
+        ("way", "generator:source", ("wind",)),
+        ("way", "man_made", ("wind_turbine",)),
+        ("node", "man_made", ("wind_turbine",)),
+    ),
+    "solar_farms": (
+        ("way", "generator:source", ("solar",)),
+        ("way", "man_made", ("solar_panel",)),
+        ("way", "landuse", ("industrial",), '["generator:source"="solar"]'),
+        ("node", "man_made", ("solar_panel",)),
+    ),
+    "dams": (
+        ("way", "waterway", ("dam",)),
+        ("way", "man_made", ("dam",)),
+        ("node", "waterway", ("dam",)),
+    ),
+    "barriers": (
+        ("way", "barrier", (
+            "wall", "fence", "hedge", "retaining_wall", "city_wall",
+        )),
+    ),
+
+    # Administrative
+    "boundaries": (
+        ("way", "boundary", ("administrative", "political", "postal_code")),
+    ),
+    "protected_areas": (
+        ("way", "boundary", ("protected_area", "national_park")),
+        ("way", "leisure", ("nature_reserve",)),
+    ),
+}
+
+_FEATURE_NAMES = frozenset(_FEATURE_QUERIES)
+_AVAILABLE_FEATURES = tuple(sorted(_FEATURE_NAMES))
+
+# Osmium .poly file for a bbox: a single closed ring through its corners
+_POLY_TEMPLATE = """polygon
+1
+  {w}  {s}
+  {w}  {n}
+  {e}  {n}
+  {e}  {s}
+  {w}  {s}
+END
+END
+"""
+
+# Directories bbox_to_poly has already created in this process
+_ensured_dirs: set[Path] = set()
+
+# Minimal query for requests without any known feature type
+_EMPTY_QUERY = """[out:xml][timeout:300];
+(
+  // No valid feature types provided
+);
+out geom;
+"""
+
+# Output format for id-only queries: one "type<TAB>id" line per element
+_ID_OUTPUT_FORMAT = "csv(::type,::id;false)"
+
+# Area thresholds in square degrees and the zoom used up to each of them;
+# anything larger than the last threshold gets the final zoom
+_ZOOM_THRESHOLDS = (0.1, 1.0, 10.0)
+_ZOOM_VALUES = (14, 12, 10, 8)
+
 
 def validate_bbox(bbox: BoundingBox) -> bool:
     """
@@ -20,14 +313,8 @@ def validate_bbox(bbox: BoundingBox) -> bool:
     # Basic coordinate validation is handled by Pydantic
     # Additional validation can be added here
 
-    # Check if area is reasonable (not too large or too small)
-    area = bbox.area_degrees
-    if area > 100:  # More than 100 square degrees
-        return False
-    if area < 0.0001:  # Less than 0.0001 square degrees
-        return False
-
-    return True
+    # Check if area is reasonable: between 0.0001 and 100 square degrees
+    return 0.0001 <= bbox.area_degrees <= 100
 
 
 def bbox_to_poly(bbox: BoundingBox, output_path: Path) -> Path:
@@ -41,305 +328,232 @@ def bbox_to_poly(bbox: BoundingBox, output_path: Path) -> Path:
     Returns:
         Path to created .poly file
     """
-    poly_content = f"""polygon
-1
-  {bbox.west}  {bbox.south}
-  {bbox.west}  {bbox.north}
-  {bbox.east}  {bbox.north}
-  {bbox.east}  {bbox.south}
-  {bbox.west}  {bbox.south}
-END
-END
-"""
+    poly_content = _POLY_TEMPLATE.format(
+        w=bbox.west, s=bbox.south, e=bbox.east, n=bbox.north
+    )
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write(poly_content)
+    parent = output_path.parent
+    if parent not in _ensured_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(parent)
+    try:
+        output_path.write_text(poly_content, encoding="ascii")
+    except FileNotFoundError:
+        # The directory was removed since it was created; recreate it once
+        _ensured_dirs.discard(parent)
+        parent.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(parent)
+        output_path.write_text(poly_content, encoding="ascii")
 
     return output_path
 
 
-def bbox_to_overpass_query(bbox: BoundingBox, feature_types: list[str]) -> str:
+def _tag_filter(key: str, values: Optional[set[str]]) -> str:
+    """
+    Render an Overpass tag filter.
+
+    Args:
+        key: OSM tag key
+        values: Accepted tag values, or None to accept any value
+
+    Returns:
+        Overpass QL tag filter
+    """
+    if not values:
+        return f'["{key}"]'
+    if len(values) == 1:
+        return f'["{key}"="{next(iter(values))}"]'
+    return f'["{key}"~"^({"|".join(sorted(values))})$"]'
+
+
+def bbox_to_overpass_query(
+    bbox: BoundingBox, feature_types: list[str], include_metadata: bool = False
+) -> str:
     """
     Generate Overpass API query for bounding box and features.
 
     Args:
         bbox: Bounding box for query
         feature_types: List of feature types to query
+        include_metadata: Also request element metadata (version, timestamp,
+            changeset, user), which extraction does not use and which
+            substantially enlarges the response
 
     Returns:
         Overpass QL query string
     """
-    # Comprehensive mapping of feature types to Overpass queries
-    feature_queries = {
-        # Water Features
-        "rivers": [
-            'way["waterway"~"^(river|stream|canal|drain|ditch|waterfall)$"]'
-        ],
-        "water": [
-            'way["natural"="water"]',
-            'way["landuse"~"^(reservoir|basin)$"]'
-        ],
-        "lakes": [
-            'way["natural"="water"]["water"~"^(lake|pond|lagoon)$"]',
-            'way["natural"="water"][!waterway]'
-        ],
-        "wetlands": [
-            'way["natural"~"^(wetland|marsh|swamp)$"]'
-        ],
-        "waterways": [
-            'way["waterway"~"^(river|stream|canal|drain|ditch|rapids|waterfall)$"]'
-        ],
-        "coastline": [
-            'way["natural"~"^(coastline|beach|bay)$"]'
-        ],
-        
-        # Natural Features
-        "forest": [
-            'way["natural"~"^(wood|forest|scrub)$"]',
-            'way["landuse"~"^(forest|forestry)$"]'
-        ],
-        "woods": [
-            'way["natural"~"^(wood|forest)$"]'
-        ],
-        "mountains": [
-            'node["natural"~"^(peak|ridge|saddle|volcano)$"]',
-            'way["natural"~"^(peak|ridge|saddle|volcano)$"]'
-        ],
-        "peaks": [
-            'node["natural"~"^(peak|volcano)$"]',
-            'way["natural"~"^(peak|volcano)$"]'
-        ],
-        "cliffs": [
-            'way["natural"~"^(cliff|rock|scree|stone)$"]'
-        ],
-        "beaches": [
-            'way["natural"~"^(beach|sand|shingle)$"]'
-        ],
-        "glaciers": [
-            'way["natural"="glacier"]'
-        ],
-        "volcanoes": [
-            'node["natural"="volcano"]',
-            'way["natural"="volcano"]'
-        ],
-        
-        # Land Use
-        "parks": [
-            'way["leisure"~"^(park|nature_reserve|recreation_ground|garden)$"]',
-            'way["boundary"~"^(national_park|protected_area)$"]'
-        ],
-        "farmland": [
-            'way["landuse"~"^(farmland|orchard|vineyard|plant_nursery|greenhouse_horticulture)$"]'
-        ],
-        "residential": [
-            'way["landuse"="residential"]'
-        ],
-        "commercial": [
-            'way["landuse"~"^(commercial|retail)$"]'
-        ],
-        "industrial": [
-            'way["landuse"~"^(industrial|port|quarry)$"]'
-        ],
-        "military": [
-            'way["landuse"="military"]',
-            'way["military"]'
-        ],
-        "cemeteries": [
-            'way["landuse"="cemetery"]',
-            'way["amenity"="grave_yard"]'
-        ],
-        
-        # Transportation
-        "roads": [
-            'way["highway"~"^(motorway|trunk|primary|secondary|tertiary|unclassified|residential|service|track)$"]'
-        ],
-        "highways": [
-            'way["highway"~"^(motorway|motorway_link|trunk|trunk_link)$"]'
-        ],
-        "railways": [
-            'way["railway"~"^(rail|tram|light_rail|subway|monorail|narrow_gauge|abandoned)$"]'
-        ],
-        "airports": [
-            'way["aeroway"~"^(aerodrome|runway|taxiway|terminal|gate|apron)$"]',
-            'node["aeroway"~"^(aerodrome|gate)$"]'
-        ],
-        "bridges": [
-            'way["bridge"="yes"]',
-            'way["man_made"="bridge"]'
-        ],
-        "tunnels": [
-            'way["tunnel"="yes"]',
-            'way["man_made"="tunnel"]'
-        ],
-        "paths": [
-            'way["highway"~"^(path|footway|cycleway|bridleway|steps)$"]'
-        ],
-        "cycleways": [
-            'way["highway"="cycleway"]',
-            'way["cycleway"]'
-        ],
-        
-        # Built Environment
-        "buildings": [
-            'way["building"]'
-        ],
-        "churches": [
-            'way["building"~"^(church|cathedral|chapel)$"]',
-            'way["amenity"="place_of_worship"]',
-            'node["amenity"="place_of_worship"]'
-        ],
-        "schools": [
-            'way["building"="school"]',
-            'way["amenity"~"^(school|kindergarten|university|college)$"]',
-            'node["amenity"~"^(school|kindergarten|university|college)$"]'
-        ],
-        "hospitals": [
-            'way["building"="hospital"]',
-            'way["amenity"~"^(hospital|clinic|doctors)$"]',
-            'node["amenity"~"^(hospital|clinic|doctors)$"]'
-        ],
-        "universities": [
-            'way["building"~"^(university|college)$"]',
-            'way["amenity"~"^(university|college)$"]',
-            'node["amenity"~"^(university|college)$"]'
-        ],
-        
-        # Amenities
-        "restaurants": [
-            'way["amenity"~"^(restaurant|fast_food|cafe|bar|pub|food_court)$"]',
-            'node["amenity"~"^(restaurant|fast_food|cafe|bar|pub|food_court)$"]'
-        ],
-        "shops": [
-            'way["shop"]',
-            'way["building"~"^(retail|shop)$"]',
-            'way["amenity"="marketplace"]',
-            'node["shop"]',
-            'node["amenity"="marketplace"]'
-        ],
-        "hotels": [
-            'way["tourism"~"^(hotel|motel|hostel|guest_house)$"]',
-            'way["building"="hotel"]',
-            'node["tourism"~"^(hotel|motel|hostel|guest_house)$"]'
-        ],
-        "banks": [
-            'way["amenity"~"^(bank|atm)$"]',
-            'way["building"="bank"]',
-            'node["amenity"~"^(bank|atm)$"]'
-        ],
-        "fuel_stations": [
-            'way["amenity"="fuel"]',
-            'way["building"="fuel"]',
-            'node["amenity"="fuel"]'
-        ],
-        "post_offices": [
-            'way["amenity"="post_office"]',
-            'way["building"="post_office"]',
-            'node["amenity"="post_office"]'
-        ],
-        
-        # Recreation
-        "playgrounds": [
-            'way["leisure"="playground"]',
-            'node["leisure"="playground"]'
-        ],
-        "sports_fields": [
-            'way["leisure"~"^(sports_centre|stadium|pitch)$"]',
-            'way["sport"]',
-            'node["leisure"~"^(sports_centre|stadium)$"]'
-        ],
-        "golf_courses": [
-            'way["leisure"="golf_course"]',
-            'way["sport"="golf"]'
-        ],
-        "stadiums": [
-            'way["leisure"="stadium"]',
-            'way["building"="stadium"]',
-            'node["leisure"="stadium"]'
-        ],
-        "swimming_pools": [
-            'way["leisure"="swimming_pool"]',
-            'way["amenity"="swimming_pool"]',
-            'node["amenity"="swimming_pool"]'
-        ],
-        
-        # Infrastructure
-        "power_lines": [
-            'way["power"~"^(line|cable|transmission|substation)$"]',
-            'way["man_made"="transmission_line"]',
-            'node["power"~"^(substation|tower)$"]'
-        ],
-        "wind_turbines": [
-            'way["generator:source"="wind"]',
-            'way["man_made"="wind_turbine"]',
-            'node["man_made"="wind_turbine"]'
-        ],
-        "solar_farms": [
-            'way["generator:source"="solar"]',
-            'way["man_made"="solar_panel"]',
-            'way["landuse"="industrial"]["generator:source"="solar"]',
-            'node["man_made"="solar_panel"]'
-        ],
-        "dams": [
-            'way["waterway"="dam"]',
-            'way["man_made"="dam"]',
-            'node["waterway"="dam"]'
-        ],
-        "barriers": [
-            'way["barrier"~"^(wall|fence|hedge|retaining_wall|city_wall)$"]'
-        ],
-        
-        # Administrative
-        "boundaries": [
-            'way["boundary"~"^(administrative|political|postal_code)$"]'
-        ],
-        "protected_areas": [
-            'way["boundary"~"^(protected_area|national_park)$"]',
-            'way["leisure"="nature_reserve"]'
-        ]
-    }
+    if not feature_types:
+        return _EMPTY_QUERY
     
-    # Collect all queries for requested feature types
-    all_queries = []
-    unrecognized_features = []
+    return _build_overpass_query(
+        bbox.south,
+        bbox.west,
+        bbox.north,
+        bbox.east,
+        _recognized_features(feature_types),
+        "xml",
+        "meta geom" if include_metadata else "geom",
+    )
+
+
+def bbox_to_overpass_id_query(bbox: BoundingBox, feature_types: list[str]) -> str:
+    """
+    Generate an Overpass query selecting only the ids of matching elements.
+
+    The response has one tab-separated "type id" line per element; the
+    geometry is then fetched in batches with ids_to_overpass_geom_query.
+
+    Args:
+        bbox: Bounding box for query
+        feature_types: List of feature types to query
+
+    Returns:
+        Overpass QL query string
+    """
+    if not feature_types:
+        return _EMPTY_QUERY
     
-    for feature_type in feature_types:
-        if feature_type in feature_queries:
-            all_queries.extend(feature_queries[feature_type])
-        else:
-            unrecognized_features.append(feature_type)
+    return _build_overpass_query(
+        bbox.south,
+        bbox.west,
+        bbox.north,
+        bbox.east,
+        _recognized_features(feature_types),
+        _ID_OUTPUT_FORMAT,
+        "ids",
+    )
+
+
+def ids_to_overpass_geom_query(element: str, ids: Iterable[int]) -> str:
+    """
+    Generate an Overpass query fetching geometry for elements by id.
+
+    Args:
+        element: Element type (node, way or relation)
+        ids: Element ids
+
+    Returns:
+        Overpass QL query string
+    """
+    id_list = ",".join(map(str, ids))
+    return f"[out:xml][timeout:300];\n{element}(id:{id_list});\nout geom;\n"
+
+
+def _recognized_features(feature_types: list[str]) -> tuple[str, ...]:
+    """
+    Log unrecognized feature types and return the recognized ones.
+
+    Args:
+        feature_types: Requested feature types
+
+    Returns:
+        Sorted, unique feature types present in _FEATURE_QUERIES, so that
+        equivalent requests share a cache entry
+    """
+    unrecognized_features = [
+        feature_type for feature_type in feature_types if feature_type not in _FEATURE_NAMES
+    ]
     
     # Log warning for unrecognized features
     if unrecognized_features:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"Unrecognized feature types (no Overpass query available): {unrecognized_features}")
-        logger.info(f"Available feature types: {sorted(feature_queries.keys())}")
+        logger.warning(
+            "Unrecognized feature types (no Overpass query available): %s",
+            unrecognized_features,
+        )
+        logger.info("Available feature types: %s", ", ".join(_AVAILABLE_FEATURES))
+    
+    return tuple(sorted(_FEATURE_NAMES.intersection(feature_types)))
+
+
+@lru_cache(maxsize=256)
+def _build_overpass_query(
+    south: float,
+    west: float,
+    north: float,
+    east: float,
+    feature_types: tuple[str, ...],
+    output_format: str,
+    out: str,
+) -> str:
+    """
+    Build the Overpass query for known feature types.
+
+    Args:
+        south: Southern latitude
+        west: Western longitude
+        north: Northern latitude
+        east: Eastern longitude
+        feature_types: Sorted, unique feature types present in _FEATURE_QUERIES
+        output_format: Overpass output format setting, e.g. "xml"
+        out: Verbosity of the out statement, e.g. "geom" or "ids"
+
+    Returns:
+        Overpass QL query string
+    """
+    if len(feature_types) == 1:
+        body = _SINGLE_FEATURE_BODIES[feature_types[0]]
+    else:
+        body = _statements_body(feature_types)
     
     # If no valid queries, return minimal query to avoid empty results
-    if not all_queries:
-        return f"""[out:xml][timeout:300];
-(
-  // No valid feature types provided
-);
-out geom;
-"""
+    if not body:
+        return _EMPTY_QUERY
     
-    # Build complete query
-    bbox_str = f"{bbox.south},{bbox.west},{bbox.north},{bbox.east}"
+    # Build complete query; the global bbox setting applies to every statement
+    header = f"[out:{output_format}][timeout:300][bbox:{south},{west},{north},{east}];\n"
+    footer = f"\n);\nout {out};\n"
     
-    query_parts = []
-    for query in all_queries:
-        query_parts.append(f"({query}({bbox_str}););")
+    return "".join([header, "(\n", body, footer])
+
+
+def _iter_statements(feature_types: tuple[str, ...]) -> Iterator[str]:
+    """
+    Yield the Overpass statements selecting the given feature types.
+
+    Values sharing an element, key and extra filters are merged so each
+    group becomes one regex-union statement, i.e. one scan on the Overpass
+    server.
+
+    Args:
+        feature_types: Feature types present in _FEATURE_QUERIES
+
+    Yields:
+        Overpass QL statements without the trailing semicolon
+    """
+    groups: dict[tuple[str, str, str], Optional[set[str]]] = {}
     
-    query = f"""[out:xml][timeout:300];
-(
-{''.join(query_parts)}
-);
-out meta geom;
-"""
+    for feature_type in feature_types:
+        for element, key, values, *extra in _FEATURE_QUERIES[feature_type]:
+            group = (element, key, "".join(extra))
+            if not values:
+                groups[group] = None  # Any value of the key
+            elif group not in groups:
+                groups[group] = set(values)
+            elif groups[group] is not None:
+                groups[group].update(values)
     
-    return query
+    for (element, key, extra), values in groups.items():
+        if extra:
+            # Drop values the same statement without extra filters already covers
+            base = groups.get((element, key, ""), set())
+            if base is None:
+                continue
+            if values is not None:
+                values = values - base
+                if not values:
+                    continue
+        yield f"{element}{_tag_filter(key, values)}{extra}"
+
+
+def _statements_body(feature_types: tuple[str, ...]) -> str:
+    """Join the statements for the feature types into a query body."""
+    return "\n".join(f"  {statement};" for statement in _iter_statements(feature_types))
+
+
+# Query bodies for each single feature type, the most common request
+_SINGLE_FEATURE_BODIES = {
+    feature_type: _statements_body((feature_type,)) for feature_type in _FEATURE_QUERIES
+}
 
 
 def get_bbox_center_zoom(bbox: BoundingBox) -> tuple[float, float, int]:
@@ -355,14 +569,6 @@ def get_bbox_center_zoom(bbox: BoundingBox) -> tuple[float, float, int]:
     center_lon, center_lat = bbox.center
 
     # Estimate zoom level based on area
-    area = bbox.area_degrees
-    if area > 10:
-        zoom = 8
-    elif area > 1:
-        zoom = 10
-    elif area > 0.1:
-        zoom = 12
-    else:
-        zoom = 14
+    zoom = _ZOOM_VALUES[bisect_left(_ZOOM_THRESHOLDS, bbox.area_degrees)]
 
     return center_lon, center_lat, zoom
@@ -4,11 +4,16 @@ Feature extraction from OSM data using osmium with robust error handling and per
 
 import json
 import logging
+import os
 import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Optional
 
+import orjson
 import osmium
 from rich.progress import (
     BarColumn,
@@ -23,6 +28,40 @@ from tilecraft.utils.cache import CacheManager
 
 logger = logging.getLogger(__name__)
 
+# Start of every streamed GeoJSON FeatureCollection
+_COLLECTION_HEAD = b'{"type":"FeatureCollection","features":['
+
+# Separator between the streamed features and the extraction properties
+_PROPERTIES_MARKER = b'],"properties":'
+
+# Bytes read from the end of a file to find its extraction properties
+_PROPERTIES_TAIL_BYTES = 4096
+
+# Files up to this size are validated whole; larger ones by a leading sample
+_VALIDATION_HEAD_BYTES = 1024 * 1024
+
+# Number of features checked when validating a GeoJSON file
+_VALIDATION_SAMPLE = 10
+
+
+# Tag keys that suggest polygon geometry for closed ways
+_AREA_TAGS = frozenset(
+    {
+        "building",
+        "landuse",
+        "natural",
+        "leisure",
+        "amenity",
+        "place",
+        "tourism",
+        "shop",
+        "area",
+    }
+)
+
+# Tag keys that suggest linestring geometry
+_LINE_TAGS = frozenset({"highway", "waterway", "railway", "barrier", "power"})
+
 
 class FeatureExtractionError(Exception):
     """Custom exception for feature extraction errors."""
@@ -42,21 +81,66 @@ class GeometryValidationError(FeatureExtractionError):
     pass
 
 
-class OSMFeatureHandler(osmium.SimpleHandler):
-    """Osmium handler for extracting specific features from OSM data."""
+@dataclass(frozen=True)
+class _KeyMatcher:
+    """Precompiled filter for the values of one OSM tag key."""
+
+    exact: frozenset[str]
+    wildcard: bool
+    substrings: tuple[str, ...]
+
+    @classmethod
+    def from_values(cls, values: list[str]) -> "_KeyMatcher":
+        """
+        Compile tag filter values.
+
+        Args:
+            values: Accepted values; "*" accepts any value and "~" marks a
+                value to match as a substring
 
-    def __init__(self, feature_type: FeatureType, tag_filters: dict[str, list[str]]):
+        Returns:
+            Compiled matcher
+        """
+        return cls(
+            exact=frozenset(v for v in values if "*" not in v and "~" not in v),
+            wildcard="*" in values,
+            substrings=tuple(v.replace("~", "") for v in values if "~" in v),
+        )
+
+    def matches(self, value: str) -> bool:
+        """Check whether a tag value passes the filter."""
+        return (
+            self.wildcard
+            or value in self.exact
+            or any(substring in value for substring in self.substrings)
+        )
+
+
+class OSMFeatureHandler:
+    """Writer and counters for one feature type extracted by MultiFeatureHandler."""
+
+    def __init__(
+        self,
+        feature_type: FeatureType,
+        tag_filters: dict[str, list[str]],
+        output_fp: Optional[BinaryIO] = None,
+    ):
         """
         Initialize feature handler.
 
         Args:
             feature_type: Type of feature to extract
             tag_filters: Dictionary of tag filters to apply
+            output_fp: Binary file the GeoJSON FeatureCollection is streamed
+                to; required before features are written
         """
-        super().__init__()
         self.feature_type = feature_type
         self.tag_filters = tag_filters
-        self.features = []
+        self._compiled = {
+            key: _KeyMatcher.from_values(values) for key, values in tag_filters.items()
+        }
+        self.output_fp = output_fp
+        self.feature_count = 0
         self.processed_count = 0
         self.error_count = 0
 
@@ -70,99 +154,150 @@ class OSMFeatureHandler(osmium.SimpleHandler):
             f"OSMFeatureHandler initialized for {feature_type.value} with filters: {tag_filters}"
         )
 
+        if output_fp is not None:
+            output_fp.write(_COLLECTION_HEAD)
+
+    def write_feature(self, feature_json: bytes) -> None:
+        """
+        Append a serialized feature to the streamed FeatureCollection.
+
+        Args:
+            feature_json: GeoJSON feature serialized as JSON
+        """
+        if self.feature_count:
+            self.output_fp.write(b",")
+        self.output_fp.write(feature_json)
+        self.feature_count += 1
+
+    def close(self) -> None:
+        """Finish the streamed FeatureCollection with its extraction properties."""
+        properties = {
+            "feature_type": self.feature_type.value,
+            "feature_count": self.feature_count,
+            "processed_count": self.processed_count,
+            "error_count": self.error_count,
+            "extraction_time": time.time(),
+            "nodes_seen": self.nodes_seen,
+            "ways_seen": self.ways_seen,
+            "ways_matched": self.ways_matched,
+        }
+        self.output_fp.write(_PROPERTIES_MARKER + orjson.dumps(properties) + b"}")
+
+
+class MultiFeatureHandler(osmium.SimpleHandler):
+    """Osmium handler extracting several feature types in one pass over OSM data."""
+
+    def __init__(
+        self,
+        mappings: dict[FeatureType, dict[str, list[str]]],
+        output_fps: dict[FeatureType, BinaryIO],
+    ):
+        """
+        Initialize multi-feature handler.
+
+        Args:
+            mappings: Tag filters for each feature type to extract
+            output_fps: Binary file each feature type's GeoJSON is streamed to
+        """
+        super().__init__()
+        # One handler per feature type writes its features and keeps counters;
+        # matching and geometry building happen here, once per element
+        self.handlers = {
+            feature_type: OSMFeatureHandler(
+                feature_type, tag_filters, output_fps[feature_type]
+            )
+            for feature_type, tag_filters in mappings.items()
+        }
+        self.nodes_seen = 0
+        self.ways_seen = 0
+
+        # Tag key -> (handler, matcher) for every feature type filtering on
+        # that key, so each tag is looked up once
+        self._filters_by_key: dict[str, list[tuple[OSMFeatureHandler, _KeyMatcher]]] = {}
+        for handler in self.handlers.values():
+            for key, matcher in handler._compiled.items():
+                self._filters_by_key.setdefault(key, []).append((handler, matcher))
+
     def node(self, n):
         """Process OSM nodes."""
         self.nodes_seen += 1
 
-        if self._matches_filters(n.tags):
+        handlers = self._matching_handlers(n.tags)
+        if handlers:
             try:
                 feature = self._create_point_feature(n)
-                if feature:
-                    self.features.append(feature)
-                    self.processed_count += 1
             except Exception as e:
-                self.error_count += 1
+                for handler in handlers:
+                    handler.error_count += 1
                 logger.debug(f"Error processing node {n.id}: {e}")
+                return
+            if feature:
+                self._write_feature(handlers, feature)
 
     def way(self, w):
         """Process OSM ways."""
         self.ways_seen += 1
 
-        if self.ways_seen <= 3:
-            logger.info(f"Processing way {w.id} with tags: {dict(w.tags)}")
-
-        if self._matches_filters(w.tags):
-            self.ways_matched += 1
-            logger.info(f"Way {w.id} MATCHED! Creating feature...")
+        handlers = self._matching_handlers(w.tags)
+        if handlers:
+            for handler in handlers:
+                handler.ways_matched += 1
             try:
                 feature = self._create_way_feature(w)
-                if feature:
-                    self.features.append(feature)
-                    self.processed_count += 1
-                    logger.info(f"Way {w.id} feature created successfully")
-                else:
-                    logger.warning(f"Way {w.id} matched but feature creation failed")
             except Exception as e:
-                self.error_count += 1
+                for handler in handlers:
+                    handler.error_count += 1
                 logger.error(f"Error processing way {w.id}: {e}")
+                return
+            if feature:
+                self._write_feature(handlers, feature)
+            else:
+                logger.warning(f"Way {w.id} matched but feature creation failed")
 
     def relation(self, r):
         """Process OSM relations."""
-        if self._matches_filters(r.tags):
-            try:
-                # For now, we'll skip relations as they require more complex processing
-                # TODO: Implement multipolygon relation processing
-                self.processed_count += 1
-            except Exception as e:
-                self.error_count += 1
-                logger.debug(f"Error processing relation {r.id}: {e}")
-
-    def _matches_filters(self, tags) -> bool:
+        # Relations are only counted for now, as they require more complex
+        # processing
+        # TODO: Implement multipolygon relation processing
+        for handler in self._matching_handlers(r.tags):
+            handler.processed_count += 1
+
+    def close(self) -> None:
+        """Finish every feature type's streamed FeatureCollection."""
+        for handler in self.handlers.values():
+            handler.nodes_seen = self.nodes_seen
+            handler.ways_seen = self.ways_seen
+            handler.close()
+
+    def _write_feature(
+        self, handlers: list[OSMFeatureHandler], feature: dict[str, Any]
+    ) -> None:
+        """Serialize a feature once and write it for every matching feature type."""
+        feature_json = orjson.dumps(feature)
+        for handler in handlers:
+            handler.write_feature(feature_json)
+            handler.processed_count += 1
+
+    def _matching_handlers(self, tags) -> list[OSMFeatureHandler]:
         """
-        Check if OSM element tags match the filters.
+        Find the feature types whose filters match OSM element tags.
 
         Args:
             tags: OSM element tags
 
         Returns:
-            True if tags match filters
+            Handlers of the matching feature types
         """
-        # Reduced debug logging
-        should_debug = False  # Turn off excessive debug logging
-
-        if should_debug:
-            logger.debug(
-                f"Checking tags: {dict(tags)} against filters: {self.tag_filters}"
-            )
-
-        for key, values in self.tag_filters.items():
-            if key in tags:
-                tag_value = tags[key]
-                # Handle wildcard matches
-                if "*" in values:
-                    if should_debug:
-                        logger.debug(f"Wildcard match found: {key}={tag_value}")
-                    return True
-                # Handle exact matches
-                if tag_value in values:
-                    if should_debug:
-                        logger.debug(f"Exact match found: {key}={tag_value}")
-                    return True
-                # Handle pattern matches (basic support)
-                for value in values:
-                    if "~" in value:
-                        # Simple regex-like matching
-                        pattern = value.replace("~", "")
-                        if pattern in tag_value:
-                            if should_debug:
-                                logger.debug(
-                                    f"Pattern match found: {key}={tag_value} matches {pattern}"
-                                )
-                            return True
-
-        if should_debug:
-            logger.debug(f"No match found for tags: {dict(tags)}")
-        return False
+        matched = []
+        for tag in tags:
+            candidates = self._filters_by_key.get(tag.k)
+            if not candidates:
+                continue
+            value = tag.v
+            for handler, matcher in candidates:
+                if handler not in matched and matcher.matches(value):
+                    matched.append(handler)
+        return matched
 
     def _create_point_feature(self, node) -> Optional[dict[str, Any]]:
         """
@@ -216,15 +351,15 @@ class OSMFeatureHandler(osmium.SimpleHandler):
             )
             return None
 
-        properties = dict(way.tags)
-        properties["osm_id"] = way.id
-        properties["osm_type"] = "way"
-
         # Determine geometry type
         is_closed = len(coordinates) > 2 and coordinates[0] == coordinates[-1]
 
-        # Decide between LineString and Polygon based on tags and closure
-        geometry_type = self._determine_geometry_type(way.tags, is_closed)
+        # Decide between LineString and Polygon based on tags and closure; the
+        # tags are copied once and become the feature properties
+        properties = dict(way.tags)
+        geometry_type = self._determine_geometry_type(properties, is_closed)
+        properties["osm_id"] = way.id
+        properties["osm_type"] = "way"
 
         if geometry_type == "Polygon":
             # Ensure polygon is closed
@@ -240,61 +375,71 @@ class OSMFeatureHandler(osmium.SimpleHandler):
 
         return {"type": "Feature", "properties": properties, "geometry": geometry}
 
-    def _determine_geometry_type(self, tags, is_closed: bool) -> str:
+    def _determine_geometry_type(self, tags: dict[str, str], is_closed: bool) -> str:
         """
         Determine appropriate geometry type based on tags and shape.
 
         Args:
-            tags: OSM element tags (TagList or dict)
+            tags: OSM element tags as a dict
             is_closed: Whether the way is closed
 
         Returns:
             Geometry type string
         """
-        # Convert TagList to dict for easier processing
-        if hasattr(tags, "keys"):
-            # It's already a dict-like object
-            tags_dict = dict(tags)
-        else:
-            # Convert TagList to dict
-            tags_dict = dict(tags)
-
-        # Area tags that suggest polygon geometry
-        area_tags = {
-            "building",
-            "landuse",
-            "natural",
-            "leisure",
-            "amenity",
-            "place",
-            "tourism",
-            "shop",
-            "area",
-        }
-
-        # Line tags that suggest linestring geometry
-        line_tags = {"highway", "waterway", "railway", "barrier", "power"}
-
         # Check for explicit area tag
-        if tags_dict.get("area") == "yes":
+        area = tags.get("area")
+        if area == "yes":
             return "Polygon"
-        if tags_dict.get("area") == "no":
+        if area == "no":
             return "LineString"
 
-        # Check tag implications
-        for tag_key in tags_dict.keys():
-            if tag_key in area_tags and is_closed:
+        # Check tag implications; the first deciding key wins
+        for tag_key in tags:
+            if tag_key in _AREA_TAGS and is_closed:
                 return "Polygon"
-            if tag_key in line_tags:
+            if tag_key in _LINE_TAGS:
                 return "LineString"
 
-        # Default logic
-        if is_closed and len(set(tags_dict.keys()) & area_tags) > 0:
-            return "Polygon"
-
         return "LineString"
 
 
+def _extract_to_files(
+    osm_data_path: str,
+    mappings: dict[FeatureType, dict[str, list[str]]],
+    output_paths: dict[FeatureType, Path],
+) -> dict[FeatureType, tuple[int, int]]:
+    """
+    Stream feature types from one osmium pass into their GeoJSON files.
+
+    Module-level so it can also run in extraction worker processes.
+
+    Args:
+        osm_data_path: Input OSM data file
+        mappings: Tag filters for each feature type
+        output_paths: Output GeoJSON file path for each feature type
+
+    Returns:
+        Feature and error counts for each feature type
+    """
+    with ExitStack() as stack:
+        output_fps = {}
+        for feature_type, output_path in output_paths.items():
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_fps[feature_type] = stack.enter_context(open(output_path, "wb"))
+
+        # Create one handler streaming every feature type to its file
+        handler = MultiFeatureHandler(mappings, output_fps)
+
+        # Process OSM data
+        osmium.apply(osm_data_path, handler)
+        handler.close()
+
+    return {
+        feature_type: (feature_handler.feature_count, feature_handler.error_count)
+        for feature_type, feature_handler in handler.handlers.items()
+    }
+
+
 class FeatureExtractor:
     """Extracts specific features from OSM data with robust error handling."""
 
@@ -303,6 +448,12 @@ class FeatureExtractor:
     CHUNK_SIZE = 10000  # Features to process before yielding
     MEMORY_LIMIT_MB = 500  # Memory limit for processing
 
+    # Feature types are split across up to MAX_WORKERS processes (None for
+    # one per CPU), each making its own pass over the OSM data; smaller
+    # inputs are extracted in-process, where one pass beats starting workers
+    MAX_WORKERS: Optional[int] = None
+    PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+
     def __init__(self, config: TilecraftConfig, cache_manager: CacheManager):
         """
         Initialize feature extractor.
@@ -500,6 +651,7 @@ class FeatureExtractor:
         logger.info(f"File size: {osm_data_path.stat().st_size:,} bytes")
 
         results = {}
+        bbox_str = self.config.bbox.to_string()
 
         with Progress(
             SpinnerColumn(),
@@ -514,59 +666,64 @@ class FeatureExtractor:
                 total=len(feature_types),
             )
 
-            for i, feature_type in enumerate(feature_types):
-                progress.update(
-                    main_task, description=f"Extracting {feature_type.value}..."
-                )
-
+            # Feature types not cached yet are extracted together in one pass
+            missing = []
+            for feature_type in feature_types:
                 try:
-                    # Check cache first
-                    bbox_str = self.config.bbox.to_string()
                     cached_path = self.cache_manager.get_cached_features(
                         feature_type.value, bbox_str
                     )
+                except Exception as e:
+                    logger.error(f"Failed to extract {feature_type.value}: {e}")
+                    raise FeatureExtractionError(
+                        f"Feature extraction failed for {feature_type.value}: {e}"
+                    )
 
-                    if cached_path and cached_path.exists():
-                        feature_count = self._count_features(cached_path)
-                        logger.info(
-                            f"Using cached {feature_type.value}: {cached_path} ({feature_count} features)"
-                        )
-                        results[feature_type.value] = cached_path
-                    else:
-                        # Extract features
-                        output_path = self._extract_feature_type_with_retry(
-                            osm_data_path, feature_type, progress
-                        )
-
-                        # Cache the result
-                        try:
-                            cached_path = self.cache_manager.cache_features(
-                                feature_type.value, bbox_str, output_path
-                            )
-                            results[feature_type.value] = cached_path
-
-                            # Log extraction statistics
-                            feature_count = self._count_features(cached_path)
-                            file_size = cached_path.stat().st_size
-                            logger.info(
-                                f"Extracted {feature_count} {feature_type.value} features ({file_size:,} bytes)"
-                            )
+                if cached_path and cached_path.exists():
+                    feature_count = self._count_features(cached_path)
+                    logger.info(
+                        f"Using cached {feature_type.value}: {cached_path} ({feature_count} features)"
+                    )
+                    results[feature_type.value] = cached_path
+                    progress.advance(main_task)
+                elif feature_type not in missing:
+                    missing.append(feature_type)
 
-                        except Exception as e:
-                            logger.warning(f"Failed to cache {feature_type.value}: {e}")
-                            results[feature_type.value] = output_path
+            if missing:
+                names = ", ".join(feature_type.value for feature_type in missing)
+                progress.update(main_task, description=f"Extracting {names}...")
 
+                try:
+                    output_paths = self._extract_feature_types_with_retry(
+                        osm_data_path, missing, progress
+                    )
                 except Exception as e:
-                    logger.error(f"Failed to extract {feature_type.value}: {e}")
+                    logger.error(f"Failed to extract {names}: {e}")
                     raise FeatureExtractionError(
-                        f"Feature extraction failed for {feature_type.value}: {e}"
+                        f"Feature extraction failed for {names}: {e}"
                     )
 
-                progress.update(main_task, completed=i + 1)
+                for feature_type, output_path in output_paths.items():
+                    # Cache the result
+                    try:
+                        cached_path = self.cache_manager.cache_features(
+                            feature_type.value, bbox_str, output_path
+                        )
+                        results[feature_type.value] = cached_path
+
+                    except Exception as e:
+                        logger.warning(f"Failed to cache {feature_type.value}: {e}")
+                        results[feature_type.value] = output_path
+
+                    progress.advance(main_task)
 
             progress.update(main_task, description="Feature extraction complete")
 
-        return results
+        # Keep the requested order regardless of which types were cached
+        return {
+            feature_type.value: results[feature_type.value]
+            for feature_type in feature_types
+        }
 
     def _validate_osm_file(self, osm_data_path: Path) -> None:
         """
@@ -617,42 +774,44 @@ class FeatureExtractor:
         except Exception as e:
             raise OSMProcessingError(f"Failed to validate OSM file: {e}")
 
-    def _extract_feature_type_with_retry(
-        self, osm_data_path: Path, feature_type: FeatureType, progress: Progress
-    ) -> Path:
+    def _extract_feature_types_with_retry(
+        self, osm_data_path: Path, feature_types: list[FeatureType], progress: Progress
+    ) -> dict[FeatureType, Path]:
         """
-        Extract feature type with retry logic.
+        Extract feature types in a single pass with retry logic.
 
         Args:
             osm_data_path: Input OSM data file
-            feature_type: Feature type to extract
+            feature_types: Feature types to extract
             progress: Progress tracker
 
         Returns:
-            Path to output GeoJSON file
+            Dictionary mapping feature type to output GeoJSON file
         """
-        output_path = self.output_dir / f"{feature_type.value}.geojson"
+        output_paths = {
+            feature_type: self.output_dir / f"{feature_type.value}.geojson"
+            for feature_type in feature_types
+        }
+        names = ", ".join(feature_type.value for feature_type in feature_types)
         last_exception = None
 
         for attempt in range(self.MAX_RETRIES):
             try:
                 task_id = progress.add_task(
-                    f"Processing {feature_type.value} (attempt {attempt + 1})...",
+                    f"Processing {names} (attempt {attempt + 1})...",
                     total=None,
                 )
 
-                result_path = self._extract_feature_type(
-                    osm_data_path, feature_type, output_path, progress, task_id
+                result_paths = self._extract_feature_types(
+                    osm_data_path, output_paths, progress, task_id
                 )
 
                 progress.remove_task(task_id)
-                return result_path
+                return result_paths
 
             except Exception as e:
                 last_exception = e
-                logger.warning(
-                    f"Attempt {attempt + 1} failed for {feature_type.value}: {e}"
-                )
+                logger.warning(f"Attempt {attempt + 1} failed for {names}: {e}")
 
                 if attempt < self.MAX_RETRIES - 1:
                     time.sleep(2**attempt)  # Exponential backoff
@@ -663,96 +822,142 @@ class FeatureExtractor:
                     pass
 
         raise FeatureExtractionError(
-            f"Failed to extract {feature_type.value} after {self.MAX_RETRIES} attempts: {last_exception}"
+            f"Failed to extract {names} after {self.MAX_RETRIES} attempts: {last_exception}"
         )
 
-    def _extract_feature_type(
+    def _extract_feature_types(
         self,
         osm_data_path: Path,
-        feature_type: FeatureType,
-        output_path: Path,
+        output_paths: dict[FeatureType, Path],
         progress: Progress,
         task_id: int,
-    ) -> Path:
+    ) -> dict[FeatureType, Path]:
         """
-        Extract specific feature type using osmium.
+        Extract feature types using a single osmium pass over the OSM data.
 
         Args:
             osm_data_path: Input OSM data file
-            feature_type: Feature type to extract
-            output_path: Output GeoJSON file path
+            output_paths: Output GeoJSON file path for each feature type
             progress: Progress tracker
             task_id: Progress task ID
 
         Returns:
-            Path to output file
+            Dictionary mapping feature type to output file
         """
-        # Create output directory
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        names = ", ".join(feature_type.value for feature_type in output_paths)
 
-        # Get tag filters for this feature type
-        tag_filters = self._get_tag_filters(feature_type)
+        # Get tag filters for these feature types
+        mappings = {
+            feature_type: self._get_tag_filters(feature_type)
+            for feature_type in output_paths
+        }
 
         # Debug logging
-        logger.debug(f"Extracting {feature_type.value} with tag filters: {tag_filters}")
+        logger.debug(f"Extracting {names} with tag filters: {mappings}")
 
-        progress.update(
-            task_id, description=f"Processing {feature_type.value} features..."
-        )
+        progress.update(task_id, description=f"Processing {names} features...")
 
         try:
-            # Create handler for this feature type
-            handler = OSMFeatureHandler(feature_type, tag_filters)
+            workers = self._worker_count(osm_data_path, len(mappings))
+            if workers > 1:
+                counts = self._extract_in_workers(
+                    osm_data_path, mappings, output_paths, workers, progress, task_id
+                )
+            else:
+                counts = _extract_to_files(str(osm_data_path), mappings, output_paths)
 
-            # Process OSM data
-            osmium.apply(str(osm_data_path), handler)
+            for feature_type, (feature_count, error_count) in counts.items():
+                progress.update(
+                    task_id,
+                    description=f"Validating {feature_count} {feature_type.value} features...",
+                )
 
-            progress.update(
-                task_id,
-                description=f"Writing {len(handler.features)} {feature_type.value} features...",
-            )
+                # Validate output
+                output_path = output_paths[feature_type]
+                self._validate_geojson_file(output_path)
 
-            # Create GeoJSON output
-            geojson_data = {
-                "type": "FeatureCollection",
-                "features": handler.features,
-                "properties": {
-                    "feature_type": feature_type.value,
-                    "processed_count": handler.processed_count,
-                    "error_count": handler.error_count,
-                    "extraction_time": time.time(),
-                    "nodes_seen": handler.nodes_seen,
-                    "ways_seen": handler.ways_seen,
-                    "ways_matched": handler.ways_matched,
-                },
-            }
-
-            # Write to output file
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(geojson_data, f, indent=2 if self.config.verbose else None)
-
-            # Validate output
-            self._validate_geojson_file(output_path)
-
-            progress.update(task_id, description=f"Completed {feature_type.value}")
-
-            if handler.error_count > 0:
-                logger.warning(
-                    f"Encountered {handler.error_count} errors processing {feature_type.value}"
+                logger.info(
+                    f"Extracted {feature_count} {feature_type.value} features ({output_path.stat().st_size:,} bytes)"
                 )
 
-            return output_path
+                if error_count > 0:
+                    logger.warning(
+                        f"Encountered {error_count} errors processing {feature_type.value}"
+                    )
+
+            progress.update(task_id, description=f"Completed {names}")
+
+            return output_paths
 
         except Exception as e:
             # Cleanup partial output
-            if output_path.exists():
-                try:
-                    output_path.unlink()
-                except Exception:
-                    pass
-            raise OSMProcessingError(
-                f"OSM processing failed for {feature_type.value}: {e}"
-            )
+            for output_path in output_paths.values():
+                if output_path.exists():
+                    try:
+                        output_path.unlink()
+                    except Exception:
+                        pass
+            raise OSMProcessingError(f"OSM processing failed for {names}: {e}")
+
+    def _worker_count(self, osm_data_path: Path, feature_type_count: int) -> int:
+        """
+        Choose how many processes extract the feature types.
+
+        Args:
+            osm_data_path: Input OSM data file
+            feature_type_count: Number of feature types to extract
+
+        Returns:
+            Number of worker processes, 1 to extract in-process
+        """
+        if osm_data_path.stat().st_size < self.PARALLEL_MIN_BYTES:
+            return 1
+        return min(feature_type_count, self.MAX_WORKERS or os.cpu_count() or 1)
+
+    def _extract_in_workers(
+        self,
+        osm_data_path: Path,
+        mappings: dict[FeatureType, dict[str, list[str]]],
+        output_paths: dict[FeatureType, Path],
+        workers: int,
+        progress: Progress,
+        task_id: int,
+    ) -> dict[FeatureType, tuple[int, int]]:
+        """
+        Extract groups of feature types in parallel worker processes.
+
+        Args:
+            osm_data_path: Input OSM data file
+            mappings: Tag filters for each feature type
+            output_paths: Output GeoJSON file path for each feature type
+            workers: Number of worker processes
+            progress: Progress tracker
+            task_id: Progress task ID
+
+        Returns:
+            Feature and error counts for each feature type
+        """
+        feature_types = list(mappings)
+        groups = [feature_types[i::workers] for i in range(workers)]
+        counts = {}
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _extract_to_files,
+                    str(osm_data_path),
+                    {feature_type: mappings[feature_type] for feature_type in group},
+                    {feature_type: output_paths[feature_type] for feature_type in group},
+                )
+                for group in groups
+            ]
+            for done, future in enumerate(as_completed(futures), 1):
+                counts.update(future.result())
+                progress.update(
+                    task_id, description=f"Processed {done}/{workers} feature groups..."
+                )
+
+        return counts
 
     def _get_tag_filters(self, feature_type: FeatureType) -> dict[str, list[str]]:
         """
@@ -795,6 +1000,10 @@ class FeatureExtractor:
         """
         Validate GeoJSON file format and geometry.
 
+        Small files are parsed whole; larger ones must be streamed
+        FeatureCollections and only their leading features are parsed, so
+        memory stays bounded regardless of file size.
+
         Args:
             geojson_path: Path to GeoJSON file
 
@@ -802,23 +1011,33 @@ class FeatureExtractor:
             GeometryValidationError: Invalid GeoJSON
         """
         try:
-            with open(geojson_path, encoding="utf-8") as f:
-                data = json.load(f)
+            with open(geojson_path, "rb") as f:
+                head = f.read(_VALIDATION_HEAD_BYTES + 1)
 
-            # Basic structure validation
-            if not isinstance(data, dict):
-                raise GeometryValidationError("GeoJSON must be a dictionary")
+            if len(head) <= _VALIDATION_HEAD_BYTES:
+                data = orjson.loads(head)
 
-            if data.get("type") != "FeatureCollection":
-                raise GeometryValidationError("GeoJSON must be a FeatureCollection")
+                # Basic structure validation
+                if not isinstance(data, dict):
+                    raise GeometryValidationError("GeoJSON must be a dictionary")
 
-            features = data.get("features", [])
-            if not isinstance(features, list):
-                raise GeometryValidationError("Features must be a list")
+                if data.get("type") != "FeatureCollection":
+                    raise GeometryValidationError(
+                        "GeoJSON must be a FeatureCollection"
+                    )
+
+                features = data.get("features", [])
+                if not isinstance(features, list):
+                    raise GeometryValidationError("Features must be a list")
+            else:
+                if not head.startswith(_COLLECTION_HEAD):
+                    raise GeometryValidationError(
+                        "GeoJSON must be a FeatureCollection"
+                    )
+                features = self._leading_features(head[len(_COLLECTION_HEAD) :])
 
             # Validate a sample of features
-            sample_size = min(10, len(features))
-            for i, feature in enumerate(features[:sample_size]):
+            for i, feature in enumerate(features[:_VALIDATION_SAMPLE]):
                 self._validate_feature(feature, i)
 
         except GeometryValidationError:
@@ -826,6 +1045,34 @@ class FeatureExtractor:
         except Exception as e:
             raise GeometryValidationError(f"Failed to validate GeoJSON: {e}")
 
+    def _leading_features(self, features_head: bytes) -> list[Any]:
+        """
+        Parse the first complete features from the start of a features array.
+
+        Args:
+            features_head: Bytes following the opening bracket of the array
+
+        Returns:
+            Up to the validation sample size of parsed features
+        """
+        text = features_head.decode("utf-8", errors="ignore")
+        decoder = json.JSONDecoder()
+        features = []
+        index = 0
+
+        while len(features) < _VALIDATION_SAMPLE:
+            try:
+                feature, index = decoder.raw_decode(text, index)
+            except ValueError:
+                # The sample ends inside a feature cut off by the read
+                break
+            features.append(feature)
+            if text[index : index + 1] != ",":
+                break
+            index += 1
+
+        return features
+
     def _validate_feature(self, feature: dict[str, Any], index: int) -> None:
         """
         Validate individual GeoJSON feature.
@@ -874,6 +1121,9 @@ class FeatureExtractor:
         """
         Count features in GeoJSON file efficiently.
 
+        Extracted files record their feature count in the trailing
+        properties; other files are scanned in chunks for Feature objects.
+
         Args:
             geojson_path: Path to GeoJSON file
 
@@ -881,15 +1131,28 @@ class FeatureExtractor:
             Number of features
         """
         try:
-            with open(geojson_path, encoding="utf-8") as f:
-                data = json.load(f)
-
-            if data.get("type") == "FeatureCollection":
-                return len(data.get("features", []))
-            elif data.get("type") == "Feature":
-                return 1
-            else:
-                return 0
+            with open(geojson_path, "rb") as f:
+                f.seek(max(0, f.seek(0, os.SEEK_END) - _PROPERTIES_TAIL_BYTES))
+                tail = f.read()
+
+                marker = tail.rfind(_PROPERTIES_MARKER)
+                if marker != -1:
+                    properties = orjson.loads(
+                        tail[marker + len(_PROPERTIES_MARKER) : -1]
+                    )
+                    if "feature_count" in properties:
+                        return properties["feature_count"]
+
+                f.seek(0)
+                token = b'"Feature"'
+                count = 0
+                carry = b""
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    data = carry + chunk
+                    count += data.count(token)
+                    # Too short to hold a whole token, so nothing is counted twice
+                    carry = data[-(len(token) - 1) :]
+                return count
 
         except Exception as e:
             logger.warning(f"Could not count features in {geojson_path}: {e}")
@@ -18,12 +18,24 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
-from tilecraft.core.bbox import bbox_to_overpass_query, validate_bbox
+from tilecraft.core.bbox import (
+    bbox_to_overpass_id_query,
+    bbox_to_overpass_query,
+    ids_to_overpass_geom_query,
+    validate_bbox,
+)
 from tilecraft.models.config import BoundingBox, TilecraftConfig
 from tilecraft.utils.cache import CacheManager
 
 logger = logging.getLogger(__name__)
 
+# Wrapper for OSM XML assembled from several Overpass responses
+_OSM_XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n<osm version="0.6" generator="Tilecraft">\n'
+_OSM_XML_FOOTER = "</osm>\n"
+
+# Response lines dropped when merging: document wrapper and per-response notes
+_OSM_WRAPPER_PREFIXES = ("<?xml", "<osm", "</osm>", "<note", "<meta")
+
 
 class OverpassAPIError(Exception):
     """Custom exception for Overpass API errors."""
@@ -60,6 +72,11 @@ class OSMDownloader:
     REQUEST_TIMEOUT = 600.0  # 10 minutes
     RATE_LIMIT_DELAY = 30.0  # seconds to wait on rate limit
 
+    # Large bboxes select element ids first, then fetch geometry in id
+    # batches, which Overpass serves without timing out
+    TWO_PHASE_AREA_DEGREES = 10.0  # square degrees
+    ID_BATCH_SIZE = 5000  # ids per geometry query
+
     def __init__(self, config: TilecraftConfig, cache_manager: CacheManager):
         """
         Initialize OSM downloader.
@@ -74,9 +91,12 @@ class OSMDownloader:
         self.last_request_time = 0.0
         self.min_request_interval = 1.0  # Minimum seconds between requests
 
-        # Create temp directory for downloads
+        # Create temp directory for downloads, inside the configured processing
+        # temp directory when there is one so concurrent runs stay apart
         self.temp_dir = Path(tempfile.gettempdir()) / "tilecraft"
-        self.temp_dir.mkdir(exist_ok=True)
+        if config.tiles.temp_dir:
+            self.temp_dir = config.tiles.temp_dir / "osm"
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
 
     @property
     def current_endpoint(self) -> str:
@@ -252,24 +272,30 @@ class OSMDownloader:
             f"Downloading OSM data for bbox: {bbox_str} (area: {bbox.area_degrees:.4f}°²)"
         )
 
-        # Generate Overpass query
         feature_types = [f.value for f in self.config.features.types]
-        query = bbox_to_overpass_query(bbox, feature_types)
+        if bbox.area_degrees > self.TWO_PHASE_AREA_DEGREES:
+            output_path = self._download_two_phase(bbox, feature_types, bbox_str)
+        else:
+            # Generate Overpass query
+            query = bbox_to_overpass_query(bbox, feature_types)
 
-        # Log query for debugging
-        if self.config.verbose:
-            logger.debug(f"Overpass query:\n{query}")
+            # Log query for debugging
+            if self.config.verbose:
+                logger.debug(f"Overpass query:\n{query}")
 
-        # Download with retry logic
-        output_path = self._download_with_retry(query, bbox_str)
+            # Download with retry logic
+            output_path = self._download_with_retry(query, bbox_str)
 
         # Validate downloaded file
         if not output_path.exists() or output_path.stat().st_size == 0:
             raise RuntimeError("Downloaded file is empty or missing")
 
-        # Cache the result
+        # Cache the result; the download is a temp file, so hand it over to the
+        # cache instead of writing a second full copy of the extract
         try:
-            cached_path = self.cache_manager.cache_osm_data(bbox_str, output_path)
+            cached_path = self.cache_manager.cache_osm_data(
+                bbox_str, output_path, move=True
+            )
             logger.info(
                 f"Downloaded and cached OSM data: {cached_path} ({cached_path.stat().st_size:,} bytes)"
             )
@@ -278,18 +304,97 @@ class OSMDownloader:
             logger.warning(f"Failed to cache OSM data: {e}")
             return output_path
 
-    def _download_with_retry(self, query: str, bbox_str: str) -> Path:
+    def _download_two_phase(
+        self, bbox: BoundingBox, feature_types: list[str], bbox_str: str
+    ) -> Path:
+        """
+        Download OSM data for a large bbox as an id query plus id batches.
+
+        Args:
+            bbox: Bounding box to download
+            feature_types: Feature types to query
+            bbox_str: Bounding box string for filenames
+
+        Returns:
+            Path to the merged OSM XML file
+        """
+        ids_query = bbox_to_overpass_id_query(bbox, feature_types)
+        if self.config.verbose:
+            logger.debug(f"Overpass id query:\n{ids_query}")
+
+        ids_path = self._download_with_retry(ids_query, bbox_str, part="ids")
+        ids_by_element = self._read_element_ids(ids_path)
+        ids_path.unlink()
+
+        total = sum(len(ids) for ids in ids_by_element.values())
+        logger.info(
+            f"Fetching geometry for {total:,} elements in batches of {self.ID_BATCH_SIZE:,}"
+        )
+
+        output_path = self.temp_dir / f"osm_data_{bbox_str.replace(',', '_')}.osm"
+        with open(output_path, "w", encoding="utf-8") as output:
+            output.write(_OSM_XML_HEADER)
+            # Nodes, ways, relations: the order osmium expects
+            for element in ("node", "way", "relation"):
+                ids = ids_by_element.get(element, [])
+                for start in range(0, len(ids), self.ID_BATCH_SIZE):
+                    query = ids_to_overpass_geom_query(
+                        element, ids[start : start + self.ID_BATCH_SIZE]
+                    )
+                    part_path = self._download_with_retry(
+                        query, bbox_str, part=f"{element}_{start}"
+                    )
+                    with open(part_path, encoding="utf-8") as part:
+                        output.writelines(
+                            line
+                            for line in part
+                            if not line.lstrip().startswith(_OSM_WRAPPER_PREFIXES)
+                        )
+                    part_path.unlink()
+            output.write(_OSM_XML_FOOTER)
+
+        return output_path
+
+    def _read_element_ids(self, ids_path: Path) -> dict[str, list[int]]:
+        """
+        Read element ids from an id query response.
+
+        Args:
+            ids_path: Downloaded response with one "type<TAB>id" line per element
+
+        Returns:
+            Sorted ids keyed by element type
+        """
+        ids_by_element: dict[str, list[int]] = {}
+        with open(ids_path, encoding="utf-8") as f:
+            for line in f:
+                element, _, element_id = line.strip().partition("\t")
+                # Skip anything else, e.g. an XML reply to an empty query
+                if element_id.isdigit():
+                    ids_by_element.setdefault(element, []).append(int(element_id))
+
+        for ids in ids_by_element.values():
+            ids.sort()
+        return ids_by_element
+
+    def _download_with_retry(
+        self, query: str, bbox_str: str, part: Optional[str] = None
+    ) -> Path:
         """
         Download OSM data with retry logic and endpoint rotation.
 
         Args:
             query: Overpass QL query
             bbox_str: Bounding box string for filename
+            part: Name distinguishing one of several downloads for the same bbox
 
         Returns:
             Path to downloaded file
         """
-        output_path = self.temp_dir / f"osm_data_{bbox_str.replace(',', '_')}.osm"
+        stem = f"osm_data_{bbox_str.replace(',', '_')}"
+        if part:
+            stem = f"{stem}_{part}"
+        output_path = self.temp_dir / f"{stem}.osm"
         last_exception = None
 
         with Progress(
@@ -426,6 +531,7 @@ class OSMDownloader:
             "area_degrees": bbox.area_degrees,
             "feature_types": feature_types,
             "query_length": len(query),
+            "two_phase": bbox.area_degrees > self.TWO_PHASE_AREA_DEGREES,
             "cached": self.cache_manager.get_cached_osm_data(bbox_str) is not None,
             "endpoints": self.OVERPASS_ENDPOINTS,
             "current_endpoint": self.current_endpoint,
@@ -6,6 +6,8 @@ import logging
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from tilecraft.ai.schema_generator import SchemaGenerator
 from tilecraft.ai.style_generator import StyleGenerator
 from tilecraft.core.feature_extractor import FeatureExtractor
@@ -115,10 +117,7 @@ class TilecraftPipeline:
 
         # Save schema to file
         schema_path = self.config.output.data_dir / "schema.json"
-        with open(schema_path, "w") as f:
-            import json
-
-            json.dump(schema, f, indent=2)
+        schema_path.write_bytes(orjson.dumps(schema, option=orjson.OPT_INDENT_2))
 
         self.logger.info(f"Schema generated: {schema_path}")
         return schema
@@ -147,12 +146,13 @@ class TilecraftPipeline:
             self.logger.debug("Starting pipeline cleanup")
             
             # Clean up feature extractor
-            if hasattr(self, 'feature_extractor'):
-                self.feature_extractor.cleanup_temp_files()
-            
-            # Clean up tile generator
-            if hasattr(self, 'tile_generator'):
-                self.tile_generator.cleanup_temp_files()
+            try:
+                if hasattr(self, 'feature_extractor'):
+                    self.feature_extractor.cleanup_temp_files()
+            finally:
+                # Clean up tile generator even if the extractor cleanup failed
+                if hasattr(self, 'tile_generator'):
+                    self.tile_generator.cleanup_temp_files()
             
             # Clean up cache manager
             if hasattr(self, 'cache_manager'):
@@ -66,6 +66,9 @@ class TileGenerator:
     MEMORY_CHECK_INTERVAL = 10.0  # seconds
     MAX_MEMORY_USAGE_PCT = 85  # Maximum memory usage percentage
 
+    # Newline-delimited GeoJSON (GeoJSONSeq) inputs, streamed by tippecanoe
+    GEOJSONSEQ_SUFFIXES = (".geojsonl", ".geojsons")
+
     # Tippecanoe output patterns for progress tracking
     PROGRESS_PATTERNS = [
         "For layer",
@@ -116,10 +119,10 @@ class TileGenerator:
 
     def generate(self, feature_files: dict[str, Path]) -> Path:
         """
-        Generate vector tiles from feature GeoJSON files.
+        Generate vector tiles from feature GeoJSON or FlatGeobuf files.
 
         Args:
-            feature_files: Dictionary mapping feature type to GeoJSON file path
+            feature_files: Dictionary mapping feature type to GeoJSON/FlatGeobuf path
 
         Returns:
             Path to generated and validated MBTiles file
@@ -237,6 +240,44 @@ class TileGenerator:
                 )
                 continue
 
+            # FlatGeobuf is binary; tippecanoe reads it natively by extension
+            if file_path.suffix.lower() == ".fgb":
+                try:
+                    feature_count = self._count_flatgeobuf_features(file_path)
+                except Exception as e:
+                    invalid_files.append(f"{feature_type}: Invalid FlatGeobuf ({e})")
+                    continue
+
+                if feature_count == 0:
+                    empty_files.append(feature_type)
+                    logger.warning(
+                        f"Skipping feature file with no features: {feature_type} ({file_path})"
+                    )
+                    continue
+
+                validated_files[feature_type] = file_path
+                logger.info(f"Validated {feature_type}: {feature_count} features")
+                continue
+
+            # GeoJSONSeq holds one feature per line; validate without a full parse
+            if file_path.suffix.lower() in self.GEOJSONSEQ_SUFFIXES:
+                try:
+                    feature_count = self._count_geojsonseq_features(file_path)
+                except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
+                    invalid_files.append(f"{feature_type}: Invalid GeoJSONSeq ({e})")
+                    continue
+
+                if feature_count == 0:
+                    empty_files.append(feature_type)
+                    logger.warning(
+                        f"Skipping feature file with no features: {feature_type} ({file_path})"
+                    )
+                    continue
+
+                validated_files[feature_type] = file_path
+                logger.info(f"Validated {feature_type}: {feature_count} features")
+                continue
+
             # Basic GeoJSON validation and check for features
             try:
                 with open(file_path) as f:
@@ -310,6 +351,47 @@ class TileGenerator:
                 
         return validated_files
 
+    def _count_flatgeobuf_features(self, file_path: Path) -> int:
+        """
+        Count features in a FlatGeobuf file from its header.
+
+        Args:
+            file_path: Path to FlatGeobuf file
+
+        Returns:
+            Number of features
+        """
+        import fiona
+
+        with fiona.open(file_path, driver="FlatGeobuf") as src:
+            return len(src)
+
+    def _count_geojsonseq_features(self, file_path: Path) -> int:
+        """
+        Count features in a GeoJSONSeq file, one line at a time.
+
+        Args:
+            file_path: Path to newline-delimited GeoJSON file
+
+        Returns:
+            Number of features
+
+        Raises:
+            ValueError: A line is not a GeoJSON Feature
+        """
+        count = 0
+        with open(file_path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                # RFC 8142 record separators are accepted by tippecanoe
+                line = line.strip().lstrip("\x1e")
+                if not line:
+                    continue
+                feature = json.loads(line)
+                if not isinstance(feature, dict) or feature.get("type") != "Feature":
+                    raise ValueError(f"line {line_number} is not a Feature")
+                count += 1
+        return count
+
     def _generate_cache_key(self, feature_files: dict[str, Path]) -> str:
         """
         Generate cache key for tile generation.
@@ -587,9 +669,14 @@ class TileGenerator:
                 f"--clip-bounding-box={bbox.west},{bbox.south},{bbox.east},{bbox.north}"
             )
 
-        # Performance optimizations for large datasets
+        # Performance optimizations for large datasets. Line-delimited input
+        # can always be split across readers without buffering the whole file.
+        has_geojsonseq = any(
+            path.suffix.lower() in self.GEOJSONSEQ_SUFFIXES
+            for path in feature_files.values()
+        )
         available_memory_gb = psutil.virtual_memory().available // (1024**3)
-        if available_memory_gb >= 8:
+        if has_geojsonseq or available_memory_gb >= 8:
             cmd.append("--read-parallel")
 
         return cmd
@@ -1094,7 +1181,10 @@ class TileGenerator:
                 try:
                     with open(file_path) as f:
                         content = f.read(10000)  # Sample
-                        feature_count = content.count('"type": "Feature"')
+                        if file_path.suffix.lower() in self.GEOJSONSEQ_SUFFIXES:
+                            feature_count = content.count("\n")
+                        else:
+                            feature_count = content.count('"type": "Feature"')
                         if feature_count > 0:
                             # Extrapolate based on sample
                             estimated_total = int((feature_count * size) / len(content))
@@ -3,6 +3,7 @@ Configuration models using Pydantic for type safety and validation.
 """
 
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Optional
 
@@ -152,6 +153,11 @@ class FeatureConfig(BaseModel):
             ]
         return v
 
+    @cached_property
+    def display_string(self) -> str:
+        """Get the feature types as a comma-separated string for display."""
+        return ", ".join(f.value for f in self.types)
+
 
 class PaletteConfig(BaseModel):
     """Style palette configuration."""
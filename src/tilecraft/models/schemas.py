@@ -34,6 +34,15 @@ class FeatureAttributes(BaseModel):
     )
     required: bool = Field(default=False, description="Whether attribute is required")
 
+    def _to_dict(self) -> dict:
+        """Serialize to a plain dict without Pydantic's model walk."""
+        return {
+            "name": self.name,
+            "type": self.type,
+            "description": self.description,
+            "required": self.required,
+        }
+
 
 class LayerSchema(BaseModel):
     """Vector tile layer schema."""
@@ -53,6 +62,19 @@ class LayerSchema(BaseModel):
     )
     buffer: Optional[int] = Field(default=None, description="Tile buffer in pixels")
 
+    def _to_dict(self) -> dict:
+        """Serialize to a plain dict without Pydantic's model walk."""
+        return {
+            "name": self.name,
+            "geometry_type": self.geometry_type,
+            "min_zoom": self.min_zoom,
+            "max_zoom": self.max_zoom,
+            "attributes": [attribute._to_dict() for attribute in self.attributes],
+            "description": self.description,
+            "simplification": self.simplification,
+            "buffer": self.buffer,
+        }
+
 
 class TileSchema(BaseModel):
     """Complete vector tile schema."""
@@ -79,6 +101,20 @@ class TileSchema(BaseModel):
         default=None, description="Tileset center [lon, lat, zoom]"
     )
 
+    def _to_dict(self) -> dict:
+        """Serialize to a plain dict without Pydantic's model walk."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "version": self.version,
+            "min_zoom": self.min_zoom,
+            "max_zoom": self.max_zoom,
+            "layers": [layer._to_dict() for layer in self.layers],
+            "attribution": self.attribution,
+            "bounds": list(self.bounds) if self.bounds is not None else None,
+            "center": list(self.center) if self.center is not None else None,
+        }
+
     def get_tippecanoe_args(self) -> list[str]:
         """Generate tippecanoe command arguments."""
         args = [
@@ -4,7 +4,11 @@ Utility modules for caching, validation, and preview generation.
 
 from .cache import CacheManager
 from .preview import PreviewGenerator
-from .system_check import SystemVerifier, verify_system_dependencies
+from .system_check import (
+    SystemVerifier,
+    verify_system_dependencies,
+    verify_system_dependencies_cached,
+)
 from .validation import validate_osm_data
 
 __all__ = [
@@ -13,4 +17,5 @@ __all__ = [
     "PreviewGenerator",
     "SystemVerifier",
     "verify_system_dependencies",
+    "verify_system_dependencies_cached",
 ]
@@ -2,15 +2,48 @@
 Cache management utilities.
 """
 
+import errno
 import hashlib
 import json
 import logging
+import os
+import tempfile
 from pathlib import Path
 from typing import Optional, Union
 
 logger = logging.getLogger(__name__)
 
 
+def user_cache_dir() -> Path:
+    """
+    Get the per-user cache directory for state shared across runs.
+
+    Returns:
+        $XDG_CACHE_HOME/tilecraft, defaulting to ~/.cache/tilecraft
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "tilecraft"
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write a file so that readers never observe a partial write.
+
+    Args:
+        path: Destination file; parent directories are created
+        data: File contents
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
 class CacheManager:
     """Manages caching of OSM data and intermediate processing results."""
 
@@ -99,7 +132,9 @@ class CacheManager:
         logger.debug(f"Cache miss: {key}")
         return None
 
-    def put(self, key: str, source_path: Path, suffix: str = "") -> Path:
+    def put(
+        self, key: str, source_path: Path, suffix: str = "", move: bool = False
+    ) -> Path:
         """
         Store file in cache.
 
@@ -107,6 +142,8 @@ class CacheManager:
             key: Cache key
             source_path: Path to source file
             suffix: File suffix/extension
+            move: Move the source into the cache instead of copying it; a
+                rename when both are on the same filesystem
 
         Returns:
             Path to cached file
@@ -121,7 +158,6 @@ class CacheManager:
             try:
                 cache_path.parent.mkdir(parents=True, exist_ok=True)
                 import shutil
-                import os
 
                 # Check if source file exists and is readable
                 if not source_path.exists():
@@ -144,11 +180,28 @@ class CacheManager:
                 if not os.access(cache_path.parent, os.W_OK):
                     raise PermissionError(f"Cannot write to cache directory: {cache_path.parent}")
 
-                # Perform atomic copy operation
-                temp_cache_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+                # Perform atomic copy operation; the temp name is per process so
+                # concurrent runs caching the same key do not collide
+                temp_cache_path = cache_path.with_name(
+                    f"{cache_path.name}.{os.getpid()}.tmp"
+                )
                 try:
-                    shutil.copy2(source_path, temp_cache_path)
-                    temp_cache_path.rename(cache_path)
+                    if move:
+                        try:
+                            # One atomic rename on the same filesystem; on
+                            # failure the source is still in place
+                            os.replace(source_path, cache_path)
+                        except OSError as e:
+                            if e.errno != errno.EXDEV:
+                                raise
+                            # Across filesystems copy first and only drop the
+                            # source once the cache entry is in place
+                            shutil.copy2(source_path, temp_cache_path)
+                            os.replace(temp_cache_path, cache_path)
+                            source_path.unlink()
+                    else:
+                        shutil.copy2(source_path, temp_cache_path)
+                        os.replace(temp_cache_path, cache_path)
                     logger.debug(f"Cached: {cache_path}")
                 except Exception:
                     # Cleanup temporary file on failure
@@ -169,19 +222,22 @@ class CacheManager:
 
         return cache_path
 
-    def cache_osm_data(self, bbox_str: str, data_path: Path) -> Path:
+    def cache_osm_data(
+        self, bbox_str: str, data_path: Path, move: bool = False
+    ) -> Path:
         """
         Cache OSM data file.
 
         Args:
             bbox_str: Bounding box string
             data_path: Path to OSM data file
+            move: Move the file into the cache instead of copying it
 
         Returns:
             Path to cached file
         """
         key = self._get_cache_key(f"osm_data_{bbox_str}")
-        return self.put(key, data_path, ".osm")
+        return self.put(key, data_path, ".osm", move=move)
 
     def get_cached_osm_data(self, bbox_str: str) -> Optional[Path]:
         """
@@ -8,6 +8,8 @@ import sqlite3
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from tilecraft.models.config import BoundingBox
 
 logger = logging.getLogger(__name__)
@@ -157,8 +159,9 @@ class PreviewGenerator:
                     source_config["url"] = f"http://localhost:8080/{source_name}"
         
         # Write modified style
-        with open(style_copy_path, "w") as f:
-            json.dump(style_data, f, indent=2)
+        style_copy_path.write_bytes(
+            orjson.dumps(style_data, option=orjson.OPT_INDENT_2)
+        )
         
         return style_copy_path
 
@@ -276,8 +279,9 @@ if __name__ == "__main__":
                         source_config["url"] = f"mbtiles://{{{tileset_name}}}"
             
             # Write modified style
-            with open(style_copy_path, "w") as f:
-                json.dump(style_data, f, indent=2)
+            style_copy_path.write_bytes(
+                orjson.dumps(style_data, option=orjson.OPT_INDENT_2)
+            )
             
             config["styles"][style_name] = {
                 "style": f"styles/{style_name}.json",
@@ -287,8 +291,7 @@ if __name__ == "__main__":
             }
         
         # Write config file
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
+        config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Tileserver-gl-light config created: {config_path}")
 
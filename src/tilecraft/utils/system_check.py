@@ -2,16 +2,70 @@
 System dependency verification utilities.
 """
 
+import hashlib
+import importlib.util
+import json
 import logging
+import os
 import shutil
 import subprocess
 import sys
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Seconds a successful dependency check is reused by generate runs
+_SYSDEPS_CACHE_TTL = 24 * 60 * 60
+
+# Seconds full verification results are reused by repeated check runs; short
+# enough to notice a dependency installed right after `tilecraft check --fix`
+_VERIFY_RESULTS_TTL = 60
+
+
+def _file_signature(path: Optional[str]) -> tuple:
+    """Return the path with its modification time and size, if it exists."""
+    try:
+        stat = os.stat(path) if path else None
+    except OSError:
+        stat = None
+    return (path, stat and stat.st_mtime, stat and stat.st_size)
+
+
+def _dependency_cache_key() -> str:
+    """
+    Hash the environment that determines dependency check results.
+
+    Covers PATH, the interpreter, the resolved tippecanoe/osmium binaries and
+    the installed osmium (pyosmium) and osgeo (GDAL) Python packages, each
+    with its modification time and size, so installing or upgrading any of
+    them changes the key.
+
+    Returns:
+        Hex digest identifying the current environment
+    """
+    binaries = [
+        (name, *_file_signature(shutil.which(name)))
+        for name in ("tippecanoe", "osmium")
+    ]
+
+    packages = []
+    for name in ("osmium", "osgeo"):
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):
+            spec = None
+        packages.append((name, *_file_signature(spec and spec.origin)))
+
+    return hashlib.blake2b(
+        repr(
+            (os.environ.get("PATH", ""), sys.executable, binaries, packages)
+        ).encode(),
+        digest_size=16,
+    ).hexdigest()
+
 
 @dataclass
 class DependencyCheck:
@@ -50,6 +104,47 @@ class SystemVerifier:
         
         return self.results
 
+    def verify_all_dependencies_cached(
+        self, max_age: float = _VERIFY_RESULTS_TTL
+    ) -> dict[str, DependencyCheck]:
+        """
+        Verify all dependencies, reusing results from a recent run.
+
+        Args:
+            max_age: Seconds a previous verification stays valid
+
+        Returns:
+            Dictionary of dependency names to check results
+        """
+        from tilecraft.utils.cache import atomic_write_bytes, user_cache_dir
+
+        cache_path = user_cache_dir() / f"sysverify-{_dependency_cache_key()}.json"
+
+        try:
+            if time.time() - cache_path.stat().st_mtime < max_age:
+                cached = json.loads(cache_path.read_bytes())
+                self.results = {
+                    name: DependencyCheck(**fields) for name, fields in cached.items()
+                }
+                return self.results
+        except (OSError, ValueError, TypeError):
+            # Missing, expired or unreadable; verify again
+            pass
+
+        self.verify_all_dependencies()
+
+        try:
+            atomic_write_bytes(
+                cache_path,
+                json.dumps(
+                    {name: asdict(result) for name, result in self.results.items()}
+                ).encode(),
+            )
+        except OSError as e:
+            logger.debug(f"Could not cache dependency results: {e}")
+
+        return self.results
+
     def _verify_dependency(self, name: str) -> DependencyCheck:
         """Verify a specific dependency."""
         if name == "python":
@@ -334,4 +429,38 @@ def verify_system_dependencies(verbose: bool = False) -> bool:
         verifier.print_status(verbose=True)
     
     can_run, missing = verifier.can_run_tilecraft()
-    return can_run
\ No newline at end of file
+    return can_run
+
+
+def verify_system_dependencies_cached() -> bool:
+    """
+    Verify critical dependencies, reusing a recent successful check.
+
+    Only successes are cached, so missing dependencies are re-probed on every
+    call. Installing or upgrading tippecanoe or osmium invalidates the cache,
+    and setting TILECRAFT_SKIP_DEPCACHE bypasses it.
+
+    Returns:
+        True if all critical dependencies are available
+    """
+    if os.environ.get("TILECRAFT_SKIP_DEPCACHE"):
+        return verify_system_dependencies(verbose=False)
+
+    from tilecraft.utils.cache import atomic_write_bytes, user_cache_dir
+
+    cache_path = user_cache_dir() / f"sysdeps-{_dependency_cache_key()}.json"
+
+    try:
+        if time.time() - cache_path.stat().st_mtime < _SYSDEPS_CACHE_TTL:
+            return True
+    except OSError:
+        pass
+
+    can_run = verify_system_dependencies(verbose=False)
+    if can_run:
+        try:
+            atomic_write_bytes(cache_path, b'{"can_run": true}')
+        except OSError as e:
+            logger.debug(f"Could not cache dependency check: {e}")
+
+    return can_run
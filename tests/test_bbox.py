@@ -0,0 +1,107 @@
+"""
+Tests for bounding box utilities.
+"""
+
+import shutil
+
+from tilecraft.core.bbox import (
+    bbox_to_overpass_id_query,
+    bbox_to_overpass_query,
+    bbox_to_poly,
+    ids_to_overpass_geom_query,
+)
+
+
+class TestBboxToPoly:
+    """Tests for .poly file generation."""
+
+    def test_writes_closed_ring(self, sample_bbox, temp_dir):
+        """Test that the polygon ring is written and closed."""
+        poly_path = bbox_to_poly(sample_bbox, temp_dir / "area" / "bbox.poly")
+
+        lines = poly_path.read_text().splitlines()
+        assert lines[:2] == ["polygon", "1"]
+        assert lines[2] == lines[6] == "  -105.5  39.5"
+        assert lines[-2:] == ["END", "END"]
+
+    def test_recreates_removed_directory(self, sample_bbox, temp_dir):
+        """Test that a directory removed after first use is created again."""
+        output_dir = temp_dir / "area"
+        bbox_to_poly(sample_bbox, output_dir / "first.poly")
+        shutil.rmtree(output_dir)
+
+        assert bbox_to_poly(sample_bbox, output_dir / "second.poly").exists()
+
+
+class TestOverpassQuery:
+    """Tests for Overpass query generation."""
+
+    def test_merges_statements_sharing_a_key(self, sample_bbox):
+        """Test that values for the same element and key become one regex union."""
+        query = bbox_to_overpass_query(sample_bbox, ["forest", "woods", "wetlands"])
+
+        assert query.count('way["natural"') == 1
+        assert 'way["natural"~"^(forest|marsh|scrub|swamp|wetland|wood)$"]' in query
+        assert 'way["landuse"~"^(forest|forestry)$"]' in query
+
+    def test_key_only_filter_absorbs_values(self, sample_bbox):
+        """Test that a filter on any value of a key replaces value filters."""
+        query = bbox_to_overpass_query(sample_bbox, ["churches", "buildings"])
+
+        assert 'way["building"]' in query
+        assert 'way["building"~' not in query
+
+    def test_drops_statements_covered_without_extra_filters(self, sample_bbox):
+        """Test that extra-filtered statements are dropped when already covered."""
+        query = bbox_to_overpass_query(sample_bbox, ["lakes", "water"])
+
+        assert 'way["natural"="water"]' in query
+        assert "[!waterway]" not in query
+        assert '["water"~' not in query
+
+    def test_bbox_set_once_in_header(self, sample_bbox):
+        """Test that the bbox is a global setting rather than per statement."""
+        query = bbox_to_overpass_query(sample_bbox, ["rivers", "buildings"])
+
+        assert query.startswith("[out:xml][timeout:300][bbox:39.5,-105.5,40.0,-105.0];")
+        assert query.count("39.5,-105.5,40.0,-105.0") == 1
+
+    def test_metadata_only_on_request(self, sample_bbox):
+        """Test that element metadata is left out unless asked for."""
+        assert bbox_to_overpass_query(sample_bbox, ["rivers"]).endswith("out geom;\n")
+        assert bbox_to_overpass_query(
+            sample_bbox, ["rivers"], include_metadata=True
+        ).endswith("out meta geom;\n")
+
+    def test_equivalent_requests_share_cached_query(self, sample_bbox):
+        """Test that feature order and duplicates do not change the cache key."""
+        first = bbox_to_overpass_query(sample_bbox, ["rivers", "forest"])
+        second = bbox_to_overpass_query(sample_bbox, ["forest", "rivers", "rivers"])
+
+        assert first is second
+
+    def test_unrecognized_features_only(self, sample_bbox):
+        """Test that unknown feature types produce an empty union."""
+        query = bbox_to_overpass_query(sample_bbox, ["not_a_feature"])
+
+        assert "No valid feature types provided" in query
+
+    def test_no_features(self, sample_bbox):
+        """Test that an empty request returns the minimal query."""
+        assert "No valid feature types provided" in bbox_to_overpass_query(sample_bbox, [])
+
+    def test_id_query_selects_same_statements(self, sample_bbox):
+        """Test that the id query differs from the geometry query only in output."""
+        geom_query = bbox_to_overpass_query(sample_bbox, ["rivers", "forest"])
+        id_query = bbox_to_overpass_id_query(sample_bbox, ["rivers", "forest"])
+
+        assert id_query.startswith("[out:csv(::type,::id;false)]")
+        assert id_query.endswith("out ids;\n")
+        assert id_query.split("\n")[1:-2] == geom_query.split("\n")[1:-2]
+
+    def test_geometry_query_by_ids(self):
+        """Test fetching geometry for a batch of element ids."""
+        query = ids_to_overpass_geom_query("way", iter([1, 22, 333]))
+
+        assert "way(id:1,22,333);" in query
+        assert query.endswith("out geom;\n")
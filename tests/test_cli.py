@@ -2,11 +2,21 @@
 Tests for the CLI interface.
 """
 
+import shutil
+import subprocess
+import sys
+import time
+from unittest.mock import Mock, patch
+
+import click
 import pytest
 from click.testing import CliRunner
 
 from tilecraft.cli import main
-from tilecraft.models.config import BoundingBox
+from tilecraft.cli._cmd_batch import _load_batch_configs, batch
+from tilecraft.cli._cmd_features import _FLAT
+from tilecraft.cli._cmd_generate import _run_pipeline_steps
+from tilecraft.models.config import BoundingBox, FeatureType
 
 
 class TestCLI:
@@ -112,3 +122,168 @@ class TestCLI:
         """Test full command with all options (without actual processing)."""
         # This would require mocking the pipeline
         pass
+
+    def test_subcommands_load_lazily(self):
+        """Test that listing commands does not import their modules."""
+        code = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from tilecraft.cli import cli\n"
+            "result = CliRunner().invoke(cli, ['features', '--count', '1'])\n"
+            "assert result.exit_code == 0, result.output\n"
+            "print(sorted(m for m in sys.modules if m.startswith('tilecraft.cli.')))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert "tilecraft.cli._cmd_features" in output
+        assert "tilecraft.cli._cmd_generate" not in output
+        assert "tilecraft.cli._cmd_check" not in output
+
+    def test_feature_categories_cover_feature_types(self):
+        """Test that the features listing shows every feature type exactly once."""
+        values = [value for _, value, _ in _FLAT]
+        assert sorted(values) == sorted(feature.value for feature in FeatureType)
+
+
+class _FakeBatchPipeline:
+    """Pipeline stand-in that keeps a temp file around like a tippecanoe run."""
+
+    def __init__(self, config):
+        self.config = config
+
+    def run(self):
+        temp_file = self.config.tiles.temp_dir / "in_progress.mbtiles"
+        temp_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file.write_text("tiles")
+        time.sleep(0.5)
+        if not temp_file.exists():
+            raise RuntimeError("Temporary output file not found")
+        return {"tiles": self.config.output.tiles_dir / "tiles.mbtiles"}
+
+    def cleanup(self):
+        shutil.rmtree(self.config.tiles.temp_dir, ignore_errors=True)
+
+
+class TestBatchConfig:
+    """Tests for batch file loading."""
+
+    def test_load_batch_configs_applies_defaults(self, tmp_path):
+        """Test that jobs inherit defaults and share one cache directory."""
+        batch_file = tmp_path / "batch.yaml"
+        batch_file.write_text(
+            "defaults:\n"
+            "  features: rivers,forest\n"
+            "  palette: subalpine dusk\n"
+            "jobs:\n"
+            "  - name: moab\n"
+            "    bbox: '-109.6,38.5,-109.4,38.7'\n"
+            "  - bbox: '-105.3,40.0,-105.2,40.1'\n"
+            "    palette: desert sunset\n"
+        )
+
+        configs = _load_batch_configs(batch_file, tmp_path / "out", True, False)
+
+        assert [c.output.name for c in configs] == ["moab", "job_2"]
+        assert configs[0].palette.name == "subalpine dusk"
+        assert configs[1].palette.name == "desert sunset"
+        assert configs[0].output.base_dir == tmp_path / "out" / "moab"
+        assert configs[0].output.cache_dir == configs[1].output.cache_dir
+
+    def test_load_batch_configs_missing_field(self, tmp_path):
+        """Test that a job without required settings is rejected."""
+        batch_file = tmp_path / "batch.yaml"
+        batch_file.write_text("jobs:\n  - bbox: '1,2,3,4'\n")
+
+        with pytest.raises(click.ClickException, match="missing 'features'"):
+            _load_batch_configs(batch_file, tmp_path, True, False)
+
+    def test_load_batch_configs_separates_temp_dirs(self, tmp_path):
+        """Test that every job gets its own temporary directory."""
+        batch_file = tmp_path / "batch.yaml"
+        batch_file.write_text(
+            "defaults:\n"
+            "  features: rivers\n"
+            "  palette: subalpine dusk\n"
+            "  bbox: '-109.6,38.5,-109.4,38.7'\n"
+            "jobs:\n"
+            "  - name: a\n"
+            "  - name: b\n"
+        )
+
+        configs = _load_batch_configs(batch_file, tmp_path / "out", True, False)
+
+        assert configs[0].tiles.temp_dir == tmp_path / "out" / "a" / "tmp"
+        assert configs[0].tiles.temp_dir != configs[1].tiles.temp_dir
+
+
+class TestBatchCommand:
+    """Tests for running batch jobs."""
+
+    def _write_batch_file(self, tmp_path, bboxes):
+        batch_file = tmp_path / "batch.yaml"
+        jobs = "".join(
+            f"  - name: job{i}\n    bbox: '{bbox}'\n" for i, bbox in enumerate(bboxes)
+        )
+        batch_file.write_text(
+            "defaults:\n"
+            "  features: rivers\n"
+            "  palette: subalpine dusk\n"
+            f"jobs:\n{jobs}"
+        )
+        return batch_file
+
+    def test_parallel_jobs_keep_their_temp_files(self, tmp_path):
+        """Test that one job's cleanup does not remove another job's temp files."""
+        batch_file = self._write_batch_file(
+            tmp_path, ["-109.6,38.5,-109.4,38.7", "-105.3,40.0,-105.2,40.1"]
+        )
+
+        with patch("tilecraft.core.pipeline.TilecraftPipeline", _FakeBatchPipeline):
+            result = CliRunner().invoke(
+                batch,
+                [str(batch_file), "--output", str(tmp_path / "out"), "-j", "2"],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert "All 2 jobs completed" in result.output
+
+    def test_shared_bbox_downloaded_once(self, tmp_path):
+        """Test that jobs sharing a bbox download it once before fanning out."""
+        batch_file = self._write_batch_file(
+            tmp_path, ["-109.6,38.5,-109.4,38.7", "-109.6,38.5,-109.4,38.7"]
+        )
+
+        with patch(
+            "tilecraft.core.pipeline.TilecraftPipeline", _FakeBatchPipeline
+        ), patch(
+            "tilecraft.core.osm_downloader.OSMDownloader.download"
+        ) as mock_download:
+            result = CliRunner().invoke(
+                batch,
+                [str(batch_file), "--output", str(tmp_path / "out"), "-j", "2"],
+            )
+
+        assert result.exit_code == 0, result.output
+        mock_download.assert_called_once()
+
+
+class TestPipelineSteps:
+    """Test the overlapped pipeline step runner."""
+
+    def test_schema_failure_stops_data_steps(self):
+        """Test that a failed schema step aborts before the next data step."""
+        pipeline = Mock()
+        pipeline.generate_schema.side_effect = RuntimeError("no schema")
+        # The download outlasts the failing schema step running beside it,
+        # so the failure is seen before extraction at the latest
+        pipeline.download_osm_data.side_effect = lambda: time.sleep(0.2)
+
+        with pytest.raises(RuntimeError, match="no schema"):
+            _run_pipeline_steps(
+                pipeline, lambda step_name, func, *args: func(*args)
+            )
+
+        pipeline.extract_features.assert_not_called()
+        pipeline.generate_tiles.assert_not_called()
@@ -2,16 +2,20 @@
 Tests for feature extraction functionality.
 """
 
+import io
 import json
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import orjson
+import osmium
 import pytest
 
 from tilecraft.core.feature_extractor import (
     FeatureExtractor,
     GeometryValidationError,
+    MultiFeatureHandler,
     OSMFeatureHandler,
     OSMProcessingError,
 )
@@ -91,46 +95,96 @@ class TestOSMFeatureHandler:
 
         assert handler.feature_type == FeatureType.RIVERS
         assert handler.tag_filters == tag_filters
-        assert handler.features == []
+        assert handler.feature_count == 0
         assert handler.processed_count == 0
         assert handler.error_count == 0
 
-    def test_matches_filters_exact_match(self):
-        """Test tag matching with exact values."""
-        tag_filters = {"waterway": ["river", "stream"]}
-        handler = OSMFeatureHandler(FeatureType.RIVERS, tag_filters)
+    def test_streams_feature_collection(self):
+        """Test that written features and counters form a FeatureCollection."""
+        output = io.BytesIO()
+        handler = OSMFeatureHandler(
+            FeatureType.RIVERS, {"waterway": ["river"]}, output_fp=output
+        )
 
-        # Mock tags
-        mock_tags = Mock()
-        mock_tags.__contains__ = Mock(return_value=True)
-        mock_tags.__getitem__ = Mock(return_value="river")
+        handler.write_feature(b'{"type":"Feature","id":1}')
+        handler.write_feature(b'{"type":"Feature","id":2}')
+        handler.processed_count = 2
+        handler.close()
 
-        assert handler._matches_filters(mock_tags)
+        data = json.loads(output.getvalue())
+        assert data["type"] == "FeatureCollection"
+        assert [f["id"] for f in data["features"]] == [1, 2]
+        assert data["properties"]["feature_type"] == "rivers"
+        assert data["properties"]["processed_count"] == 2
+        assert handler.feature_count == 2
 
-    def test_matches_filters_wildcard(self):
-        """Test tag matching with wildcard."""
-        tag_filters = {"building": ["*"]}
-        handler = OSMFeatureHandler(FeatureType.BUILDINGS, tag_filters)
 
-        mock_tags = Mock()
-        mock_tags.__contains__ = Mock(return_value=True)
-        mock_tags.__getitem__ = Mock(return_value="residential")
+class TestMultiFeatureHandler:
+    """Tests for single-pass multi-feature handler."""
 
-        assert handler._matches_filters(mock_tags)
+    def test_dispatches_to_matching_feature_types(self):
+        """Test that one element is added to every feature type it matches."""
+        mappings = {
+            FeatureType.RIVERS: {"waterway": ["river"]},
+            FeatureType.WATERWAYS: {"waterway": ["river", "canal"]},
+            FeatureType.BUILDINGS: {"building": ["*"]},
+        }
+        handler = MultiFeatureHandler(
+            mappings, {feature_type: io.BytesIO() for feature_type in mappings}
+        )
 
-    def test_matches_filters_no_match(self):
-        """Test tag matching with no match."""
-        tag_filters = {"waterway": ["river"]}
-        handler = OSMFeatureHandler(FeatureType.RIVERS, tag_filters)
+        tag = Mock(k="waterway", v="river")
+        matched = handler._matching_handlers([tag])
+
+        assert [h.feature_type for h in matched] == [
+            FeatureType.RIVERS,
+            FeatureType.WATERWAYS,
+        ]
+
+    def test_pattern_and_wildcard_matches(self):
+        """Test wildcard and pattern filters in the tag key index."""
+        mappings = {
+            FeatureType.BUILDINGS: {"building": ["*"]},
+            FeatureType.ROADS: {"highway": ["~primary"]},
+        }
+        handler = MultiFeatureHandler(
+            mappings, {feature_type: io.BytesIO() for feature_type in mappings}
+        )
+
+        matched = handler._matching_handlers(
+            [Mock(k="building", v="yes"), Mock(k="highway", v="primary_link")]
+        )
 
-        mock_tags = Mock()
-        mock_tags.__contains__ = Mock(return_value=False)
+        assert {h.feature_type for h in matched} == {
+            FeatureType.BUILDINGS,
+            FeatureType.ROADS,
+        }
+        assert handler._matching_handlers([Mock(k="name", v="building")]) == []
 
-        assert not handler._matches_filters(mock_tags)
+    def test_matches_exact_value(self):
+        """Test tag matching with exact values."""
+        mappings = {FeatureType.RIVERS: {"waterway": ["river", "stream"]}}
+        handler = MultiFeatureHandler(
+            mappings, {feature_type: io.BytesIO() for feature_type in mappings}
+        )
+
+        matched = handler._matching_handlers([Mock(k="waterway", v="stream")])
+
+        assert [h.feature_type for h in matched] == [FeatureType.RIVERS]
+
+    def test_no_match(self):
+        """Test tag matching with no match."""
+        mappings = {FeatureType.RIVERS: {"waterway": ["river"]}}
+        handler = MultiFeatureHandler(
+            mappings, {feature_type: io.BytesIO() for feature_type in mappings}
+        )
+
+        assert handler._matching_handlers([Mock(k="waterway", v="canal")]) == []
+        assert handler._matching_handlers([Mock(k="natural", v="river")]) == []
 
     def test_create_point_feature(self):
         """Test point feature creation."""
-        handler = OSMFeatureHandler(FeatureType.RIVERS, {})
+        handler = MultiFeatureHandler({}, {})
 
         # Mock node
         mock_node = Mock()
@@ -151,7 +205,7 @@ class TestOSMFeatureHandler:
 
     def test_create_point_feature_invalid_location(self):
         """Test point feature creation with invalid location."""
-        handler = OSMFeatureHandler(FeatureType.RIVERS, {})
+        handler = MultiFeatureHandler({}, {})
 
         # Mock node with invalid location
         mock_node = Mock()
@@ -162,7 +216,7 @@ class TestOSMFeatureHandler:
 
     def test_determine_geometry_type_polygon(self):
         """Test polygon geometry type determination."""
-        handler = OSMFeatureHandler(FeatureType.BUILDINGS, {})
+        handler = MultiFeatureHandler({}, {})
 
         tags = {"building": "residential"}
         is_closed = True
@@ -172,7 +226,7 @@ class TestOSMFeatureHandler:
 
     def test_determine_geometry_type_linestring(self):
         """Test linestring geometry type determination."""
-        handler = OSMFeatureHandler(FeatureType.ROADS, {})
+        handler = MultiFeatureHandler({}, {})
 
         tags = {"highway": "primary"}
         is_closed = False
@@ -182,7 +236,7 @@ class TestOSMFeatureHandler:
 
     def test_determine_geometry_type_explicit_area(self):
         """Test explicit area tag handling."""
-        handler = OSMFeatureHandler(FeatureType.PARKS, {})
+        handler = MultiFeatureHandler({}, {})
 
         tags = {"leisure": "park", "area": "yes"}
         is_closed = True
@@ -365,6 +419,33 @@ class TestFeatureExtractor:
         ):
             extractor._validate_geojson_file(geojson_path)
 
+    def test_validate_large_geojson_file_samples_features(
+        self, feature_extractor, temp_dir
+    ):
+        """Test that files over the read limit are validated from a sample."""
+        features = [
+            {
+                "type": "Feature",
+                "properties": {},
+                "geometry": {"type": "Point", "coordinates": coordinates},
+            }
+            for coordinates in ([0, 0], [0, 0, 0])
+        ]
+        geojson_path = temp_dir / "large.geojson"
+        geojson_path.write_bytes(
+            orjson.dumps({"type": "FeatureCollection", "features": features})
+        )
+
+        # Too large to load whole, though both features fit in the sample
+        head_bytes = geojson_path.stat().st_size - 2
+        with patch(
+            "tilecraft.core.feature_extractor._VALIDATION_HEAD_BYTES", head_bytes
+        ):
+            with pytest.raises(
+                GeometryValidationError, match="Feature 1 has invalid Point"
+            ):
+                feature_extractor._validate_geojson_file(geojson_path)
+
     def test_count_features(self, temp_dir):
         """Test feature counting."""
         geojson_data = {
@@ -421,54 +502,73 @@ class TestFeatureExtractor:
         count = extractor._count_features(nonexistent_path)
         assert count == 0
 
-    @patch("osmium.apply")
-    def test_extract_feature_type_success(
-        self, mock_osmium_apply, feature_extractor, temp_dir
+    def test_extract_feature_types_single_pass(
+        self, feature_extractor, temp_dir, sample_osm_data
     ):
-        """Test successful feature extraction."""
-        # Create mock OSM file
-        osm_path = temp_dir / "test.osm"
-        osm_path.touch()
-
-        # Mock progress
+        """Test that several feature types are extracted from one pass."""
         mock_progress = Mock()
         mock_task_id = 1
+        output_paths = {
+            FeatureType.RIVERS: temp_dir / "rivers.geojson",
+            FeatureType.FOREST: temp_dir / "forest.geojson",
+        }
 
-        # Mock osmium handler
-        with patch(
-            "tilecraft.core.feature_extractor.OSMFeatureHandler"
-        ) as mock_handler_class:
-            mock_handler = Mock()
-            mock_handler.features = [
-                {
-                    "type": "Feature",
-                    "properties": {"waterway": "river"},
-                    "geometry": {"type": "Point", "coordinates": [-104.5, 39.5]},
-                }
-            ]
-            mock_handler.processed_count = 1
-            mock_handler.error_count = 0
-            mock_handler_class.return_value = mock_handler
+        with patch("osmium.apply", wraps=osmium.apply) as mock_osmium_apply:
+            result = feature_extractor._extract_feature_types(
+                sample_osm_data, output_paths, mock_progress, mock_task_id
+            )
 
-            output_path = temp_dir / "rivers.geojson"
+        assert result == output_paths
+        mock_osmium_apply.assert_called_once()
 
-            result = feature_extractor._extract_feature_type(
-                osm_path, FeatureType.RIVERS, output_path, mock_progress, mock_task_id
-            )
+        # Verify GeoJSON content
+        with open(output_paths[FeatureType.RIVERS]) as f:
+            data = json.load(f)
+
+        assert data["type"] == "FeatureCollection"
+        assert len(data["features"]) == 1
+        assert data["features"][0]["properties"]["waterway"] == "river"
+        assert data["properties"]["nodes_seen"] == 1
 
-            assert result == output_path
-            assert output_path.exists()
+        # The forest way has no node locations, so it yields no geometry
+        with open(output_paths[FeatureType.FOREST]) as f:
+            data = json.load(f)
 
-            # Verify GeoJSON content
-            with open(output_path) as f:
-                data = json.load(f)
+        assert data["features"] == []
+        assert data["properties"]["ways_matched"] == 1
 
-            assert data["type"] == "FeatureCollection"
-            assert len(data["features"]) == 1
-            assert data["features"][0]["properties"]["waterway"] == "river"
+        # Counts come from the recorded properties
+        assert feature_extractor._count_features(output_paths[FeatureType.RIVERS]) == 1
+
+    def test_extract_feature_types_in_workers(
+        self, feature_extractor, temp_dir, sample_osm_data
+    ):
+        """Test that feature types split across worker processes are extracted."""
+        feature_extractor.MAX_WORKERS = 2
+        feature_extractor.PARALLEL_MIN_BYTES = 0
+        output_paths = {
+            FeatureType.RIVERS: temp_dir / "rivers.geojson",
+            FeatureType.FOREST: temp_dir / "forest.geojson",
+        }
+
+        result = feature_extractor._extract_feature_types(
+            sample_osm_data, output_paths, Mock(), 1
+        )
+
+        assert result == output_paths
+        with open(output_paths[FeatureType.RIVERS]) as f:
+            assert len(json.load(f)["features"]) == 1
+        with open(output_paths[FeatureType.FOREST]) as f:
+            assert json.load(f)["properties"]["ways_matched"] == 1
+
+    def test_small_input_extracted_in_process(self, feature_extractor, sample_osm_data):
+        """Test that inputs below the parallel threshold use a single process."""
+        feature_extractor.MAX_WORKERS = 4
+
+        assert feature_extractor._worker_count(sample_osm_data, 10) == 1
 
     @patch("osmium.apply")
-    def test_extract_feature_type_osmium_error(
+    def test_extract_feature_types_osmium_error(
         self, mock_osmium_apply, feature_extractor, temp_dir
     ):
         """Test feature extraction with osmium error."""
@@ -481,13 +581,13 @@ class TestFeatureExtractor:
         mock_progress = Mock()
         mock_task_id = 1
 
-        output_path = temp_dir / "rivers.geojson"
+        output_paths = {FeatureType.RIVERS: temp_dir / "rivers.geojson"}
 
         with pytest.raises(
             OSMProcessingError, match="OSM processing failed for rivers"
         ):
-            feature_extractor._extract_feature_type(
-                osm_path, FeatureType.RIVERS, output_path, mock_progress, mock_task_id
+            feature_extractor._extract_feature_types(
+                osm_path, output_paths, mock_progress, mock_task_id
             )
 
     def test_extract_missing_file(self, feature_extractor):
@@ -524,7 +624,7 @@ class TestFeatureExtractor:
         assert not temp_file.exists()
 
     @patch(
-        "tilecraft.core.feature_extractor.FeatureExtractor._extract_feature_type_with_retry"
+        "tilecraft.core.feature_extractor.FeatureExtractor._extract_feature_types_with_retry"
     )
     def test_extract_with_cache_hit(
         self, mock_extract_retry, feature_extractor, temp_dir, sample_osm_data
@@ -562,7 +662,7 @@ class TestFeatureExtractor:
         assert result[FeatureType.RIVERS.value] == cached_path
 
     @patch(
-        "tilecraft.core.feature_extractor.FeatureExtractor._extract_feature_type_with_retry"
+        "tilecraft.core.feature_extractor.FeatureExtractor._extract_feature_types_with_retry"
     )
     def test_extract_with_cache_miss(
         self, mock_extract_retry, feature_extractor, temp_dir, sample_osm_data
@@ -570,7 +670,7 @@ class TestFeatureExtractor:
         """Test extraction with cache miss."""
         # Setup mock return value
         output_path = temp_dir / "rivers.geojson"
-        mock_extract_retry.return_value = output_path
+        mock_extract_retry.return_value = {FeatureType.RIVERS: output_path}
 
         # Create the output file
         geojson_data = {
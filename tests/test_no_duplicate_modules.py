@@ -0,0 +1,26 @@
+"""
+Tests guarding against duplicated source modules.
+"""
+
+from collections import defaultdict
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+
+class TestNoDuplicateModules:
+    """Tests that every source file maps to a distinct module name."""
+
+    def test_no_duplicate_module_names(self):
+        """Test that no two files under src/ resolve to the same module."""
+        modules = defaultdict(list)
+
+        for path in SRC_DIR.rglob("*.py"):
+            parts = path.relative_to(SRC_DIR).with_suffix("").parts
+            if parts[-1] == "__init__":
+                parts = parts[:-1]
+            # Case-insensitive filesystems would load either copy
+            modules[".".join(parts).casefold()].append(path)
+
+        duplicates = {name: paths for name, paths in modules.items() if len(paths) > 1}
+        assert not duplicates, f"Duplicate modules found: {duplicates}"
@@ -136,6 +136,22 @@ class TestOSMDownloader:
             assert result == temp_file
             cache_manager.cache_osm_data.assert_called_once()
 
+    def test_failed_cache_move_keeps_download(self, downloader, sample_bbox):
+        """Test the downloaded file survives a failed move into the cache."""
+        temp_file = downloader.temp_dir / "osm_data_move_test.osm"
+        temp_file.write_text("<osm>test data</osm>")
+
+        with patch(
+            "tilecraft.utils.cache.os.replace", side_effect=PermissionError("denied")
+        ):
+            result = downloader.cache_manager.cache_osm_data(
+                sample_bbox.to_string(), temp_file, move=True
+            )
+
+        assert result == temp_file
+        assert temp_file.read_text() == "<osm>test data</osm>"
+        temp_file.unlink()
+
     def test_retry_on_rate_limit(self, downloader, sample_bbox, cache_manager):
         """Test retry behavior on rate limit."""
         cache_manager.get_cached_osm_data = Mock(return_value=None)
@@ -180,6 +196,42 @@ class TestOSMDownloader:
             with pytest.raises(TimeoutError):
                 downloader.download(sample_bbox)
 
+    def test_large_bbox_downloads_ids_then_geometry(self, downloader, cache_manager):
+        """Test that large bboxes are fetched as an id query plus id batches."""
+        cache_manager.get_cached_osm_data = Mock(return_value=None)
+        cache_manager.cache_osm_data = Mock(side_effect=lambda key, path, move: path)
+        downloader.ID_BATCH_SIZE = 2
+        large_bbox = BoundingBox(west=-110.0, south=35.0, east=-105.0, north=40.0)
+        queries = []
+
+        def mock_download_with_retry(query, bbox_str, part=None):
+            queries.append(query)
+            path = downloader.temp_dir / f"test_part_{len(queries)}.osm"
+            if part == "ids":
+                path.write_text("way\t30\nnode\t2\nway\t10\nway\t20\n")
+            else:
+                path.write_text(
+                    '<?xml version="1.0" encoding="UTF-8"?>\n<osm version="0.6">\n'
+                    f"  <note>part {part}</note>\n  <{part}/>\n</osm>\n"
+                )
+            return path
+
+        with patch.object(
+            downloader, "_download_with_retry", side_effect=mock_download_with_retry
+        ):
+            result = downloader.download(large_bbox)
+
+        assert queries[0].rstrip().endswith("out ids;")
+        assert [q.split("\n")[1] for q in queries[1:]] == [
+            "node(id:2);",
+            "way(id:10,20);",
+            "way(id:30);",
+        ]
+        lines = result.read_text().splitlines()
+        assert lines[2:-1] == ["  <node_0/>", "  <way_0/>", "  <way_2/>"]
+        assert lines[-1] == "</osm>"
+        result.unlink()
+
     def test_get_download_info(self, downloader, sample_bbox):
         """Test download information retrieval."""
         info = downloader.get_download_info(sample_bbox)
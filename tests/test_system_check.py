@@ -9,7 +9,13 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from tilecraft.utils.system_check import DependencyCheck, SystemVerifier, verify_system_dependencies
+from tilecraft.utils.system_check import (
+    DependencyCheck,
+    SystemVerifier,
+    _dependency_cache_key,
+    verify_system_dependencies,
+    verify_system_dependencies_cached,
+)
 
 
 class TestDependencyCheck:
@@ -226,6 +232,53 @@ class TestSystemVerifier:
         assert result.available is False
         assert "Unknown dependency" in result.error
 
+    def test_verify_all_dependencies_cached(self, tmp_path, monkeypatch):
+        """Test that recent verification results are reused."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        check = DependencyCheck(name="python", available=True, version="3.11.0")
+
+        with patch.object(
+            SystemVerifier, "_verify_dependency", return_value=check
+        ) as mock_verify:
+            first = SystemVerifier().verify_all_dependencies_cached()
+            calls = mock_verify.call_count
+            second = SystemVerifier().verify_all_dependencies_cached()
+
+        assert mock_verify.call_count == calls
+        assert second == first
+
+    def test_verify_all_dependencies_cached_expired(self, tmp_path, monkeypatch):
+        """Test that expired results are verified again."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        check = DependencyCheck(name="python", available=True)
+
+        with patch.object(
+            SystemVerifier, "_verify_dependency", return_value=check
+        ) as mock_verify:
+            SystemVerifier().verify_all_dependencies_cached()
+            calls = mock_verify.call_count
+            SystemVerifier().verify_all_dependencies_cached(max_age=0)
+
+        assert mock_verify.call_count == 2 * calls
+
+    def test_cache_key_tracks_osmium_package(self, tmp_path):
+        """Test that upgrading the osmium Python package changes the cache key."""
+        package_init = tmp_path / "osmium" / "__init__.py"
+        package_init.parent.mkdir()
+        package_init.write_text("__version__ = '3.6.0'")
+
+        with patch(
+            "tilecraft.utils.system_check.importlib.util.find_spec",
+            side_effect=lambda name: (
+                Mock(origin=str(package_init)) if name == "osmium" else None
+            ),
+        ):
+            before = _dependency_cache_key()
+            package_init.write_text("__version__ = '3.7.0'")
+            after = _dependency_cache_key()
+
+        assert before != after
+
 
 class TestVerifySystemDependencies:
     """Tests for convenience function."""
@@ -244,4 +297,41 @@ class TestVerifySystemDependencies:
         mock_can_run.return_value = (False, ["tippecanoe"])
         
         result = verify_system_dependencies(verbose=False)
-        assert result is False
\ No newline at end of file
+        assert result is False
+
+    @patch("tilecraft.utils.system_check.verify_system_dependencies")
+    def test_verify_system_dependencies_cached_reuses_success(
+        self, mock_verify, tmp_path, monkeypatch
+    ):
+        """Test that a successful check is reused by later calls."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        mock_verify.return_value = True
+
+        assert verify_system_dependencies_cached() is True
+        assert verify_system_dependencies_cached() is True
+        mock_verify.assert_called_once()
+
+    @patch("tilecraft.utils.system_check.verify_system_dependencies")
+    def test_verify_system_dependencies_cached_rechecks_failure(
+        self, mock_verify, tmp_path, monkeypatch
+    ):
+        """Test that failed checks are never cached."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        mock_verify.return_value = False
+
+        assert verify_system_dependencies_cached() is False
+        assert verify_system_dependencies_cached() is False
+        assert mock_verify.call_count == 2
+
+    @patch("tilecraft.utils.system_check.verify_system_dependencies")
+    def test_verify_system_dependencies_cached_skip_env(
+        self, mock_verify, tmp_path, monkeypatch
+    ):
+        """Test that TILECRAFT_SKIP_DEPCACHE forces a fresh check."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setenv("TILECRAFT_SKIP_DEPCACHE", "1")
+        mock_verify.return_value = True
+
+        assert verify_system_dependencies_cached() is True
+        assert verify_system_dependencies_cached() is True
+        assert mock_verify.call_count == 2
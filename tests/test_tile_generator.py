@@ -260,6 +260,56 @@ class TestTileGenerator:
         ):
             tile_generator._validate_and_filter_input_files(feature_files)
 
+    def test_validate_input_files_flatgeobuf(self, tile_generator, temp_dir):
+        """Test validation of FlatGeobuf input files."""
+        fiona = pytest.importorskip("fiona")
+
+        fgb_path = temp_dir / "rivers.fgb"
+        schema = {"geometry": "LineString", "properties": {"name": "str"}}
+        with fiona.open(
+            fgb_path, "w", driver="FlatGeobuf", crs="EPSG:4326", schema=schema
+        ) as dst:
+            dst.write(
+                {
+                    "geometry": {
+                        "type": "LineString",
+                        "coordinates": [[-104.5, 39.5], [-104.4, 39.6]],
+                    },
+                    "properties": {"name": "Test River"},
+                }
+            )
+
+        result = tile_generator._validate_and_filter_input_files({"rivers": fgb_path})
+        assert result == {"rivers": fgb_path}
+
+    def test_validate_input_files_geojsonseq(self, tile_generator, temp_dir):
+        """Test validation of newline-delimited GeoJSON input files."""
+        feature = {
+            "type": "Feature",
+            "properties": {"name": "Test River"},
+            "geometry": {
+                "type": "LineString",
+                "coordinates": [[-104.5, 39.5], [-104.4, 39.6]],
+            },
+        }
+        seq_path = temp_dir / "rivers.geojsonl"
+        seq_path.write_text("\n".join(json.dumps(feature) for _ in range(3)) + "\n")
+
+        result = tile_generator._validate_and_filter_input_files({"rivers": seq_path})
+        assert result == {"rivers": seq_path}
+        assert tile_generator._count_geojsonseq_features(seq_path) == 3
+
+        cmd = tile_generator._build_tippecanoe_command(
+            result, temp_dir / "output.mbtiles", 0
+        )
+        assert "--read-parallel" in cmd
+
+        # Valid JSON that is not a Feature object is reported, not raised
+        bad_path = temp_dir / "lakes.geojsonl"
+        bad_path.write_text("[1,2]\n")
+        with pytest.raises(TileGenerationError, match="Invalid GeoJSONSeq"):
+            tile_generator._validate_and_filter_input_files({"lakes": bad_path})
+
     def test_generate_cache_key(self, tile_generator, sample_geojson_files):
         """Test cache key generation."""
         cache_key = tile_generator._generate_cache_key(sample_geojson_files)